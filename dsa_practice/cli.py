@@ -203,13 +203,160 @@ timeout = 1.0
 
 
 @main.command()
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for running test cases (0 = one per CPU)",
+)
+@click.option(
+    "--isolate",
+    is_flag=True,
+    help="Run each test case in a child process with hard CPU/memory limits",
+)
+@click.option(
+    "--track-memory",
+    is_flag=True,
+    help="Report each test's peak memory from an extra traced run",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "ndjson"]),
+    default="text",
+    show_default=True,
+    help="Output format; ndjson streams one JSON event per line",
+)
+@click.option("--no-cache", is_flag=True, help="Re-run tests even if cached results exist")
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    help="Invalidate cached test results and compiled test files first",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Decode test cases on demand and drop inputs once run (bounded memory)",
+)
+@click.option(
+    "--minimize",
+    is_flag=True,
+    help="Shrink failing test cases and add the minimal cases to the test file",
+)
+@click.option(
+    "--count-ops",
+    is_flag=True,
+    help="Estimate complexity from counted operations instead of run times",
+)
+@click.option(
+    "--count-instructions",
+    is_flag=True,
+    help="Also report the bytecode instructions the solutions execute (slow)",
+)
+@click.option("--fail-fast", is_flag=True, help="Stop at the first failing test")
+@click.option("--max-failures", type=int, help="Stop the run after N failing tests")
+@click.option("--time-budget", type=float, help="Stop the run after this many seconds")
 @click.argument("solution_name")
-def run(solution_name: str):
+def run(
+    solution_name: str,
+    jobs: int,
+    isolate: bool,
+    track_memory: bool,
+    output_format: str,
+    no_cache: bool,
+    clear_cache: bool,
+    stream: bool,
+    minimize: bool,
+    count_ops: bool,
+    count_instructions: bool,
+    fail_fast: bool,
+    max_failures: Optional[int],
+    time_budget: Optional[float],
+):
     """Run a solution with full analytics.
 
     Examples:
         dsa run 0001.two-sum
         dsa run 0002.add-two-numbers
+        dsa run --jobs 8 0336.palindrome_pairs
+        dsa run --isolate 0042.trapping_rain
+        dsa run --format ndjson 0001.two_sum > events.ndjson
+        dsa run --no-cache 0001.two_sum
+        dsa run --stream 0560.subarray_sum_k
+        dsa run --minimize 0042.trapping_rain
+        dsa run --count-ops 0001.two_sum
+        dsa run --count-instructions 0001.two_sum
+        dsa run --fail-fast --time-budget 60 0336.palindrome_pairs
+    """
+    solution_path = find_solution_file(solution_name)
+    if not solution_path:
+        console.print(f"❌ Solution not found: {solution_name}")
+        return
+
+    rel_path = solution_path.relative_to(project_root)
+    # Keep stdout clean for the event stream
+    status_console = Console(stderr=True) if output_format == "ndjson" else console
+    status_console.print(f"🚀 Running solution: {rel_path}")
+    try:
+        command = [sys.executable, str(solution_path), "--jobs", str(jobs)]
+        command += ["--format", output_format]
+        if isolate:
+            command.append("--isolate")
+        if track_memory:
+            command.append("--track-memory")
+        if no_cache:
+            command.append("--no-cache")
+        if clear_cache:
+            command.append("--clear-cache")
+        if stream:
+            command.append("--stream")
+        if minimize:
+            command.append("--minimize")
+        if count_ops:
+            command.append("--count-ops")
+        if count_instructions:
+            command.append("--count-instructions")
+        if fail_fast:
+            command.append("--fail-fast")
+        if max_failures is not None:
+            command += ["--max-failures", str(max_failures)]
+        if time_budget is not None:
+            command += ["--time-budget", str(time_budget)]
+        subprocess.run(command, cwd=project_root, check=True)
+    except subprocess.CalledProcessError as e:
+        console.print(f"❌ Solution failed with exit code {e.returncode}")
+    except FileNotFoundError:
+        console.print("❌ Python interpreter not found")
+
+
+@main.command()
+@click.option(
+    "--reference",
+    default="solve",
+    show_default=True,
+    help="Trusted solution method whose outputs are recorded",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Worker processes (0 = one per CPU)",
+)
+@click.argument("solution_name")
+def golden(solution_name: str, reference: str, jobs: int):
+    """Fill in missing expected outputs from a trusted implementation.
+
+    Runs the reference method over every test case without an expected
+    value and writes the outputs (digests for huge ones) back to the
+    problem's TOML file.
+
+    Examples:
+        dsa golden 0015.3sum
+        dsa golden --reference solve_optimized --jobs 8 0560.subarray_sum_k
     """
     solution_path = find_solution_file(solution_name)
     if not solution_path:
@@ -217,9 +364,11 @@ def run(solution_name: str):
         return
 
     rel_path = solution_path.relative_to(project_root)
-    console.print(f"🚀 Running solution: {rel_path}")
+    console.print(f"🥇 Generating expected outputs for: {rel_path}")
     try:
-        subprocess.run([sys.executable, str(solution_path)], cwd=project_root, check=True)
+        command = [sys.executable, str(solution_path), "--golden"]
+        command += ["--reference", reference, "--jobs", str(jobs)]
+        subprocess.run(command, cwd=project_root, check=True)
     except subprocess.CalledProcessError as e:
         console.print(f"❌ Solution failed with exit code {e.returncode}")
     except FileNotFoundError:
@@ -378,6 +527,7 @@ def clean():
         ".pytest_cache",
         "__pycache__",
         ".coverage",
+        ".dsa_cache",
     ]
 
     cleaned_count = 0
@@ -0,0 +1,41 @@
+"""
+Small solutions shared by the unit tests
+"""
+
+import os
+import sys
+import time
+
+
+class AddSolution:
+    """Minimal solution used to exercise the runner"""
+
+    def solve(self, a, b):
+        return a + b
+
+
+class ExitingSolution:
+    """Calls sys.exit(1) when given -1 and kills its process when given -2"""
+
+    def solve(self, n):
+        if n == -1:
+            sys.exit(1)
+        if n == -2:
+            os._exit(2)
+        return n
+
+
+class LoopSolution:
+    """Solution that never returns"""
+
+    def solve(self, n):
+        while True:
+            n += 1
+
+
+class SlowSolution:
+    """Solution whose runtime is its input in seconds"""
+
+    def solve(self, seconds):
+        time.sleep(seconds)
+        return seconds
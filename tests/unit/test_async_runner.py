@@ -0,0 +1,102 @@
+"""
+Unit tests for the AsyncTestRunner
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution, ExitingSolution, LoopSolution, SlowSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestAsyncRunner:
+    """Test cases for the asyncio runner"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("isolate", [False, True])
+    def test_run_all_keeps_order(self, isolate):
+        """Test that async results match the synchronous verdicts"""
+        import asyncio
+
+        from utils.testing.async_runner import AsyncTestRunner
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(5)]
+        test_cases[2].expected = -1
+        runner = AsyncTestRunner(TestRunner(isolate=isolate), concurrency=2)
+        results = asyncio.run(runner.run_all(AddSolution(), test_cases))
+        assert [r.verdict for r in results] == ["AC", "AC", "WA", "AC", "AC"]
+        assert results[4].test_case is test_cases[4]
+
+    @pytest.mark.unit
+    def test_lost_workers_are_reported(self):
+        """Test that dying and hung pool workers give RE and TLE instead of a hang"""
+        import asyncio
+
+        from utils.testing.async_runner import AsyncTestRunner
+
+        test_cases = [TestCase(input=(n,), expected=n, timeout=5.0) for n in (0, -1, -2, 3)]
+        runner = AsyncTestRunner(TestRunner(), concurrency=2)
+        results = asyncio.run(runner.run_all(ExitingSolution(), test_cases))
+        assert [r.verdict for r in results] == ["AC", "RE", "RE", "AC"]
+        assert results[2].error_message == "Worker process died (exit code 2)"
+        assert results[2].test_case is test_cases[2]
+
+        test_case = TestCase(input=(1,), expected=0, timeout=0.2)
+        results = asyncio.run(runner.run_all(LoopSolution(), [test_case]))
+        assert results[0].verdict == "TLE"
+
+    @pytest.mark.unit
+    def test_test_cases_are_taken_lazily(self):
+        """Test that only the tests in flight are pulled from the iterable"""
+        import asyncio
+
+        from utils.testing.async_runner import AsyncTestRunner
+
+        pulled = []
+
+        def test_cases():
+            for i in range(6):
+                pulled.append(i)
+                yield TestCase(input=(i, i), expected=2 * i)
+
+        async def first_result():
+            generator = AsyncTestRunner(TestRunner(), concurrency=2).run(
+                AddSolution(), test_cases()
+            )
+            try:
+                return await generator.__anext__()
+            finally:
+                await generator.aclose()
+
+        index, result = asyncio.run(first_result())
+        assert result.passed and index in (0, 1)
+        assert len(pulled) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("isolate", [False, True])
+    def test_cancellation_stops_in_flight_tests(self, isolate):
+        """Test that cancelling the consumer does not wait for slow tests"""
+        import asyncio
+        import time
+
+        from utils.testing.async_runner import AsyncTestRunner
+
+        test_cases = [TestCase(input=(5,), expected=5, timeout=10) for _ in range(4)]
+        runner = AsyncTestRunner(TestRunner(isolate=isolate), concurrency=2)
+
+        async def consume():
+            task = asyncio.ensure_future(runner.run_all(SlowSolution(), test_cases))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.time()
+        asyncio.run(consume())
+        assert time.time() - start < 3
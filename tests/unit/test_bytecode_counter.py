@@ -0,0 +1,63 @@
+"""
+Unit tests for bytecode instruction counts
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import TestCase
+from utils.benchmarking.bytecode_counter import (
+    InstructionLimitExceeded,
+    count_instructions,
+    source_files,
+)
+from utils.benchmarking.performance_analyzer import PerformanceAnalyzer
+
+
+class AddSolution:
+    """Minimal solution whose instructions are counted"""
+
+    def solve(self, a, b):
+        return a + b
+
+
+class TestBytecodeCounter:
+    """Test cases for bytecode instruction counts"""
+
+    @pytest.mark.unit
+    def test_counts_are_repeatable_and_restricted_to_the_solution(self):
+        """Test exact counts of the solution's own code, and the analyzer report"""
+
+        def by_length(words):
+            return sorted(words, key=lambda word: len(word))
+
+        words = ["ccc", "a", "bb"] * 10
+        files = source_files(AddSolution())
+        assert files == {__file__} or files == {os.path.abspath(__file__)}
+        counts = [count_instructions(by_length, (words,)) for _ in range(2)]
+        assert counts[0] == counts[1] > len(words)  # The key lambda runs per word
+        assert count_instructions(json.dumps, (words,), files) == 0  # Not this file's code
+        with pytest.raises(InstructionLimitExceeded):
+            count_instructions(by_length, (words,), max_instructions=10)
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(3)]
+        totals = PerformanceAnalyzer().analyze_instructions(AddSolution(), test_cases)
+        assert totals == {"solve": 3 * count_instructions(AddSolution().solve, (1, 1))}
+
+    @pytest.mark.unit
+    def test_analysis_counts_instructions_only_when_asked(self, capsys):
+        """Test that instruction counting is opt-in"""
+        analyzer = PerformanceAnalyzer()
+        analyzer.test_sizes = [10, 20]
+        test_cases = [TestCase(input=(1, 1), expected=2)]
+        assert analyzer.analyze(AddSolution(), test_cases)["instructions"] is None
+
+        analyzer.count_bytecode = True
+        instructions = analyzer.analyze(AddSolution(), test_cases)["instructions"]
+        assert instructions == {"solve": count_instructions(AddSolution().solve, (1, 1))}
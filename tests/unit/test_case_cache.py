@@ -0,0 +1,158 @@
+"""
+Unit tests for the CaseCache and TestCaseStream
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestCaseCache:
+    """Test cases for the compiled test-case cache"""
+
+    @pytest.mark.unit
+    def test_parse_only_when_source_changes(self, tmp_path):
+        """Test that unchanged files are served from the compiled cache"""
+        from utils.testing.case_cache import CaseCache
+
+        source = tmp_path / "cases.toml"
+        source.write_text("v1")
+        parsed = []
+
+        def parse(path):
+            text = open(path).read()
+            parsed.append(text)
+            return {"problem": {"name": text}}, [TestCase(input=([1] * 1000,), expected=text)]
+
+        cache = CaseCache(str(tmp_path / "cache"))
+        assert cache.load(str(source), parse)[1][0].expected == "v1"
+        sections, test_cases = cache.load(str(source), parse)
+        assert sections == {"problem": {"name": "v1"}}
+        assert test_cases[0].input == ([1] * 1000,)
+        assert parsed == ["v1"]
+
+        # Touching the file without changing it keeps the compiled copy
+        os.utime(source, ns=(0, 0))
+        assert cache.load(str(source), parse)[1][0].expected == "v1"
+        assert parsed == ["v1"]
+
+        source.write_text("v2!")
+        assert cache.load(str(source), parse)[1][0].expected == "v2!"
+        assert parsed == ["v1", "v2!"]
+
+    @pytest.mark.unit
+    def test_stream_keeps_its_mapping_across_rebuilds(self, tmp_path, monkeypatch):
+        """Test that a stream maps its file once and survives a cache rebuild"""
+        import builtins
+
+        from utils.testing.case_cache import CaseCache
+
+        source = tmp_path / "cases.toml"
+        source.write_text("3")
+
+        def parse(path):
+            count = int(open(path).read())
+            return {}, [TestCase(input=([i] * (i + 1),), expected=i) for i in range(count)]
+
+        cache = CaseCache(str(tmp_path / "cache"))
+        _, stream = cache.open(str(source), parse)
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        assert [stream[i].expected for i in (2, 0, 1)] == [2, 0, 1]
+        assert [tc.expected for tc in stream] == [0, 1, 2]
+        assert opened == [stream.cache_path]
+        monkeypatch.undo()
+
+        source.write_text("5")
+        _, rebuilt = cache.open(str(source), parse)
+        assert rebuilt.cache_path == stream.cache_path and len(rebuilt) == 5
+        assert [stream[i].input for i in (1, 2)] == [([1, 1],), ([2, 2, 2],)]
+        stream.close()
+        rebuilt.close()
+
+    @pytest.mark.unit
+    def test_stale_stream_must_be_reopened(self, tmp_path):
+        """Test that a stream first read after its file was rebuilt refuses to decode"""
+        from utils.testing.case_cache import CaseCache
+
+        source = tmp_path / "cases.toml"
+        source.write_text("3")
+
+        def parse(path):
+            count = int(open(path).read())
+            return {}, [TestCase(input=(i,), expected=i) for i in range(count)]
+
+        cache = CaseCache(str(tmp_path / "cache"))
+        _, stale = cache.open(str(source), parse)
+        source.write_text("40")
+        _, rebuilt = cache.open(str(source), parse)
+        with pytest.raises(ValueError, match="reopen the test cases"):
+            stale[0]
+        assert len(stale) == 3
+        assert rebuilt[39].expected == 39
+        rebuilt.close()
+
+        # Records of the same size, so only the source's identity tells them apart
+        def parse_word(path):
+            word = open(path).read()
+            return {}, [TestCase(input=(word,), expected=word)]
+
+        words = tmp_path / "words.toml"
+        words.write_text("ab")
+        _, stale = cache.open(str(words), parse_word)
+        words.write_text("xy")
+        _, rebuilt = cache.open(str(words), parse_word)
+        with pytest.raises(ValueError, match="reopen the test cases"):
+            stale[0]
+        assert rebuilt[0].expected == "xy"
+        rebuilt.close()
+
+        # Touching the source only rewrites the header; the records are the same
+        _, touched = cache.open(str(source), parse)
+        os.utime(source, ns=(0, 0))
+        cache.open(str(source), parse)
+        assert touched[39].expected == 39
+        touched.close()
+
+
+class TestCaseStreaming:
+    """Test cases for lazily decoded test cases"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_stream_runs_without_retaining_inputs(self, tmp_path, workers):
+        """Test that a TestCaseStream runs like a list and releases inputs"""
+        from utils.testing.case_cache import CaseCache, TestCaseStream
+
+        source = tmp_path / "cases.toml"
+        source.write_text("cases")
+
+        def parse(path):
+            return {}, [
+                TestCase(input=(i, i), expected=2 * i, description=f"Case {i}") for i in range(5)
+            ]
+
+        _, stream = CaseCache(str(tmp_path / "cache")).open(str(source), parse)
+        assert isinstance(stream, TestCaseStream)
+        assert len(stream) == 5
+        assert stream[-1].description == "Case 4"
+
+        runner = TestRunner(workers=workers, retain_inputs=False)
+        results = runner.run_tests(AddSolution(), stream)
+        assert [r.verdict for r in results] == ["AC"] * 5
+        assert [r.test_case.description for r in results] == [f"Case {i}" for i in range(5)]
+        assert all(r.test_case.input is None for r in results)
@@ -0,0 +1,151 @@
+"""
+Unit tests for output comparators and digests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import BaseSolution, TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestComparators:
+    """Test cases for output comparators"""
+
+    @pytest.mark.unit
+    def test_comparator_modes(self):
+        """Test order-insensitive and tolerant comparisons"""
+        from utils.testing.comparators import outputs_match
+
+        assert outputs_match(None, [1, 2], [1, 2])
+        assert not outputs_match("exact", [2, 1], [1, 2])
+        assert outputs_match("unordered", [[1, 0], [0, 1]], [[0, 1], [1, 0]])
+        assert not outputs_match("unordered", [[1, 0], [1, 0]], [[0, 1], [1, 0]])
+        triplets = [[-1, 0, 1], [-1, -1, 2]]
+        assert outputs_match("unordered_nested", [[2, -1, -1], [1, 0, -1]], triplets)
+        assert not outputs_match("unordered_nested", [[-1, 2, 2]], [[-1, -1, 2]])
+        assert outputs_match({"mode": "float", "tolerance": 1e-6}, [0.1 + 0.2], [0.3])
+        assert not outputs_match({"mode": "float", "tolerance": 1e-6}, [0.31], [0.3])
+        with pytest.raises(ValueError):
+            outputs_match("sorted", [1], [1])
+
+    @pytest.mark.unit
+    def test_expected_digest(self):
+        """Test digest-based expected outputs and their mismatch summary"""
+        from utils.testing.comparators import ExpectedDigest, output_digest
+
+        pairs = [[i, i + 1] for i in range(10000)]
+        expected = ExpectedDigest(output_digest(pairs, "unordered"), len(pairs))
+        test_cases = [
+            TestCase(input=(pairs,), expected=expected, comparator="unordered"),
+            TestCase(input=(pairs[:-1],), expected=expected, comparator="unordered"),
+        ]
+
+        class Reverse:
+            def solve(self, items):
+                return items[::-1]
+
+        results = TestRunner().run_tests(Reverse(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "WA"]
+        assert "Output length 9999 != expected length 10000" in results[1].error_message
+        assert len(results[1].error_message) < 400
+
+    @pytest.mark.unit
+    def test_digests_ignore_order_and_numpy_types(self):
+        """Test order-independent unordered digests and NumPy values"""
+        import numpy as np
+
+        from utils.testing.comparators import output_digest, validate_comparator
+
+        triplets = [[-1, 0, 1], [-1, -1, 2], ["a", None, 0.5]]
+        shuffled = [[2, -1, -1], [0.5, "a", None], [1, 0, -1]]
+        assert output_digest(triplets, "unordered_nested") == output_digest(
+            shuffled, "unordered_nested"
+        )
+        assert output_digest(triplets, "unordered") != output_digest(shuffled, "unordered")
+        assert output_digest([[1, 2], [1, 2]], "unordered") != output_digest([[1, 2]], "unordered")
+        assert output_digest(np.int64(7)) == output_digest(7)
+        assert output_digest([np.int32(2), 1], "unordered") == output_digest([1, 2], "unordered")
+        assert output_digest(np.array([3, 1]), "unordered") == output_digest([1, 3], "unordered")
+
+        validate_comparator("unordered", digest=True)
+        validate_comparator("float")
+        with pytest.raises(ValueError):
+            validate_comparator("float", digest=True)
+        with pytest.raises(ValueError):
+            validate_comparator("sorted")
+
+    @pytest.mark.unit
+    def test_numpy_arrays_digest_like_lists(self):
+        """Test that arrays digest like the equivalent lists in every mode"""
+        import numpy as np
+
+        from utils.testing.comparators import DIGEST_CHUNK, ExpectedDigest, output_digest
+
+        column = np.arange(2 * DIGEST_CHUNK + 5).reshape(-1, 1)
+        assert output_digest(column) == output_digest(column.tolist())
+        assert output_digest(np.array([0.5, 1.5])) == output_digest((0.5, 1.5))
+        assert output_digest(np.array([1, 2])) != output_digest([2, 1])
+        assert output_digest(np.array([[2, 1], [4, 3]]), "unordered_nested") == output_digest(
+            [[3, 4], [1, 2]], "unordered_nested"
+        )
+
+        expected = ExpectedDigest(output_digest([[1, 2], [3, 4]], "unordered"), 2)
+        assert expected.matches(np.array([[3, 4], [1, 2]]), "unordered")
+        assert not expected.matches(np.array([[1, 2]]), "unordered")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "sorted",
+            "Exact",
+            3,
+            {"mode": None},
+            {"mode": "fuzzy"},
+            {"mode": "float", "tolerance": "x"},
+        ],
+    )
+    def test_invalid_comparator_specs_are_rejected(self, spec):
+        """Test that unknown modes and bad tolerances raise ValueError up front"""
+        from utils.testing.comparators import validate_comparator
+
+        with pytest.raises(ValueError):
+            validate_comparator(spec)
+
+    @pytest.mark.unit
+    def test_invalid_comparator_in_test_file(self, tmp_path, capsys):
+        """Test that a test file declaring an unknown comparator is not run"""
+        test_file = tmp_path / "cases.toml"
+        test_file.write_text(
+            '[problem]\ncomparator = "sorted"\n\n[[test_cases]]\ninput = [1]\nexpected = 1\n'
+        )
+
+        class Solution(BaseSolution):
+            def solve(self, nums):
+                return nums[0]
+
+        solution = Solution()
+        solution.case_cache = None
+        assert solution.load_test_cases(str(test_file)) == solution._get_default_test_cases()
+        assert "Unknown comparator: 'sorted'" in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_runner_uses_test_case_comparator(self):
+        """Test that a declared comparator decides the verdict"""
+        test_cases = [
+            TestCase(input=([3, 1, 2],), expected=[1, 2, 3], comparator="unordered"),
+            TestCase(input=([3, 1, 2],), expected=[1, 2, 3]),
+        ]
+
+        class Identity:
+            def solve(self, nums):
+                return nums
+
+        results = TestRunner().run_tests(Identity(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "WA"]
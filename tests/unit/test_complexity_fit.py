@@ -0,0 +1,39 @@
+"""
+Unit tests for least-squares complexity fitting
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.benchmarking.complexity_fit import fit_complexity
+
+
+class TestComplexityFit:
+    """Test cases for least-squares complexity fitting"""
+
+    @pytest.mark.unit
+    def test_models_are_recovered_from_noisy_timings(self):
+        """Test that the generating model wins and extrapolates"""
+        rng = np.random.default_rng(7)
+        sizes = [n for n in (1000, 3000, 10000, 30000, 100000) for _ in range(5)]
+        growths = {
+            "O(1)": lambda n: 1,
+            "O(n)": lambda n: n,
+            "O(n log n)": lambda n: n * math.log2(n),
+            "O(n²)": lambda n: n * n,
+        }
+        for model, growth in growths.items():
+            times = [1e-5 + 2e-8 * growth(n) * (1 + 0.03 * rng.standard_normal()) for n in sizes]
+            fit = fit_complexity(sizes, times)
+            assert fit.best.model == model
+            assert fit.predict(10**6) == pytest.approx(1e-5 + 2e-8 * growth(10**6), rel=0.2)
+
+        with pytest.raises(ValueError):
+            fit_complexity([10, 10, 20], [1.0, 1.1, 2.0])
@@ -0,0 +1,79 @@
+"""
+Unit tests for streamed run events
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution, ExitingSolution, SlowSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestEvents:
+    """Test cases for streamed run events"""
+
+    @pytest.mark.unit
+    def test_iter_events(self):
+        """Test the event sequence of a serial run"""
+        test_cases = [TestCase(input=(1, 2), expected=3), TestCase(input=(1, 2), expected=4)]
+        runner = TestRunner()
+        events = runner.iter_events(AddSolution(), test_cases)
+        kinds = [(e["event"], e.get("index")) for e in events]
+        assert kinds == [
+            ("run_start", None),
+            ("test_start", 0),
+            ("test_finish", 0),
+            ("test_start", 1),
+            ("test_finish", 1),
+            ("run_finish", None),
+        ]
+        assert [r.verdict for r in runner.results] == ["AC", "WA"]
+
+    @pytest.mark.unit
+    def test_ndjson_output(self):
+        """Test that ndjson mode writes one JSON object per line"""
+        import io
+        import json
+
+        stream = io.StringIO()
+        runner = TestRunner(output="ndjson", event_stream=stream, workers=2)
+        runner.run_tests(AddSolution(), [TestCase(input=(i, 0), expected=i) for i in range(4)])
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        finishes = [e for e in lines if e["event"] == "test_finish"]
+        assert sorted(e["index"] for e in finishes) == [0, 1, 2, 3]
+        assert lines[-1]["event"] == "run_finish" and lines[-1]["passed"] == 4
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("isolate", [False, True])
+    def test_parallel_tests_start_when_a_worker_picks_them_up(self, isolate):
+        """Test that queued tests are not reported as started up front"""
+        test_cases = [TestCase(input=(0.3,), expected=0.3, timeout=5.0) for _ in range(4)]
+        runner = TestRunner(workers=2, isolate=isolate)
+        events = list(runner.iter_events(SlowSolution(), test_cases))
+        runner.close()
+        started = {
+            e["index"]: e["time"] - events[0]["time"] for e in events if e["event"] == "test_start"
+        }
+        # Two workers: the last two tests wait for the first two to finish
+        assert sorted(started.values())[2] > 0.25
+        kinds = [(e["event"], e.get("index")) for e in events]
+        for index in range(4):
+            assert kinds.index(("test_start", index)) < kinds.index(("test_finish", index))
+
+    @pytest.mark.unit
+    def test_lost_tests_start_before_they_finish(self):
+        """Test that a test whose worker died still gets its start event first"""
+        test_cases = [TestCase(input=(n,), expected=n, timeout=5.0) for n in (0, -2, 3)]
+        kinds = [
+            (e["event"], e.get("index"))
+            for e in TestRunner(workers=2).iter_events(ExitingSolution(), test_cases)
+        ]
+        for index in range(3):
+            assert kinds.count(("test_start", index)) == 1
+            assert kinds.index(("test_start", index)) < kinds.index(("test_finish", index))
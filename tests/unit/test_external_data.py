@@ -0,0 +1,80 @@
+"""
+Unit tests for externally stored inputs
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import BaseSolution, TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestExternalData:
+    """Test cases for externally stored inputs"""
+
+    @pytest.mark.unit
+    def test_external_refs_are_loaded_lazily(self, tmp_path):
+        """Test .npy, raw and text payloads referenced from a TOML file"""
+        import numpy as np
+
+        from utils.testing.external_data import ExternalRef
+
+        np.save(tmp_path / "nums.npy", np.arange(1000, dtype=np.int64))
+        np.arange(10, dtype="<i4").tofile(tmp_path / "nums.bin")
+        (tmp_path / "word.txt").write_text("palindrome")
+        (tmp_path / "cases.toml").write_text(
+            "[[test_cases]]\n"
+            'nums = { file = "nums.npy" }\n'
+            "offset = 1\n"
+            "expected = 499501\n"
+            "[[test_cases]]\n"
+            'input = { file = "nums.bin", dtype = "int32" }\n'
+            "expected = 45\n"
+            "[[test_cases]]\n"
+            'input = { file = "word.txt", format = "text" }\n'
+            'expected = "palindrome"\n'
+        )
+
+        class Solution(BaseSolution):
+            def solve(self, value, offset=0):
+                if isinstance(value, str):
+                    return value
+                return int(sum(value)) + offset
+
+        solution = Solution()
+        solution.case_cache = None
+        test_cases = solution.load_test_cases(str(tmp_path / "cases.toml"))
+        assert isinstance(test_cases[0].input[0], ExternalRef)
+
+        results = TestRunner().run_tests(solution, test_cases)
+        assert [r.verdict for r in results] == ["AC", "AC", "AC"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("guard_inputs", [True, False])
+    def test_missing_external_input_is_a_runtime_error(self, tmp_path, guard_inputs):
+        """Test that an input that cannot be loaded fails only its own test"""
+        import numpy as np
+
+        from utils.testing.external_data import parse_external_ref
+
+        np.save(tmp_path / "nums.npy", np.arange(4))
+        test_cases = [
+            TestCase(input=(parse_external_ref({"file": name}, str(tmp_path)), 1), expected=7)
+            for name in ("missing.npy", "nums.npy")
+        ]
+
+        class SumPlus:
+            def solve(self, nums, offset):
+                return int(sum(nums)) + offset
+
+        runner = TestRunner(guard_inputs=guard_inputs)
+        first = runner.run_single_test(SumPlus(), test_cases[0])
+        assert first.verdict == "RE" and first.execution_time == 0
+        results = runner.run_tests(SumPlus(), test_cases)
+        assert [r.verdict for r in results] == ["RE", "AC"]
+        assert results[0].execution_time == 0
@@ -0,0 +1,51 @@
+"""
+Unit tests for golden-output generation
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import BaseSolution
+
+
+class PairSolution(BaseSolution):
+    """Returns index pairs, so large outputs exercise digests"""
+
+    def solve(self, n):
+        return [[i, i + 1] for i in range(n)]
+
+
+class TestGolden:
+    """Test cases for golden-output generation"""
+
+    @pytest.mark.unit
+    def test_missing_expected_outputs_are_filled_in(self, tmp_path):
+        """Test that outputs are written back in place, as digests when huge"""
+        from utils.testing.golden import GoldenGenerator
+
+        test_file = tmp_path / "cases.toml"
+        test_file.write_text(
+            '[problem]\ncomparator = "unordered"\n\n'
+            '[[test_cases]]\ndescription = "Small"\ninput = 2\n# keep\n\n'
+            "[[test_cases]]\ninput = 1\nexpected = [[0, 1]]\n\n"
+            "[[test_cases]]\nn = 20000\n"
+        )
+        solution = PairSolution()
+        solution.case_cache = None
+        solution.test_cases = solution.load_test_cases(str(test_file))
+        assert GoldenGenerator().missing(solution.test_cases) == [0, 2]
+
+        outputs = solution.generate_golden(workers=2)
+        assert [output.index for output in outputs] == [0, 2]
+        assert "expected = [[0, 1], [1, 2]]\n# keep\n" in test_file.read_text()
+
+        solution.test_cases = solution.load_test_cases(str(test_file))
+        assert solution.test_cases[0].expected == [[0, 1], [1, 2]]
+        assert solution.test_cases[2].expected.length == 20000
+        results = solution.test_runner.run_tests(solution, solution.test_cases)
+        assert all(result.passed for result in results)
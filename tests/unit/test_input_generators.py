@@ -0,0 +1,50 @@
+"""
+Unit tests for the InputGenerator
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+
+class TestInputGenerators:
+    """Test cases for declarative input generators"""
+
+    @pytest.mark.unit
+    def test_generated_inputs_are_seeded_and_consistent(self):
+        """Test that generators are reproducible and honour their spec"""
+        from utils.benchmarking.input_generators import InputGenerator
+
+        nums_spec = {"name": "nums", "kind": "int_array", "low": 0, "high": 50}
+        nums_spec.update(duplicates=0.5, sorted=True)
+        words_spec = {"name": "words", "kind": "word_list", "count": 20}
+        words_spec.update(word_length=[2, 4], alphabet="xy")
+        generator = InputGenerator(
+            {
+                "seed": 7,
+                "args": [
+                    nums_spec,
+                    {"name": "target", "kind": "pair_sum", "of": "nums"},
+                    words_spec,
+                ],
+            }
+        )
+        nums, target, words = generator.generate(1000)
+        assert generator.generate(1000) == (nums, target, words)
+        assert len(nums) == 1000 and nums == sorted(nums)
+        assert all(0 <= n <= 50 for n in nums)
+        assert any(target == a + b for i, a in enumerate(nums) for b in nums[i + 1 :])
+        assert len(words) == 20
+        assert all(2 <= len(w) <= 4 and set(w) <= {"x", "y"} for w in words)
+
+    @pytest.mark.unit
+    def test_unknown_kind_is_rejected(self):
+        """Test that a typo in the spec fails loudly"""
+        from utils.benchmarking.input_generators import InputGenerator
+
+        with pytest.raises(ValueError):
+            InputGenerator({"args": [{"name": "n", "kind": "integer"}]})
@@ -0,0 +1,71 @@
+"""
+Unit tests for input copying and mutation detection
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class SortingSolution:
+    """Sorts its input in place, like ThreeSum.solve"""
+
+    def solve(self, nums, k):
+        nums.sort()
+        return nums[:k]
+
+
+class TestInputGuard:
+    """Test cases for per-run input copies"""
+
+    @pytest.mark.unit
+    def test_runs_get_fresh_copies_and_mutation_is_flagged(self):
+        """Test that test inputs survive solve() and mutation is reported"""
+        nums = [3, 1, 2]
+        test_cases = [TestCase(input=(nums, 2), expected=[1, 2])]
+        runner = TestRunner()
+        for _ in range(2):
+            (result,) = runner.run_tests(SortingSolution(), test_cases)
+            assert result.passed and result.input_mutated
+        assert nums == [3, 1, 2]
+
+        (result,) = TestRunner().run_tests(AddSolution(), [TestCase(input=(1, 2), expected=3)])
+        assert not result.input_mutated
+
+    @pytest.mark.unit
+    def test_copies_share_nothing_mutable(self):
+        """Test copying of nested lists and NumPy arrays"""
+        import numpy as np
+
+        from utils.testing.input_guard import fresh_arguments, mutated_arguments
+
+        original = ([[1, 2], [3]], np.arange(3), "text", 7)
+        args = fresh_arguments(original)
+        args[0][0].append(9)
+        args[1][0] = 5
+        assert original[0] == [[1, 2], [3]] and original[1][0] == 0
+        assert args[2] is original[2]
+        assert mutated_arguments(original, args) == [0, 1]
+
+    @pytest.mark.unit
+    def test_memory_maps_are_not_copied(self, tmp_path):
+        """Test that copy-on-write maps of external inputs stay on disk"""
+        import numpy as np
+
+        from utils.testing.input_guard import fresh_arguments, mutated_arguments
+
+        np.save(tmp_path / "nums.npy", np.arange(1000))
+        mapped = np.load(tmp_path / "nums.npy", mmap_mode="c")
+        args = fresh_arguments((mapped,))
+        assert args[0] is mapped
+        args[0][0] = 7
+        assert mutated_arguments((mapped,), args) == []
+        assert np.load(tmp_path / "nums.npy")[0] == 0
@@ -0,0 +1,66 @@
+"""
+Unit tests for the InputScaler
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import TestCase
+from utils.benchmarking.input_scaler import InputScaler
+from utils.benchmarking.performance_analyzer import PerformanceAnalyzer
+from utils.testing.signature import Signature
+
+
+class TestInputScaler:
+    """Test cases for scaling a base test case to the analysis sizes"""
+
+    @pytest.mark.unit
+    def test_arguments_are_scaled_consistently(self):
+        """Test a valid two-sum target, word substrings and bare list inputs"""
+        scaler = InputScaler(Signature({"nums": "int64[]", "target": "int"}))
+        nums, target = scaler.scale(([2, 7, 11, 15], 9), 1000)
+        assert len(nums) == len(set(nums)) == 1000 and nums == sorted(nums)
+        assert any(target - num in set(nums) - {num} for num in nums)
+        assert scaler.scale(([2, 7, 11, 15], 9), 1000) == (nums, target)
+
+        text, words = InputScaler().scale(("barfoothefoobarman", ["foo", "bar"]), 180)
+        assert len(text) == 180 and set(text) <= set("barfoothefoobarman")
+        assert len(words) == 20 and all(len(word) == 3 and word in text for word in words)
+
+        (heights,) = InputScaler(parameters=["height"]).scale([0, 1, 0, 2, 1, 3], 50)
+        assert len(heights) == 50 and set(heights) <= {0, 1, 2, 3}
+        (matrix,) = InputScaler().scale(([[1, 2], [3, 4]],), 100)
+        assert len(matrix) == 10 and all(len(row) == 10 for row in matrix)
+
+    @pytest.mark.unit
+    def test_narrow_types_fall_back_to_repeated_values(self):
+        """Test that distinct values are kept only while the type's range can hold them"""
+        scaler = InputScaler(Signature({"nums": "int8[]"}))
+        (nums,) = scaler.scale(([5, 1, 3],), 200)
+        assert len(nums) == len(set(nums)) == 200
+        assert all(-128 <= num <= 127 for num in nums)
+
+        (nums,) = scaler.scale(([5, 1, 3],), 1000)
+        assert len(nums) == 1000 and len(set(nums)) <= 256
+        assert all(-128 <= num <= 127 for num in nums)
+
+    @pytest.mark.unit
+    def test_analysis_scales_multi_argument_solutions(self):
+        """Test that the size ladder runs a two-argument solve() without a generator"""
+
+        class PairsWithSum:
+            def solve(self, nums, target):
+                return sum(nums[i] + nums[j] == target for i in range(len(nums)) for j in range(i))
+
+        analyzer = PerformanceAnalyzer()
+        analyzer.cost_metric = "operations"
+        analyzer.test_sizes = [10, 20, 40, 80]
+        test_cases = [TestCase(input=([1, 1, 2, 3, 2, 1], 3), expected=6)]
+        result = analyzer.analyze_time_complexity(PairsWithSum(), test_cases)
+        assert result.startswith("O(n²)")
+        assert analyzer.complexity_fit.samples == 4
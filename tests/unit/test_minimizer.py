@@ -0,0 +1,106 @@
+"""
+Unit tests for the FailureMinimizer
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import BaseSolution, TestCase
+
+
+class BuggySum:
+    """Crashes when 13 and 42 meet, and miscounts negative numbers"""
+
+    def solve(self, nums):
+        if 13 in nums and 42 in nums:
+            raise RuntimeError("unlucky")
+        return sum(abs(n) for n in nums)
+
+    def solve_optimized(self, nums):
+        return sum(nums)
+
+
+class TestMinimizer:
+    """Test cases for failing-input minimization"""
+
+    @pytest.mark.unit
+    def test_failures_shrink_to_minimal_cases(self):
+        """Test that crashes and wrong answers shrink while reproducing"""
+        from utils.testing.minimizer import FailureMinimizer
+
+        nums = list(range(100, 0, -1))
+        crash = TestCase(input=(nums,), expected=sum(nums))
+        minimizer = FailureMinimizer(reference="solve_optimized", workers=2)
+        result = minimizer.minimize(BuggySum(), crash)
+        assert result.verdict == "RE"
+        assert sorted(result.test_case.input[0]) == [13, 42]
+        assert result.test_case.expected == 55
+        assert (result.original_size, result.size) == (100, 2)
+
+        wrong = TestCase(input=([5] * 50 + [-3] + [5] * 50,), expected=497)
+        result = minimizer.minimize(BuggySum(), wrong)
+        assert result.verdict == "WA"
+        assert result.test_case.input == ([-3],)
+        assert result.test_case.expected == -3
+
+        assert minimizer.minimize(BuggySum(), TestCase(input=([1, 2],), expected=3)) is None
+        with pytest.raises(ValueError):
+            FailureMinimizer(workers=1).minimize(BuggySum(), wrong)
+
+    @pytest.mark.unit
+    def test_minimal_case_is_written_back(self, tmp_path):
+        """Test that minimized cases are appended to the test file and reload"""
+        from utils.testing.case_writer import append_test_case
+
+        test_file = tmp_path / "cases.toml"
+        test_file.write_text("# Existing suite\n[[test_cases]]\ninput = [1]\nexpected = 1\n")
+        append_test_case(
+            str(test_file),
+            {"description": 'Say "hi"', "s": "a\nb", "words": ["a", "b"], "expected": None},
+            comment="Minimized",
+        )
+        append_test_case(str(test_file), {"input": [1.5, -2.0], "expected": True})
+
+        import toml
+
+        data = toml.loads(test_file.read_text())
+        assert test_file.read_text().startswith("# Existing suite\n")
+        written = {"description": 'Say "hi"', "s": "a\nb", "words": ["a", "b"]}
+        assert data["test_cases"][1] == written
+        assert data["test_cases"][2] == {"input": [1.5, -2.0], "expected": True}
+
+    @pytest.mark.unit
+    def test_minimizing_twice_leaves_the_file_unchanged(self, tmp_path):
+        """Test that repeated, unshrunk and previously added cases are skipped"""
+
+        class Solution(BaseSolution, BuggySum):
+            solve = BuggySum.solve
+            solve_optimized = BuggySum.solve_optimized
+
+        test_file = tmp_path / "cases.toml"
+        test_file.write_text(
+            "[[test_cases]]\ninput = [100, 90, 42, 80, 13, 70]\nexpected = 395\n\n"
+            "[[test_cases]]\ninput = [50, 42, 7, 13]\nexpected = 112\n\n"
+            "[[test_cases]]\ninput = [13, 42]\nexpected = 55\n\n"
+            "[[test_cases]]\ninput = [5, 5, -3, 5]\nexpected = 12\n"
+        )
+
+        def minimize():
+            solution = Solution()
+            solution.case_cache = None
+            solution.test_cases = solution.load_test_cases(str(test_file))
+            solution.test_runner.run_tests(solution, solution.test_cases)
+            return solution.minimize_failures(reference="solve_optimized", workers=2)
+
+        added = minimize()
+        assert [m.test_case.input for m in added] == [([42, 13],), ([-3],)]
+        contents = test_file.read_text()
+        assert contents.count("[[test_cases]]") == 6
+
+        assert minimize() == []
+        assert test_file.read_text() == contents
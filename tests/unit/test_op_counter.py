@@ -0,0 +1,61 @@
+"""
+Unit tests for counted-operation complexity analysis
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import TestCase
+from utils.benchmarking.input_generators import InputGenerator
+from utils.benchmarking.op_counter import OperationLimitExceeded, count_operations
+from utils.benchmarking.performance_analyzer import PerformanceAnalyzer
+
+
+class PairCountSolution:
+    """Counts equal pairs - quadratic, with no early exit"""
+
+    def solve(self, nums):
+        return sum(nums[i] == nums[j] for i in range(len(nums)) for j in range(i))
+
+
+class TestOpCounter:
+    """Test cases for counted-operation complexity analysis"""
+
+    @pytest.mark.unit
+    def test_operations_are_counted_on_proxies(self):
+        """Test reads, writes, comparisons and hashes of instrumented inputs"""
+
+        def first_repeat(nums, words):
+            seen = set()
+            for num in nums:
+                if num in seen:
+                    return num
+                seen.add(num)
+            words.append(min(words))
+
+        nums = [3, 1, 2]
+        counts = count_operations(first_repeat, (nums, ["b", "a"]))
+        assert (counts.reads, counts.writes) == (5, 1)
+        assert counts.hash_lookups == 6 and counts.comparisons == 1
+        assert nums == [3, 1, 2]
+        with pytest.raises(OperationLimitExceeded):
+            count_operations(PairCountSolution().solve, (list(range(100)),), max_operations=1000)
+
+    @pytest.mark.unit
+    def test_operation_counts_give_the_complexity(self):
+        """Test that the analyzer fits counted operations"""
+        analyzer = PerformanceAnalyzer()
+        analyzer.cost_metric = "operations"
+        analyzer.input_generator = InputGenerator(
+            {"sizes": [10, 20, 40, 80, 160], "args": [{"kind": "int_array", "high": 5}]}
+        )
+        test_cases = [TestCase(input=([1],), expected=0)]
+        result = analyzer.analyze_time_complexity(PairCountSolution(), test_cases)
+        assert result.startswith("O(n²)")
+        assert analyzer.complexity_fit.samples == 5
+        assert analyzer.complexity_fit.best.r_squared > 0.999
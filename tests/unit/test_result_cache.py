@@ -0,0 +1,79 @@
+"""
+Unit tests for the ResultCache
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution, LoopSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class LambdaOnZeroSolution:
+    """Solution whose output for 0 cannot be pickled"""
+
+    def solve(self, a, b):
+        return (lambda: 0) if a == 0 else a + b
+
+
+class HangOnOneArgSolution:
+    """Adds two numbers, and never returns when given only one"""
+
+    def solve(self, a, b=None):
+        return LoopSolution().solve(a) if b is None else a + b
+
+
+class TestResultCache:
+    """Test cases for the result cache"""
+
+    @pytest.mark.unit
+    def test_unchanged_tests_are_cached(self, tmp_path):
+        """Test that only new test cases are executed on a second run"""
+        from utils.testing.result_cache import ResultCache
+
+        test_cases = [TestCase(input=(1, 2), expected=3), TestCase(input=(2, 2), expected=5)]
+        TestRunner(cache=ResultCache(tmp_path)).run_tests(AddSolution(), test_cases)
+
+        test_cases.append(TestCase(input=(3, 3), expected=6))
+        runner = TestRunner(cache=ResultCache(tmp_path))
+        results = runner.run_tests(AddSolution(), test_cases)
+        assert [r.cached for r in results] == [True, True, False]
+        assert [r.verdict for r in results] == ["AC", "WA", "AC"]
+
+        ResultCache(tmp_path).clear()
+        results = TestRunner(cache=ResultCache(tmp_path)).run_tests(AddSolution(), test_cases)
+        assert not any(r.cached for r in results)
+
+    @pytest.mark.unit
+    def test_unpicklable_output_only_skips_its_entry(self, tmp_path):
+        """Test that one unpicklable output does not keep the others from the cache"""
+        from utils.testing.result_cache import ResultCache
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(3)]
+        for _ in range(2):
+            runner = TestRunner(cache=ResultCache(tmp_path))
+            results = runner.run_tests(LambdaOnZeroSolution(), test_cases)
+        assert [r.cached for r in results] == [False, True, True]
+
+    @pytest.mark.unit
+    def test_only_deterministic_verdicts_are_cached(self, tmp_path):
+        """Test that TLE and RE results are executed again on the next run"""
+        from utils.testing.result_cache import ResultCache
+
+        test_cases = [
+            TestCase(input=(1, 2), expected=3),
+            TestCase(input=(1, 2), expected=4),
+            TestCase(input=(1, "a"), expected=None),
+            TestCase(input=(1,), expected=None, timeout=0.2),
+        ]
+        for _ in range(2):
+            runner = TestRunner(cache=ResultCache(tmp_path), isolate=True)
+            results = runner.run_tests(HangOnOneArgSolution(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "WA", "RE", "TLE"]
+        assert [r.cached for r in results] == [True, True, False, False]
@@ -0,0 +1,50 @@
+"""
+Unit tests for isolated (sandboxed) test execution
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution, LoopSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class AllocSolution:
+    """Solution that allocates far more memory than allowed"""
+
+    def solve(self, n):
+        return [0] * n
+
+
+class TestSandbox:
+    """Test cases for isolated execution"""
+
+    @pytest.mark.unit
+    def test_infinite_loop_is_killed(self):
+        """Test that a runaway solution gets a TLE verdict"""
+        test_case = TestCase(input=(1,), expected=0, timeout=0.2)
+        result = TestRunner(isolate=True).run_single_test_isolated(LoopSolution(), test_case)
+        assert result.verdict == "TLE"
+        assert result.execution_time < 5
+
+    @pytest.mark.unit
+    def test_memory_limit_is_enforced(self):
+        """Test that exceeding the memory limit gives an MLE verdict"""
+        test_case = TestCase(input=(10**9,), expected=None, timeout=5.0)
+        result = TestRunner(memory_limit=64, isolate=True).run_single_test_isolated(
+            AllocSolution(), test_case
+        )
+        assert result.verdict == "MLE"
+
+    @pytest.mark.unit
+    def test_isolated_results_match_in_process(self):
+        """Test that isolated runs report the same verdicts"""
+        test_cases = [TestCase(input=(1, 2), expected=3), TestCase(input=(1, 2), expected=4)]
+        results = TestRunner(isolate=True, workers=2).run_tests(AddSolution(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "WA"]
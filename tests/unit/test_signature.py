@@ -0,0 +1,64 @@
+"""
+Unit tests for [problem.signature] argument decoding
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import BaseSolution
+
+
+class TestSignature:
+    """Test cases for [problem.signature] argument decoding"""
+
+    @pytest.mark.unit
+    def test_declared_order_and_buffers(self, tmp_path):
+        """Test that arguments follow the signature and decode into buffers"""
+        import array
+
+        import numpy as np
+
+        test_file = tmp_path / "cases.toml"
+        test_file.write_text(
+            "[problem.signature]\n"
+            'target = "int"\n'
+            'nums = { type = "int64[]", buffer = "array" }\n'
+            'weights = { type = "float32[]", buffer = "numpy" }\n\n'
+            "[[test_cases]]\nnums = [3, 4]\nweights = [0.5]\ntarget = 7\nexpected = 1\n"
+        )
+
+        class Solution(BaseSolution):
+            def solve(self, target, nums, weights):
+                return target, nums, weights
+
+        solution = Solution()
+        solution.case_cache = None
+        (test_case,) = solution.load_test_cases(str(test_file))
+        target, nums, weights = test_case.input
+        assert target == 7
+        assert nums == array.array("q", [3, 4])
+        assert weights.dtype == np.float32
+        assert solution.signature.names == ["target", "nums", "weights"]
+
+    @pytest.mark.unit
+    def test_invalid_arguments_are_rejected(self):
+        """Test type, range and field validation"""
+        from utils.testing.signature import Signature
+
+        signature = Signature({"nums": "int8[]", "k": "int"})
+        assert signature.decode({"k": 1, "nums": [-128, 127]}) == ([-128, 127], 1)
+        with pytest.raises(ValueError):
+            signature.decode({"k": 1, "nums": [128]})
+        with pytest.raises(ValueError):
+            signature.decode({"k": "1", "nums": []})
+        with pytest.raises(ValueError):
+            signature.decode({"k": 1})
+        with pytest.raises(ValueError):
+            signature.decode({"k": 1, "nums": [], "extra": 2})
+        with pytest.raises(ValueError):
+            Signature({"grid": {"type": "int64[][]", "buffer": "numpy"}})
@@ -0,0 +1,131 @@
+"""
+Unit tests for the TestRunner
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution, ExitingSolution, LoopSolution, SlowSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestTestRunner:
+    """Test cases for TestRunner"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solution = AddSolution()
+        self.test_cases = [
+            TestCase(input=(i, i), expected=2 * i, description=f"Case {i}") for i in range(6)
+        ]
+        self.test_cases[3].expected = -1
+
+    @pytest.mark.unit
+    def test_serial_run(self):
+        """Test serial execution"""
+        results = TestRunner().run_tests(self.solution, self.test_cases)
+        assert [r.passed for r in results] == [True, True, True, False, True, True]
+
+    @pytest.mark.unit
+    def test_parallel_run_preserves_order(self):
+        """Test that parallel results come back in the original order"""
+        results = TestRunner(workers=3).run_tests(self.solution, self.test_cases)
+        assert [r.actual_output for r in results] == [2 * i for i in range(6)]
+        assert [r.test_case.description for r in results] == [f"Case {i}" for i in range(6)]
+        assert not results[3].passed
+
+    @pytest.mark.unit
+    def test_exiting_workers_are_runtime_errors(self):
+        """Test that sys.exit() and a dying pool worker give RE instead of a hang"""
+        test_cases = [TestCase(input=(n,), expected=n, timeout=5.0) for n in (0, -1, -2, 3, 4)]
+        results = TestRunner(workers=2).run_tests(ExitingSolution(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "RE", "RE", "AC", "AC"]
+        assert results[1].error_message == "SystemExit: 1"
+        assert results[2].error_message == "Worker process died (exit code 2)"
+        assert results[2].test_case is test_cases[2]
+
+    @pytest.mark.unit
+    def test_hung_worker_is_killed(self):
+        """Test that an in-process test hanging its pool worker gives TLE"""
+        test_cases = [TestCase(input=(1,), expected=0, timeout=0.2)] * 2
+        results = TestRunner(workers=2).run_tests(LoopSolution(), test_cases)
+        assert [r.verdict for r in results] == ["TLE", "TLE"]
+        assert "worker killed" in results[0].error_message
+
+
+class TestEarlyStop:
+    """Test cases for fail-fast and budgeted runs"""
+
+    @pytest.mark.unit
+    def test_fail_fast(self):
+        """Test that the run stops at the first failure"""
+        test_cases = [TestCase(input=(1, 1), expected=v) for v in (2, 0, 2, 0)]
+        runner = TestRunner(max_failures=1)
+        results = runner.run_tests(AddSolution(), test_cases)
+        assert [r.verdict for r in results] == ["AC", "WA"]
+        assert runner.stop_reason
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("isolate", [False, True])
+    def test_time_budget_cancels_in_flight_tests(self, isolate):
+        """Test that a budget cuts a parallel run short"""
+        import time
+
+        test_cases = [TestCase(input=(5,), expected=5, timeout=10) for _ in range(4)]
+        runner = TestRunner(workers=2, isolate=isolate, time_budget=0.5)
+        start = time.time()
+        results = runner.run_tests(SlowSolution(), test_cases)
+        runner.close()
+        assert time.time() - start < 3
+        assert results == []
+        assert runner.stop_reason == "time budget exhausted"
+
+
+class TestPeakMemory:
+    """Test cases for per-test peak memory"""
+
+    @pytest.mark.unit
+    def test_peak_memory_is_measured(self):
+        """Test that a temporary allocation shows up as peak memory"""
+
+        class TempAlloc:
+            def solve(self, n):
+                data = list(range(n))
+                return len(data)
+
+        runner = TestRunner(track_memory=True)
+        result = runner.run_single_test(TempAlloc(), TestCase(input=(10**6,), expected=10**6))
+        # A million-element list of ints needs well over 8MB at its peak
+        assert result.memory_usage > 8 * 1024 * 1024
+        assert result.baseline_rss > 0
+
+    @pytest.mark.unit
+    def test_timed_run_is_not_traced(self):
+        """Test that tracemalloc only runs in the extra memory run"""
+        import tracemalloc
+
+        class RecordTracing:
+            tracing = []
+
+            def solve(self, n):
+                self.tracing.append(tracemalloc.is_tracing())
+                return n
+
+        solution = RecordTracing()
+        TestRunner().run_single_test(solution, TestCase(input=(1,), expected=1))
+        TestRunner(track_memory=True).run_single_test(solution, TestCase(input=(1,), expected=1))
+        assert solution.tracing == [False, False, True]
+
+    @pytest.mark.unit
+    def test_isolated_peak_rss(self):
+        """Test that isolated runs report the child's peak RSS"""
+        result = TestRunner(isolate=True).run_single_test_isolated(
+            AddSolution(), TestCase(input=(1, 2), expected=3)
+        )
+        assert result.peak_rss >= result.baseline_rss > 0
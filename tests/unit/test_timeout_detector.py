@@ -0,0 +1,183 @@
+"""
+Unit tests for the TimeoutDetector
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tools.timeout_detector.timeout_detector import TimeoutDetector, TimeoutError
+
+
+def busy_wait(seconds: float) -> None:
+    """Burn CPU time (time.sleep would not count against a CPU budget)"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestTimeoutDetector:
+    """Test cases for TimeoutDetector"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("limit", [0.1, 0.5])
+    def test_sub_second_limits(self, limit):
+        """Test that sub-second wall-clock limits are enforced promptly"""
+        detector = TimeoutDetector(timeout_seconds=limit)
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match=f"{limit}s"):
+            with detector.timeout_context():
+                time.sleep(limit * 10)
+        assert limit <= time.perf_counter() - start < limit + 0.2
+
+        with detector.timeout_context():
+            time.sleep(limit / 5)  # Well within the limit
+
+    @pytest.mark.unit
+    def test_nested_contexts(self):
+        """Test that the inner budget fires first and the outer one still holds"""
+        detector = TimeoutDetector()
+        with pytest.raises(TimeoutError, match="0.5s"):
+            with detector.timeout_context(0.5):
+                with pytest.raises(TimeoutError, match="0.1s"):
+                    with detector.timeout_context(0.1):
+                        time.sleep(1)
+                time.sleep(1)
+
+        with detector.timeout_context(0.1):  # No budget left armed
+            pass
+        time.sleep(0.2)
+
+    @pytest.mark.unit
+    def test_cpu_time_budget(self):
+        """Test that a CPU budget counts computation but not sleeping"""
+        detector = TimeoutDetector(timeout_seconds=5.0, cpu_timeout_seconds=0.1)
+        with detector.timeout_context():
+            time.sleep(0.3)
+        with pytest.raises(TimeoutError, match="CPU time limit exceeded"):
+            with detector.timeout_context():
+                busy_wait(2)
+
+    @pytest.mark.unit
+    def test_watchdog_in_worker_thread(self):
+        """Test wall and CPU budgets in a thread without signal timers"""
+        outcomes = []
+
+        def worker():
+            detector = TimeoutDetector(timeout_seconds=0.1)
+            for run in (lambda: time.sleep(2), lambda: None):
+                try:
+                    with detector.timeout_context():
+                        run()
+                    outcomes.append("ok")
+                except TimeoutError as e:
+                    outcomes.append(str(e))
+            try:
+                with detector.timeout_context(5.0, cpu_timeout_seconds=0.1):
+                    busy_wait(2)
+            except TimeoutError as e:
+                outcomes.append(str(e))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(10)
+        assert not thread.is_alive()
+        assert outcomes[0] == "Time limit exceeded: 0.1s"
+        assert outcomes[1] == "ok"
+        assert outcomes[2].startswith("CPU time limit exceeded")
+
+    @pytest.mark.unit
+    def test_late_watchdog_exception_stays_inside_the_context(self, monkeypatch):
+        """Test a timeout delivered while the context is shutting down its watchdog"""
+        import types
+
+        from tools.timeout_detector import timeout_detector
+
+        real_threading = timeout_detector.threading
+
+        class SlowLock:
+            """Lock that holds up the monitored thread, so the budget expires
+            (and the watchdog schedules its exception) while the context is
+            shutting the watchdog down"""
+
+            def __init__(self):
+                self.lock = real_threading.Lock()
+
+            def __enter__(self):
+                if real_threading.current_thread().name != "timeout-watchdog":
+                    time.sleep(0.2)
+                return self.lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return self.lock.__exit__(*exc_info)
+
+        patched = types.SimpleNamespace(**vars(real_threading))
+        patched.Lock = SlowLock
+        monkeypatch.setattr(timeout_detector, "threading", patched)
+
+        errors = []
+
+        def worker():
+            try:
+                with TimeoutDetector().timeout_context(0.05):
+                    pass  # Finishes long before the deadline
+            except TimeoutError as e:
+                errors.append(str(e))
+            time.sleep(0.1)
+            busy_wait(0.05)  # A leaked exception would be raised here
+
+        thread = real_threading.Thread(target=worker)
+        thread.start()
+        thread.join(10)
+        assert errors == ["Time limit exceeded: 0.05s"]
+
+    @pytest.mark.unit
+    def test_simulated_judge(self):
+        """Test verdicts of the LeetCode timeout simulation"""
+
+        class SlowOnLarge:
+            def solve(self, n):
+                time.sleep(0.3 if n > 1 else 0)
+                return n
+
+        test_cases = [
+            type("TestCase", (), {"input": (1,), "expected": 1})(),
+            type("TestCase", (), {"input": (2,), "expected": 2})(),
+            type("TestCase", (), {"input": (1,), "expected": 5})(),
+        ]
+        results = TimeoutDetector().simulate_leetcode_timeout(SlowOnLarge(), test_cases, 0.1)
+        assert (results["passed"], results["timeout"], results["failed"]) == (1, 1, 1)
+        assert results["timeout_cases"] == [2]
+
+    @pytest.mark.unit
+    def test_simulated_judge_matches_the_runner(self, tmp_path):
+        """Test that the simulation copies, loads and compares inputs like TestRunner"""
+        import numpy as np
+
+        from utils.base_solution import TestCase
+        from utils.testing.external_data import parse_external_ref
+
+        class SortInPlace:
+            def solve(self, nums):
+                nums.sort()
+                return nums
+
+        nums = [3, 1, 2]
+        np.save(tmp_path / "nums.npy", np.array([2, 1]))
+        test_cases = [
+            TestCase(input=(nums,), expected=[1, 2, 3]),
+            TestCase(input=(nums,), expected=[3, 2, 1], comparator="unordered"),
+            TestCase(
+                input=(parse_external_ref({"file": "nums.npy"}, str(tmp_path)),), expected=[1, 2]
+            ),
+            TestCase(input=(nums,), expected=[3, 1, 2]),
+        ]
+        results = TimeoutDetector().simulate_leetcode_timeout(SortInPlace(), test_cases, 1.0)
+        assert (results["passed"], results["timeout"], results["failed"]) == (3, 0, 1)
+        assert nums == [3, 1, 2]
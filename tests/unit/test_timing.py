@@ -0,0 +1,41 @@
+"""
+Unit tests for the shared timing harness
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.benchmarking.timing import Timer
+
+
+class TestTiming:
+    """Test cases for the shared timing harness"""
+
+    @pytest.mark.unit
+    def test_fast_calls_are_batched_on_fresh_arguments(self):
+        """Test loop scaling, fresh arguments per call and the summary"""
+        built = []
+
+        def make_args():
+            built.append([3, 1, 2])
+            return (built[-1],)
+
+        stats = Timer(repeats=4, min_sample_time=1e-3).measure(list.sort, make_args)
+        assert len(stats.samples) == 4 and stats.loops > 1
+        # Every timed call sorted a list of its own
+        assert sum(args == [1, 2, 3] for args in built) >= 1 + 4 * stats.loops
+        assert len({id(args) for args in built}) == len(built)
+        assert 0 <= stats.min <= stats.median <= stats.p95 and stats.iqr >= 0
+        assert set(stats.to_dict()) >= {"min", "median", "p95", "iqr", "repeats", "loops"}
+
+    @pytest.mark.unit
+    def test_slow_warmup_is_the_only_sample(self):
+        """Test that a call longer than the budget is not repeated"""
+        stats = Timer(repeats=5, time_budget=0.01).measure(time.sleep, lambda: (0.02,))
+        assert len(stats.samples) == 1 and stats.min >= 0.02
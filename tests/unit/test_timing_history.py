@@ -0,0 +1,75 @@
+"""
+Unit tests for the TimingHistory
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.unit.solutions import AddSolution
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class TestTimingHistory:
+    """Test cases for duration-aware scheduling"""
+
+    @pytest.mark.unit
+    def test_longest_expected_first(self, tmp_path):
+        """Test that unknown tests go first, then known ones by duration"""
+        from utils.testing.timing_history import TimingHistory
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(4)]
+        history = TimingHistory(tmp_path / "timings.json")
+        key = history.problem_key(AddSolution())
+        history.record(key, test_cases[0], 0.1)
+        history.record(key, test_cases[1], 2.0)
+        history.record(key, test_cases[3], 0.5)
+        history.save()
+
+        assert TimingHistory(tmp_path / "timings.json").schedule(key, test_cases) == [2, 1, 3, 0]
+
+    @pytest.mark.unit
+    def test_scheduled_run_keeps_result_order(self, tmp_path):
+        """Test that results stay in test case order under scheduling"""
+        from utils.testing.timing_history import TimingHistory
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(6)]
+        for _ in range(2):
+            runner = TestRunner(workers=3, history=TimingHistory(tmp_path / "timings.json"))
+            results = runner.run_tests(AddSolution(), test_cases)
+            assert [r.actual_output for r in results] == [2 * i for i in range(6)]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_each_test_case_is_hashed_once(self, tmp_path, monkeypatch, workers):
+        """Test that the cache and history share digests and serial runs skip scheduling"""
+        from utils.testing import result_cache
+        from utils.testing.result_cache import ResultCache
+        from utils.testing.timing_history import TimingHistory
+
+        hashed = []
+        digest = result_cache.test_case_digest
+        monkeypatch.setattr(
+            result_cache, "test_case_digest", lambda case: hashed.append(case) or digest(case)
+        )
+        scheduled = []
+        schedule = TimingHistory.schedule
+        monkeypatch.setattr(
+            TimingHistory, "schedule", lambda *args: scheduled.append(1) or schedule(*args)
+        )
+
+        test_cases = [TestCase(input=(i, i), expected=2 * i) for i in range(6)]
+        runner = TestRunner(
+            workers=workers,
+            cache=ResultCache(tmp_path / "results"),
+            history=TimingHistory(tmp_path / "timings.json"),
+        )
+        results = runner.run_tests(AddSolution(), test_cases)
+        assert all(r.passed for r in results)
+        assert len(hashed) == len(test_cases)
+        assert len(scheduled) == (workers > 1)
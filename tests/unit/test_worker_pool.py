@@ -0,0 +1,75 @@
+"""
+Unit tests for the WarmWorkerPool
+"""
+
+import os
+import signal
+import sys
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.base_solution import TestCase
+from utils.testing.test_runner import TestRunner
+
+
+class WorkerKillerSolution:
+    """Solution that kills the pool worker running it when given 0"""
+
+    def solve(self, n):
+        if n == 0:
+            # The sandboxed child was forked by the worker
+            os.kill(os.getppid(), signal.SIGKILL)
+        return n
+
+
+class TestWarmWorkerPool:
+    """Test cases for WarmWorkerPool"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solution = WorkerKillerSolution()
+        self.runner = TestRunner(isolate=True, workers=2)
+
+    def teardown_method(self):
+        """Stop the pool's workers"""
+        self.runner.close()
+
+    @pytest.mark.unit
+    def test_workers_are_reused_across_runs(self):
+        """Test that a second run is served by the same warm workers"""
+        test_cases = [TestCase(input=(i,), expected=i) for i in range(1, 5)]
+        results = self.runner.run_tests(self.solution, test_cases)
+        assert all(r.passed for r in results)
+        pool = self.runner.get_warm_pool(self.solution, 2)
+        pids = [process.pid for process in pool._processes]
+
+        results = self.runner.run_tests(self.solution, test_cases)
+        assert all(r.passed for r in results)
+        assert self.runner.get_warm_pool(self.solution, 2) is pool
+        assert [process.pid for process in pool._processes] == pids
+
+    @pytest.mark.unit
+    def test_dead_worker_is_reported_and_replaced(self):
+        """Test that a worker dying mid-test gives a runtime error, not a crash"""
+        test_cases = [TestCase(input=(i,), expected=i) for i in (1, 0, 2, 3, 4)]
+        results = self.runner.run_tests(self.solution, test_cases)
+        assert [r.verdict for r in results] == ["AC", "RE", "AC", "AC", "AC"]
+        assert "Worker process died" in results[1].error_message
+        assert results[1].test_case is test_cases[1]
+
+        pool = self.runner.get_warm_pool(self.solution, 2)
+        assert len(pool._processes) == 2
+        assert all(process.is_alive() for process in pool._processes)
+
+    @pytest.mark.unit
+    def test_close_stops_all_workers(self):
+        """Test that closing the pool stops and forgets every worker"""
+        pool = self.runner.get_warm_pool(self.solution, 2)
+        processes = list(pool._processes)
+        pool.close()
+        assert not any(process.is_alive() for process in processes)
+        assert pool._processes == [] and pool._connections == []
+        pool.close()  # Closing twice is harmless
@@ -4,13 +4,26 @@ Timeout Detector Module
 
 Provides timeout detection and "Time Limit Exceeded" simulation
 for DSA solutions, mimicking LeetCode's timeout behavior.
+
+Limits are enforced with high-resolution interval timers
+(signal.setitimer) in the main thread, so sub-second budgets such as
+0.1s work. Other threads are policed by a watchdog thread that raises
+TimeoutError asynchronously in the monitored thread. Contexts can be
+nested; each one enforces its own wall-clock and CPU-time budget.
 """
 
+import ctypes
 import signal
+import threading
 import time
-from typing import Callable, Any, Optional
+from typing import Callable, Any, List, Optional
 from contextlib import contextmanager
 
+from utils.benchmarking.timing import time_call
+from utils.testing.comparators import describe_mismatch, outputs_match
+from utils.testing.external_data import resolve_input
+from utils.testing.input_guard import fresh_arguments
+
 
 class TimeoutError(Exception):
     """Custom timeout exception"""
@@ -18,31 +31,191 @@ class TimeoutError(Exception):
     pass
 
 
+# How often the watchdog re-checks budgets of non-main threads
+WATCHDOG_INTERVAL = 0.005
+
+
+class _Budget:
+    """Wall-clock and CPU-time deadlines of one active timeout context"""
+
+    def __init__(self, wall_seconds: Optional[float], cpu_seconds: Optional[float], cpu_clock):
+        self.wall_seconds = wall_seconds
+        self.cpu_seconds = cpu_seconds
+        self.cpu_clock = cpu_clock
+        self.wall_deadline = time.perf_counter() + wall_seconds if wall_seconds else None
+        self.cpu_deadline = cpu_clock() + cpu_seconds if cpu_seconds else None
+        self.expired: Optional[str] = None
+
+    def check(self) -> Optional[str]:
+        """Return a message if either budget is exhausted"""
+        if self.wall_deadline is not None and time.perf_counter() >= self.wall_deadline:
+            return f"Time limit exceeded: {self.wall_seconds}s"
+        if self.cpu_deadline is not None and self.cpu_clock() >= self.cpu_deadline:
+            return f"CPU time limit exceeded: {self.cpu_seconds}s"
+        return None
+
+
+# Budgets armed through signal timers in the main thread, innermost last
+_signal_budgets: List[_Budget] = []
+_original_handlers: dict = {}
+
+
+def _signal_handler(signum, frame):
+    """SIGALRM/SIGPROF handler - raise for the earliest expired budget"""
+    for budget in _signal_budgets:
+        message = budget.check()
+        if message:
+            budget.expired = message
+            raise TimeoutError(message)
+    # Woken early (e.g. by a budget that has since been popped) - re-arm
+    _rearm_signal_timers()
+
+
+def _rearm_signal_timers() -> None:
+    """Arm the interval timers for the nearest wall and CPU deadlines"""
+    now = time.perf_counter()
+    cpu_now = time.process_time()
+    wall_deadlines = [b.wall_deadline for b in _signal_budgets if b.wall_deadline is not None]
+    cpu_deadlines = [b.cpu_deadline for b in _signal_budgets if b.cpu_deadline is not None]
+
+    # A zero interval disarms a timer, so clamp to a tiny positive delay
+    signal.setitimer(
+        signal.ITIMER_REAL, max(min(wall_deadlines) - now, 1e-6) if wall_deadlines else 0
+    )
+    signal.setitimer(
+        signal.ITIMER_PROF, max(min(cpu_deadlines) - cpu_now, 1e-6) if cpu_deadlines else 0
+    )
+
+
+@contextmanager
+def _signal_timeout(budget: _Budget):
+    """Enforce a budget in the main thread with interval timers"""
+    if not _signal_budgets:
+        for signum in (signal.SIGALRM, signal.SIGPROF):
+            _original_handlers[signum] = signal.signal(signum, _signal_handler)
+    _signal_budgets.append(budget)
+    _rearm_signal_timers()
+
+    try:
+        yield
+    finally:
+        _signal_budgets.remove(budget)
+        if _signal_budgets:
+            _rearm_signal_timers()
+        else:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            for signum, handler in _original_handlers.items():
+                signal.signal(signum, handler if handler is not None else signal.SIG_DFL)
+            _original_handlers.clear()
+
+
+def _thread_cpu_clock(thread_id: int) -> Callable[[], float]:
+    """CPU clock of another thread, falling back to process CPU time"""
+    try:
+        clock_id = time.pthread_getcpuclockid(thread_id)
+        return lambda: time.clock_gettime(clock_id)
+    except (AttributeError, OSError):
+        return time.process_time
+
+
+def _raise_in_thread(thread_id: int, exception: Optional[type]) -> None:
+    """Schedule (or with None, cancel) an asynchronous exception in a thread"""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(exception) if exception else None
+    )
+
+
+@contextmanager
+def _watchdog_timeout(budget: _Budget):
+    """Enforce a budget in a non-main thread from a watchdog thread"""
+    thread_id = threading.get_ident()
+    done = threading.Event()
+    lock = threading.Lock()
+
+    def watch():
+        while not done.wait(WATCHDOG_INTERVAL):
+            message = budget.check()
+            if message:
+                with lock:
+                    if not done.is_set():
+                        budget.expired = message
+                        _raise_in_thread(thread_id, TimeoutError)
+                return
+
+    def stop() -> None:
+        """Stop the watchdog; after this no exception can be scheduled any more"""
+        with lock:
+            done.set()
+            if budget.expired:
+                _raise_in_thread(thread_id, None)  # Cancel it if not yet delivered
+
+    watchdog = threading.Thread(target=watch, name="timeout-watchdog", daemon=True)
+    watchdog.start()
+
+    try:
+        # The watchdog is stopped inside the outer try, so an exception it
+        # delivers up to that point is still handled below rather than
+        # escaping from cleanup code or into the caller
+        try:
+            yield
+        finally:
+            stop()
+        if budget.expired:
+            # Expired as the block finished; the exception was cancelled
+            raise TimeoutError(budget.expired)
+    except TimeoutError as e:
+        # Async exceptions are raised from the bare class; add the message
+        if budget.expired and not e.args:
+            raise TimeoutError(budget.expired) from None
+        raise
+    finally:
+        watchdog.join()
+
+
 class TimeoutDetector:
     """Detects and handles timeouts in solution execution"""
 
-    def __init__(self, timeout_seconds: float = 1.0):
+    def __init__(self, timeout_seconds: float = 1.0, cpu_timeout_seconds: Optional[float] = None):
         self.timeout_seconds = timeout_seconds
-        self.original_handler = None
-
-    def timeout_handler(self, signum, frame):
-        """Signal handler for timeout"""
-        raise TimeoutError(f"Time limit exceeded: {self.timeout_seconds}s")
+        self.cpu_timeout_seconds = cpu_timeout_seconds
 
     @contextmanager
-    def timeout_context(self):
-        """Context manager for timeout detection"""
-        # Set up signal handler
-        self.original_handler = signal.signal(signal.SIGALRM, self.timeout_handler)
-        signal.alarm(int(self.timeout_seconds))
+    def timeout_context(
+        self,
+        timeout_seconds: Optional[float] = None,
+        cpu_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Context manager for timeout detection
 
-        try:
+        Args:
+            timeout_seconds: Wall-clock budget (defaults to self.timeout_seconds)
+            cpu_timeout_seconds: CPU-time budget (defaults to self.cpu_timeout_seconds)
+
+        Raises:
+            TimeoutError: When either budget is exhausted inside the block
+        """
+        if timeout_seconds is None:
+            timeout_seconds = self.timeout_seconds
+        if cpu_timeout_seconds is None:
+            cpu_timeout_seconds = self.cpu_timeout_seconds
+
+        use_signals = threading.current_thread() is threading.main_thread() and hasattr(
+            signal, "setitimer"
+        )
+        if use_signals:
+            # ITIMER_PROF counts process CPU time, which is what the
+            # main thread consumes while the solution runs
+            budget = _Budget(timeout_seconds, cpu_timeout_seconds, time.process_time)
+            guard = _signal_timeout(budget)
+        else:
+            cpu_clock = _thread_cpu_clock(threading.get_ident())
+            budget = _Budget(timeout_seconds, cpu_timeout_seconds, cpu_clock)
+            guard = _watchdog_timeout(budget)
+
+        with guard:
             yield
-        finally:
-            # Restore original handler
-            signal.alarm(0)
-            if self.original_handler:
-                signal.signal(signal.SIGALRM, self.original_handler)
 
     def run_with_timeout(self, func: Callable, *args, **kwargs) -> Any:
         """Run function with timeout detection"""
@@ -71,31 +244,28 @@ class TimeoutDetector:
         self.timeout_seconds = time_limit
 
         for i, test_case in enumerate(test_cases):
-            start_time = time.time()
-
             try:
+                # Inputs are loaded and copied, as by TestRunner, outside the limit
+                args = ()
+                if hasattr(test_case, "input"):
+                    args = fresh_arguments(resolve_input(test_case.input))
+
                 with self.timeout_context():
-                    if hasattr(test_case, "input"):
-                        if isinstance(test_case.input, (list, tuple)):
-                            result = solution.solve(*test_case.input)
-                        else:
-                            result = solution.solve(test_case.input)
-                    else:
-                        result = solution.solve()
-
-                    execution_time = time.time() - start_time
-                    results["total_time"] += execution_time
-
-                    # Check if solution is correct
-                    expected = getattr(test_case, "expected", None)
-                    if expected is None or result == expected:
-                        results["passed"] += 1
-                        print(f"✅ Test {i+1}: PASSED ({execution_time:.3f}s)")
-                    else:
-                        results["failed"] += 1
-                        print(
-                            f"❌ Test {i+1}: FAILED - Expected: {expected}, Got: {result}"
-                        )
+                    # One run per case: the verdict, like the judge's, is per run
+                    result, execution_time = time_call(solution.solve, *args)
+
+                results["total_time"] += execution_time
+
+                # Check if solution is correct
+                expected = getattr(test_case, "expected", None)
+                comparator = getattr(test_case, "comparator", None)
+                if expected is None or outputs_match(comparator, result, expected):
+                    results["passed"] += 1
+                    print(f"✅ Test {i+1}: PASSED ({execution_time:.3f}s)")
+                else:
+                    results["failed"] += 1
+                    mismatch = describe_mismatch(result, expected, comparator)
+                    print(f"❌ Test {i+1}: FAILED - {mismatch}")
 
             except TimeoutError:
                 results["timeout"] += 1
@@ -133,7 +303,7 @@ def detect_timeout_issues(
 
 
 if __name__ == "__main__":
-    # Example usage
+    # Example usage (from the project root: python -m tools.timeout_detector.timeout_detector)
     class ExampleSolution:
         def solve(self, nums):
             # Simulate a slow solution
@@ -6,18 +6,38 @@ Provides common functionality for all DSA solutions including
 testing, benchmarking, and performance analysis.
 """
 
+import argparse
+import inspect
 import os
 import sys
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, redirect_stdout
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Add the project root to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from utils.benchmarking.input_generators import InputGenerator
 from utils.benchmarking.performance_analyzer import PerformanceAnalyzer
+from utils.benchmarking.timing import TimingStats
+from utils.testing.case_cache import CaseCache
+from utils.testing.case_writer import add_test_case_fields, append_test_case
+from utils.testing.comparators import ExpectedDigest, validate_comparator
+from utils.testing.external_data import (
+    ExternalRef,
+    is_external_ref,
+    parse_external_ref,
+    resolve_input,
+)
+from utils.testing.golden import GoldenGenerator, GoldenOutput
+from utils.testing.input_guard import copy_value, fresh_arguments
+from utils.testing.minimizer import MINIMIZED_PREFIX, FailureMinimizer, Minimization, input_key
+from utils.testing.result_cache import ResultCache
+from utils.testing.signature import Signature
 from utils.testing.test_runner import TestRunner
+from utils.testing.timing_history import TimingHistory
 
 
 @dataclass
@@ -25,9 +45,10 @@ class TestCase:
     """Standard test case structure"""
 
     input: Any
-    expected: Any
+    expected: Any  # None when unknown - only crashes and timeouts fail
     description: str = ""
     timeout: float = 1.0  # seconds
+    comparator: Any = None  # How outputs are compared (see utils.testing.comparators)
 
 
 class BaseSolution(ABC):
@@ -42,7 +63,17 @@ class BaseSolution(ABC):
         self.problem_name = problem_name or self.__class__.__name__
         self.test_runner = TestRunner()
         self.performance_analyzer = PerformanceAnalyzer()
-        self.test_cases: List[TestCase] = []
+        self.test_cases: Sequence[TestCase] = []
+        # Decoded test files are reused until they change (None disables it)
+        self.case_cache: Optional[CaseCache] = CaseCache()
+        # Sections of the test file other than [[test_cases]], e.g. [problem]
+        self.problem_sections: Dict[str, Any] = {}
+        # Realistic scaled inputs from the test file's [generators] section
+        self.input_generator: Optional[InputGenerator] = None
+        # Argument order and types from the test file's [problem.signature]
+        self.signature: Optional[Signature] = None
+        # File the test cases were loaded from (minimized cases are added to it)
+        self.test_file: Optional[str] = None
 
     @abstractmethod
     def solve(self, *args, **kwargs) -> Any:
@@ -58,6 +89,12 @@ class BaseSolution(ABC):
         """
         pass
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop loaded test cases when pickled (e.g. for pool workers)"""
+        state = self.__dict__.copy()
+        state["test_cases"] = []
+        return state
+
     def solve_optimized(self, *args, **kwargs) -> Any:
         """
         Optimized solution method - override if you have a better approach
@@ -65,63 +102,35 @@ class BaseSolution(ABC):
         """
         return self.solve(*args, **kwargs)
 
-    def load_test_cases(self, test_file: str = None) -> List[TestCase]:
+    def load_test_cases(self, test_file: str = None, stream: bool = False) -> Sequence[TestCase]:
         """
         Load test cases from TOML file or return default test cases
 
         Args:
             test_file: Path to TOML test file (optional)
+            stream: Return a TestCaseStream that decodes each test case on
+                demand instead of holding them all in memory
 
         Returns:
-            List of TestCase objects
+            List of TestCase objects (or a TestCaseStream when streaming)
         """
         if test_file and os.path.exists(test_file):
-            return self._load_test_cases_from_file(test_file)
+            self.test_file = test_file
+            return self._load_test_cases_from_file(test_file, stream)
         else:
             return self._get_default_test_cases()
 
-    def _load_test_cases_from_file(self, test_file: str) -> List[TestCase]:
-        """Load test cases from TOML file"""
+    def _load_test_cases_from_file(
+        self, test_file: str, stream: bool = False
+    ) -> Sequence[TestCase]:
+        """Load test cases from TOML file (or its compiled cache)"""
         try:
-            import toml
-
-            with open(test_file, "r") as f:
-                data = toml.load(f)
-
-            test_cases = []
-            for test_data in data.get("test_cases", []):
-                # Generic input handling - map all non-metadata fields to input
-                input_fields = {}
-                metadata_fields = {"expected", "description", "timeout", "input"}
-
-                for key, value in test_data.items():
-                    if key not in metadata_fields:
-                        input_fields[key] = value
-
-                # If we have individual fields, create a tuple in the order they appear
-                if input_fields:
-                    # Sort by key to ensure consistent ordering
-                    input_data = tuple(input_fields[key] for key in sorted(input_fields.keys()))
-                elif "input" in test_data:
-                    # Fallback to the old "input" field format
-                    # If input is a list, wrap it in a tuple for unpacking
-                    if isinstance(test_data["input"], list):
-                        input_data = (test_data["input"],)
-                    else:
-                        input_data = test_data["input"]
-                else:
-                    # No input data found
-                    input_data = None
-
-                test_case = TestCase(
-                    input=input_data,
-                    expected=test_data["expected"],
-                    description=test_data.get("description", ""),
-                    timeout=test_data.get("timeout", 1.0),
-                )
-                test_cases.append(test_case)
-
-            return test_cases
+            if self.case_cache is None:
+                sections, test_cases = self._parse_test_case_file(test_file)
+            elif stream:
+                sections, test_cases = self.case_cache.open(test_file, self._parse_test_case_file)
+            else:
+                sections, test_cases = self.case_cache.load(test_file, self._parse_test_case_file)
         except ImportError:
             print("Warning: TOML not available, using default test cases")
             return self._get_default_test_cases()
@@ -129,11 +138,112 @@ class BaseSolution(ABC):
             print(f"Error loading test cases: {e}")
             return self._get_default_test_cases()
 
+        self._apply_problem_sections(sections)
+        return test_cases
+
+    def _apply_problem_sections(self, sections: Dict[str, Any]) -> None:
+        """Pick up problem-level settings from a test file's other sections"""
+        self.problem_sections = sections
+        signature = sections.get("problem", {}).get("signature")
+        # Already validated while parsing the test cases
+        self.signature = Signature(signature) if signature else None
+        if "generators" in sections:
+            try:
+                self.input_generator = InputGenerator(sections["generators"])
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"Warning: ignoring invalid [generators] section: {e}")
+                self.input_generator = None
+            if self.input_generator is not None:
+                # Generated inputs get the same representation as the tests'
+                self.input_generator.signature = self.signature
+            self.performance_analyzer.input_generator = self.input_generator
+
+    def _parse_test_case_file(self, test_file: str) -> Tuple[Dict[str, Any], List[TestCase]]:
+        """Parse a TOML file into its other sections and its test cases"""
+        import toml
+
+        with open(test_file, "r") as f:
+            data = toml.load(f)
+        sections = {key: value for key, value in data.items() if key != "test_cases"}
+
+        # External payloads are referenced relative to the TOML file
+        base_dir = os.path.dirname(os.path.abspath(test_file))
+
+        # Problem-wide comparator, overridable per test case
+        default_comparator = sections.get("problem", {}).get("comparator")
+
+        # Declared argument order and types (otherwise fields in key order)
+        signature_spec = sections.get("problem", {}).get("signature")
+        signature = Signature(signature_spec) if signature_spec else None
+
+        test_cases = []
+        for test_data in data.get("test_cases", []):
+            test_data = {
+                key: parse_external_ref(value, base_dir) if is_external_ref(value) else value
+                for key, value in test_data.items()
+            }
+
+            # Generic input handling - map all non-metadata fields to input
+            input_fields = {}
+            metadata_fields = {
+                "expected",
+                "expected_digest",
+                "expected_length",
+                "description",
+                "timeout",
+                "input",
+                "comparator",
+            }
+
+            for key, value in test_data.items():
+                if key not in metadata_fields:
+                    input_fields[key] = value
+
+            if signature is not None:
+                if not input_fields and "input" in test_data and len(signature.args) == 1:
+                    input_fields = {signature.names[0]: test_data["input"]}
+                input_data = signature.decode(input_fields)
+            # If we have individual fields, create a tuple in the order they appear
+            elif input_fields:
+                # Sort by key to ensure consistent ordering
+                input_data = tuple(input_fields[key] for key in sorted(input_fields.keys()))
+            elif "input" in test_data:
+                # Fallback to the old "input" field format
+                # If input is a list (or an external array), wrap it in a tuple for unpacking
+                if isinstance(test_data["input"], (list, ExternalRef)):
+                    input_data = (test_data["input"],)
+                else:
+                    input_data = test_data["input"]
+            else:
+                # No input data found
+                input_data = None
+
+            if "expected" not in test_data and "expected_digest" in test_data:
+                # Huge answers are stored as a digest (see comparators.output_digest)
+                expected = ExpectedDigest(
+                    test_data["expected_digest"], test_data.get("expected_length")
+                )
+            else:
+                expected = test_data.get("expected")
+
+            test_case = TestCase(
+                input=input_data,
+                expected=expected,
+                description=test_data.get("description", ""),
+                timeout=test_data.get("timeout", 1.0),
+                comparator=test_data.get("comparator", default_comparator),
+            )
+            # Reject unknown modes, and float comparisons of digests, up front
+            validate_comparator(test_case.comparator, digest=isinstance(expected, ExpectedDigest))
+            test_cases.append(test_case)
+
+        return sections, test_cases
+
     def _get_default_test_cases(self) -> List[TestCase]:
         """Override this method to provide default test cases"""
         return []
 
-    def run_tests(self, test_cases: List[TestCase] = None) -> List[Any]:
+    def run_tests(self, test_cases: Sequence[TestCase] = None) -> List[Any]:
         """Run tests and return results"""
         if test_cases is None:
             test_cases = self.test_cases
@@ -142,13 +252,180 @@ class BaseSolution(ABC):
             print("No test cases available")
             return []
 
-        print(f"🧪 Testing {self.problem_name}")
-        print("=" * 50)
+        with self._event_output():
+            print(f"🧪 Testing {self.problem_name}")
+            print("=" * 50)
 
-        results = self.test_runner.run_tests(self, test_cases)
+            results = self.test_runner.run_tests(self, test_cases)
         return results
 
-    def run_performance_analysis(self, test_cases: List[TestCase] = None) -> Dict[str, Any]:
+    def default_reference(self) -> Optional[str]:
+        """Trusted method for expected outputs: solve_optimized if overridden"""
+        if type(self).solve_optimized is not BaseSolution.solve_optimized:
+            return "solve_optimized"
+        return None
+
+    def minimize_failures(
+        self,
+        results: Sequence[Any] = None,
+        reference: Optional[str] = None,
+        workers: int = 0,
+    ) -> List[Minimization]:
+        """
+        Shrink each failing test case and add the minimal cases to the test file
+
+        Args:
+            results: Test results to minimize failures of (default: last run)
+            reference: Method computing expected outputs of reduced inputs
+                (default: default_reference())
+            workers: Worker processes checking candidates (0 = one per CPU)
+
+        Failures that do not shrink, cases added by an earlier minimization
+        and minimal inputs already in the test file are skipped, so running
+        it again does not grow the file.
+
+        Returns:
+            One Minimization per failing test case that was shrunk to a new input
+        """
+        if results is None:
+            results = self.test_runner.results
+        failures = [
+            r
+            for r in results
+            if not r.passed
+            and not getattr(r.test_case, "description", "").startswith(MINIMIZED_PREFIX)
+        ]
+        if not failures:
+            return []
+        known_inputs = {
+            input_key(test_case.input)
+            for test_case in self.test_cases
+            if getattr(test_case, "input", None) is not None
+        }
+
+        minimizer = FailureMinimizer(
+            self.test_runner, reference or self.default_reference(), workers
+        )
+        print(f"\n🔬 Minimizing {len(failures)} failing test(s)")
+        print("=" * 50)
+
+        minimized = []
+        for result in failures:
+            test_case = result.test_case
+            description = getattr(test_case, "description", "") or "No description"
+            if getattr(test_case, "input", None) is None:
+                print(f"  {description}: input not retained (--stream), skipping")
+                continue
+            try:
+                minimization = minimizer.minimize(self, test_case)
+            except ValueError as e:
+                print(f"  {description}: {e}")
+                continue
+            if minimization is None:
+                print(f"  {description}: no longer fails, skipping")
+                continue
+            if minimization.size == minimization.original_size:
+                print(f"  {description}: already minimal, skipping")
+                continue
+            key = input_key(minimization.test_case.input)
+            if key in known_inputs:
+                print(f"  {description}: minimal input is already a test case, skipping")
+                continue
+            known_inputs.add(key)
+
+            minimization.test_case.description = (
+                f"{MINIMIZED_PREFIX}'{description}' ({minimization.verdict})"
+            )
+            print(
+                f"  {description}: [{minimization.verdict}] size "
+                f"{minimization.original_size} → {minimization.size} "
+                f"in {minimization.checks} runs"
+            )
+            if self.test_file:
+                append_test_case(
+                    self.test_file,
+                    self._test_case_fields(minimization.test_case),
+                    comment=f"Added by the failing-input minimizer ({minimization.verdict})",
+                )
+                print(f"    Saved to {self.test_file}")
+            else:
+                print(f"    Input: {minimization.test_case.input}")
+            minimized.append(minimization)
+        return minimized
+
+    def generate_golden(self, reference: str = "solve", workers: int = 0) -> List[GoldenOutput]:
+        """
+        Fill in missing expected outputs in the test file using a trusted method
+
+        Args:
+            reference: Method whose outputs are taken as correct
+            workers: Worker processes (0 = one per CPU)
+
+        Returns:
+            One GoldenOutput per test case that lacked an expected output
+        """
+        if not self.test_file:
+            print("No test file loaded - nothing to fill in")
+            return []
+
+        generator = GoldenGenerator(reference, workers)
+        missing = generator.missing(self.test_cases)
+        if not missing:
+            print(f"✅ Every test case in {self.test_file} has an expected output")
+            return []
+
+        print(f"🥇 Computing {len(missing)} expected output(s) with {reference}()")
+        print("=" * 50)
+        try:
+            outputs = generator.generate(self, self.test_cases, missing)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return []
+
+        updates = {}
+        for output in outputs:
+            description = getattr(self.test_cases[output.index], "description", "")
+            label = f"Test {output.index + 1}: {description or 'No description'}"
+            if output.error:
+                print(f"  ✗ {label} - {output.error}")
+                continue
+            updates[output.index] = output.fields
+            if "expected_digest" in output.fields:
+                print(f"  ✓ {label} - digest of {output.fields['expected_length']} items")
+            else:
+                print(f"  ✓ {label}")
+
+        if updates:
+            add_test_case_fields(self.test_file, updates)
+        print(f"\n📝 Wrote {len(updates)}/{len(missing)} expected output(s) to {self.test_file}")
+        return outputs
+
+    def _test_case_fields(self, test_case: TestCase) -> Dict[str, Any]:
+        """TOML fields of a test case, naming arguments after the signature or solve()"""
+        args = test_case.input
+        fields: Dict[str, Any] = {"description": test_case.description}
+        if self.signature is not None and len(self.signature.args) == len(args):
+            fields.update(zip(self.signature.names, args))
+        elif len(args) == 1:
+            fields["input"] = args[0]
+        else:
+            parameters = [
+                p.name
+                for p in inspect.signature(self.solve).parameters.values()
+                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            ]
+            # The loader orders argument fields by name
+            names = parameters[: len(args)]
+            reserved = {"input", "description", "timeout", "comparator"}
+            reserved |= {"expected", "expected_digest", "expected_length"}
+            if len(names) != len(args) or names != sorted(names) or reserved & set(names):
+                names = [f"arg{i}" for i in range(len(args))]
+            fields.update(zip(names, args))
+        fields["expected"] = test_case.expected
+        fields["timeout"] = test_case.timeout
+        return fields
+
+    def run_performance_analysis(self, test_cases: Sequence[TestCase] = None) -> Dict[str, Any]:
         """Run performance analysis and return results"""
         if test_cases is None:
             test_cases = self.test_cases
@@ -163,7 +440,7 @@ class BaseSolution(ABC):
         results = self.performance_analyzer.analyze(self, test_cases)
         return results
 
-    def run_benchmark(self, test_cases: List[TestCase] = None) -> Dict[str, Any]:
+    def run_benchmark(self, test_cases: Sequence[TestCase] = None) -> Dict[str, Any]:
         """Run performance benchmark comparing solve() vs solve_optimized()"""
         if test_cases is None:
             test_cases = self.test_cases
@@ -177,47 +454,81 @@ class BaseSolution(ABC):
 
         # Test main solution
         print("Testing main solution...")
-        main_times = []
-        for test_case in test_cases:
-            start_time = time.time()
-            if isinstance(test_case.input, (list, tuple)):
-                result = self.solve(*test_case.input)
-            else:
-                result = self.solve(test_case.input)
-            execution_time = time.time() - start_time
-            main_times.append(execution_time)
+        main_stats = [self._time_solution(self.solve, test_case.input) for test_case in test_cases]
 
         # Test optimized solution
         print("Testing optimized solution...")
-        opt_times = []
-        for test_case in test_cases:
-            start_time = time.time()
-            if isinstance(test_case.input, (list, tuple)):
-                result = self.solve_optimized(*test_case.input)
-            else:
-                result = self.solve_optimized(test_case.input)
-            execution_time = time.time() - start_time
-            opt_times.append(execution_time)
+        opt_stats = [
+            self._time_solution(self.solve_optimized, test_case.input) for test_case in test_cases
+        ]
 
-        # Calculate metrics
+        # Calculate metrics from the median run time of every test
+        main_times = [stats.median for stats in main_stats]
+        opt_times = [stats.median for stats in opt_stats]
         avg_main = sum(main_times) / len(main_times)
         avg_opt = sum(opt_times) / len(opt_times)
         speedup = avg_main / avg_opt if avg_opt > 0 else 0
 
         print(f"\n📈 Benchmark Results:")
-        print(f"Main solution average: {avg_main:.6f}s")
-        print(f"Optimized solution average: {avg_opt:.6f}s")
+        print(f"Main solution average: {avg_main:.6f}s (median per test)")
+        print(f"Optimized solution average: {avg_opt:.6f}s (median per test)")
         print(f"Speedup: {speedup:.2f}x")
 
-        return {
+        benchmark = {
             "main_times": main_times,
             "opt_times": opt_times,
+            "main_stats": [stats.to_dict() for stats in main_stats],
+            "opt_stats": [stats.to_dict() for stats in opt_stats],
             "avg_main": avg_main,
             "avg_opt": avg_opt,
             "speedup": speedup,
         }
+        if self.input_generator is not None and self.input_generator.benchmark_sizes:
+            benchmark["generated"] = self._benchmark_generated_inputs()
+        return benchmark
+
+    def _time_solution(self, method: Any, test_input: Any) -> TimingStats:
+        """Time a solution method on fresh copies of a test input"""
+        test_input = resolve_input(test_input)
+        # A fresh copy per call, made before timing starts
+        return self.performance_analyzer.timer.measure(method, lambda: fresh_arguments(test_input))
+
+    def _benchmark_generated_inputs(self) -> Dict[int, Dict[str, float]]:
+        """Benchmark both solutions on inputs from the [generators] section"""
+        print("\nGenerated inputs:")
+        timings = {}
+        for size in self.input_generator.benchmark_sizes:
+            size_timings = {}
+            test_input = self.input_generator.generate(size)
+            for name, method in (("main", self.solve), ("optimized", self.solve_optimized)):
+                size_timings[name] = self._time_solution(method, test_input).median
+            timings[size] = size_timings
+            print(
+                f"  n={size}: main {size_timings['main']:.6f}s, "
+                f"optimized {size_timings['optimized']:.6f}s"
+            )
+        return timings
+
+    @contextmanager
+    def _event_output(self):
+        """
+        In NDJSON mode keep stdout for events only - human-readable text
+        from the analysis and benchmark goes to stderr instead
+        """
+        runner = self.test_runner
+        if runner.output != "ndjson":
+            yield
+            return
 
-    def run_all(self, test_cases: List[TestCase] = None):
+        previous_stream = runner.event_stream
+        runner.event_stream = previous_stream or sys.stdout
+        try:
+            with redirect_stdout(sys.stderr):
+                yield
+        finally:
+            runner.event_stream = previous_stream
+
+    def run_all(self, test_cases: Sequence[TestCase] = None):
         """Run all tests, analysis, and benchmarks"""
         if test_cases is None:
             test_cases = self.test_cases
@@ -226,14 +537,25 @@ class BaseSolution(ABC):
             print("No test cases available")
             return
 
-        # Run tests
-        self.run_tests(test_cases)
+        with self._event_output():
+            # Run tests
+            self.run_tests(test_cases)
+
+            # Don't spend the size-ladder analysis on a run that was cut short
+            if self.test_runner.stop_reason:
+                print(
+                    f"\n⏹ Skipping performance analysis and benchmark: "
+                    f"{self.test_runner.stop_reason}"
+                )
+                return
 
-        # Run performance analysis
-        self.run_performance_analysis(test_cases)
+            # Run performance analysis
+            analysis = self.run_performance_analysis(test_cases)
+            self.test_runner.emit({"event": "analysis", "time": time.time(), "results": analysis})
 
-        # Run benchmark
-        self.run_benchmark(test_cases)
+            # Run benchmark
+            benchmark = self.run_benchmark(test_cases)
+            self.test_runner.emit({"event": "benchmark", "time": time.time(), "results": benchmark})
 
     def interactive_mode(self):
         """Interactive mode for manual testing with enhanced features"""
@@ -349,17 +671,20 @@ class BaseSolution(ABC):
         print("-" * 50)
 
         # Run the test
-        result = self.test_runner.run_single_test(self, test_case)
+        if self.test_runner.isolate:
+            result = self.test_runner.run_single_test_isolated(self, test_case)
+        else:
+            result = self.test_runner.run_single_test(self, test_case)
 
         if result.passed:
             print(
                 f"✅ PASSED ({result.execution_time:.6f}s, "
-                f"{result.memory_usage / 1024 / 1024:.2f}MB)"
+                f"{result.memory_usage / 1024 / 1024:.2f}MB peak)"
             )
         else:
             print(
-                f"❌ FAILED ({result.execution_time:.6f}s, "
-                f"{result.memory_usage / 1024 / 1024:.2f}MB)"
+                f"❌ FAILED [{result.verdict}] ({result.execution_time:.6f}s, "
+                f"{result.memory_usage / 1024 / 1024:.2f}MB peak)"
             )
             if result.error_message:
                 print(f"   Error: {result.error_message}")
@@ -397,24 +722,16 @@ class BaseSolution(ABC):
     def _run_solutions_comparison(self, parsed_input):
         """Run both solutions and compare results"""
         try:
-            start_time = time.time()
-            result1 = (
-                self.solve(*parsed_input)
-                if isinstance(parsed_input, tuple)
-                else self.solve(parsed_input)
-            )
-            time1 = time.time() - start_time
+            args = parsed_input if isinstance(parsed_input, tuple) else (parsed_input,)
 
-            start_time = time.time()
-            result2 = (
-                self.solve_optimized(*parsed_input)
-                if isinstance(parsed_input, tuple)
-                else self.solve_optimized(parsed_input)
-            )
-            time2 = time.time() - start_time
+            # Each call gets its own copy, in case a solution modifies it
+            result1 = self.solve(*(copy_value(arg) for arg in args))
+            result2 = self.solve_optimized(*(copy_value(arg) for arg in args))
+            time1 = self._time_solution(self.solve, args)
+            time2 = self._time_solution(self.solve_optimized, args)
 
-            print(f"Main solution: {result1} ({time1:.6f}s)")
-            print(f"Optimized:    {result2} ({time2:.6f}s)")
+            print(f"Main solution: {result1} ({time1.describe()})")
+            print(f"Optimized:    {result2} ({time2.describe()})")
 
             if result1 == result2:
                 print("✅ Both solutions agree!")
@@ -430,6 +747,107 @@ class BaseSolution(ABC):
         return user_input
 
 
+def parse_runner_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command-line options shared by all solution scripts"""
+    parser = argparse.ArgumentParser(description="Run a DSA solution with analytics")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for running test cases (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each test case in a child process with hard CPU/memory limits",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Measure each test's peak memory (and enforce the memory limit) "
+        "in an extra tracemalloc run after the timed one",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=None,
+        help="Memory limit per test case in MB (default: 512); without --isolate "
+        "this turns on --track-memory, which is what enforces it in-process",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        help="Output format; ndjson streams one JSON event per line and skips interactive mode",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every test even if a cached result exists for it",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Invalidate all cached test results and compiled test files before running",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Decode test cases one at a time and drop their inputs once run, "
+        "so large suites run in bounded memory",
+    )
+    parser.add_argument(
+        "--minimize",
+        action="store_true",
+        help="Shrink failing test cases by delta debugging and add the minimal "
+        "cases to the test file",
+    )
+    parser.add_argument(
+        "--golden",
+        action="store_true",
+        help="Fill in missing expected outputs in the test file with the "
+        "reference method instead of running the tests",
+    )
+    parser.add_argument(
+        "--reference",
+        default=None,
+        help="Trusted method for --golden (default: solve) and --minimize "
+        "(default: solve_optimized if overridden)",
+    )
+    parser.add_argument(
+        "--count-ops",
+        action="store_true",
+        help="Estimate time complexity from counted element reads, writes, "
+        "comparisons and hash lookups instead of run times",
+    )
+    parser.add_argument(
+        "--count-instructions",
+        action="store_true",
+        help="Also count the bytecode instructions solve() and solve_optimized() "
+        "execute over the test cases (slow: every instruction is traced)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing test (same as --max-failures 1)",
+    )
+    parser.add_argument(
+        "--max-failures",
+        type=int,
+        default=None,
+        help="Stop the run, cancelling remaining tests, after N failures",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Stop the run, cancelling remaining tests, after this many seconds",
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
 def main_solution_runner(solution_class, test_file: str = None):
     """
     Decorator/helper function to run a solution with all features
@@ -437,17 +855,71 @@ def main_solution_runner(solution_class, test_file: str = None):
     Usage:
         if __name__ == "__main__":
             main_solution_runner(TwoSum, "test_cases.toml")
+
+    Command-line options (see parse_runner_args):
+        --jobs N    Run test cases over N worker processes
+        --isolate   Sandbox each test case (TLE/MLE/RE verdicts like a judge)
+        --track-memory  Report peak memory from an extra traced run per test
+        --memory-limit MB  Per-test memory limit (implies --track-memory
+                    unless --isolate)
+        --format    "text" (default) or "ndjson" for streaming JSON events
+        --no-cache  Ignore cached results of unchanged solution/test pairs
+        --clear-cache  Invalidate the result cache first
+        --stream    Decode test cases on demand instead of loading them all
+        --minimize  Shrink failing tests and save the minimal cases
+        --golden    Fill in missing expected outputs instead of running
+        --reference NAME  Trusted method for --golden and --minimize
+        --count-ops Fit complexity to counted operations, not run times
+        --count-instructions  Report bytecode instructions of the solutions
+        --fail-fast, --max-failures N, --time-budget SECONDS
+                    Stop early, cancelling queued and in-flight tests and
+                    skipping the analysis and benchmark
     """
+    args = parse_runner_args()
     solution = solution_class()
+    solution.test_runner.workers = args.jobs
+    solution.test_runner.isolate = args.isolate
+    solution.test_runner.track_memory = args.track_memory
+    if args.memory_limit is not None:
+        solution.test_runner.memory_limit = args.memory_limit * 1024 * 1024
+        # In-process runs only measure memory in the traced run
+        solution.test_runner.track_memory = args.track_memory or not args.isolate
+    solution.test_runner.output = args.format
+    solution.test_runner.max_failures = 1 if args.fail_fast else args.max_failures
+    solution.test_runner.time_budget = args.time_budget
+    solution.test_runner.retain_inputs = not args.stream
+    if args.count_ops:
+        solution.performance_analyzer.cost_metric = "operations"
+    solution.performance_analyzer.count_bytecode = args.count_instructions
+
+    if not args.no_cache:
+        cache = ResultCache()
+        if args.clear_cache:
+            cache.clear()
+        solution.test_runner.cache = cache
+    if args.clear_cache and solution.case_cache is not None:
+        solution.case_cache.clear()
+
+    # Previous durations schedule parallel runs longest-first
+    solution.test_runner.history = TimingHistory()
 
     # Load test cases
     if test_file:
-        solution.test_cases = solution.load_test_cases(test_file)
+        solution.test_cases = solution.load_test_cases(test_file, stream=args.stream)
     else:
         solution.test_cases = solution.load_test_cases()
 
+    if args.golden:
+        solution.generate_golden(args.reference or "solve", workers=args.jobs)
+        return
+
     # Run everything
     solution.run_all()
 
-    # Interactive mode
-    solution.interactive_mode()
+    if args.minimize:
+        with solution._event_output():
+            solution.minimize_failures(reference=args.reference)
+
+    # Interactive mode (machine-readable runs are not interactive)
+    if args.format == "text":
+        solution.interactive_mode()
@@ -0,0 +1,98 @@
+"""
+Bytecode Counter Module
+=======================
+
+Counts the Python bytecode instructions a call executes, as a cost that
+does not depend on CPU frequency, load or neighbouring processes. The
+count is exact and repeatable for the same input and Python version, so
+two solutions (or two revisions of one) can be compared in CI without
+timing noise.
+
+Counting uses opcode-level tracing (sys.settrace with f_trace_opcodes)
+restricted to the solution's own code: frames whose code was compiled
+from the solution's source file - its methods, helper functions, nested
+functions and comprehensions. Instructions run inside builtins (e.g. the
+C loop of sorted()) and other modules are not counted.
+
+Tracing makes a call one to two orders of magnitude slower, so a count
+stops with InstructionLimitExceeded once it exceeds a budget.
+"""
+
+import inspect
+import sys
+from typing import Any, Callable, Collection, Optional, Set, Tuple
+
+# Default instruction budget of one counted call
+DEFAULT_MAX_INSTRUCTIONS = 10**7
+
+
+class InstructionLimitExceeded(Exception):
+    """A counted call executed more instructions than its budget"""
+
+    pass
+
+
+def source_files(obj: Any) -> Set[str]:
+    """
+    Source files of an object's code
+
+    Args:
+        obj: A function or method, or a class or instance - the files its
+            own methods were compiled from (inherited methods are not
+            included, e.g. BaseSolution's)
+    """
+    code = getattr(getattr(obj, "__func__", obj), "__code__", None)
+    if code is not None:
+        return {code.co_filename}
+    cls = obj if inspect.isclass(obj) else type(obj)
+    files = set()
+    for member in vars(cls).values():
+        function = getattr(member, "__func__", member)  # staticmethod, classmethod
+        if hasattr(function, "__code__"):
+            files.add(function.__code__.co_filename)
+    return files
+
+
+def count_instructions(
+    func: Callable,
+    args: Tuple[Any, ...] = (),
+    files: Optional[Collection[str]] = None,
+    max_instructions: int = DEFAULT_MAX_INSTRUCTIONS,
+) -> int:
+    """
+    Bytecode instructions executed by one call
+
+    Args:
+        func: Function to run, e.g. solution.solve
+        args: Its arguments
+        files: Source files whose code is counted (default: func's own file)
+        max_instructions: Instruction budget of the call
+
+    Raises:
+        InstructionLimitExceeded: If the call executes more than max_instructions
+    """
+    files = set(files) if files is not None else source_files(func)
+    executed = 0
+
+    def trace_opcodes(frame, event, arg):
+        nonlocal executed
+        if event == "opcode":
+            executed += 1
+            if executed > max_instructions:
+                raise InstructionLimitExceeded(f"More than {max_instructions} instructions")
+        return trace_opcodes
+
+    def trace_calls(frame, event, arg):
+        if frame.f_code.co_filename not in files:
+            return None  # Not the solution's code: leave the frame untraced
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        return trace_opcodes
+
+    previous = sys.gettrace()
+    sys.settrace(trace_calls)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+    return executed
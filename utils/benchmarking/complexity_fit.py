@@ -0,0 +1,161 @@
+"""
+Complexity Fit Module
+=====================
+
+Estimates a solution's time complexity by least-squares regression of
+measured run times against candidate growth models:
+
+    t(n) ≈ a + c * f(n),  f in 1, log n, n, n log n, n², n³, 2^n
+
+Every timing sample (several repeats per size) is a data point, so noise
+averages out instead of deciding the answer as a single ratio of two
+measurements would. Models are ranked by the Bayesian information
+criterion (residual error, penalized per fitted parameter so the constant
+model can win); R² says how well the best model explains the data, and
+the confidence is its BIC weight - the probability that it, rather than
+another candidate, generated the timings. The fitted constant c (seconds
+per unit of f(n)) extrapolates run time to judge-scale inputs.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+# Candidate models in order of growth: (name, description, f(n))
+MODELS: List[Tuple[str, str, Callable[[float], float]]] = [
+    ("O(1)", "Constant time", lambda n: 1.0),
+    ("O(log n)", "Logarithmic time", lambda n: math.log2(n)),
+    ("O(n)", "Linear time", lambda n: n),
+    ("O(n log n)", "Linearithmic time", lambda n: n * math.log2(n)),
+    ("O(n²)", "Quadratic time", lambda n: n**2),
+    ("O(n³)", "Cubic time", lambda n: n**3),
+    ("O(2^n)", "Exponential time", lambda n: 2.0**n if n < 1000 else math.inf),
+]
+
+# Fewest distinct input sizes a two-parameter fit can be judged on
+MIN_SIZES = 3
+
+
+@dataclass
+class ModelFit:
+    """Least-squares fit of one growth model"""
+
+    model: str  # e.g. "O(n log n)"
+    description: str  # e.g. "Linearithmic time"
+    constant: float  # c - seconds per unit of f(n)
+    intercept: float  # a - fixed cost in seconds
+    r_squared: float
+    rss: float  # Residual sum of squares
+    bic: float  # Bayesian information criterion (lower is better)
+    growth: Callable[[float], float] = field(repr=False, default=lambda n: 1.0)
+
+    def predict(self, n: int) -> float:
+        """Estimated run time in seconds at input size n"""
+        return self.intercept + self.constant * self.growth(n)
+
+    @property
+    def label(self) -> str:
+        return f"{self.model} - {self.description}"
+
+
+@dataclass
+class ComplexityFit:
+    """Best model for a set of timings, with every candidate's fit"""
+
+    best: ModelFit
+    fits: List[ModelFit]  # All candidates, best first
+    confidence: float  # 0-1: BIC weight of the best model among all candidates
+    samples: int
+
+    def predict(self, n: int) -> float:
+        """Estimated run time in seconds at input size n under the best model"""
+        return self.best.predict(n)
+
+    def describe(self) -> str:
+        return (
+            f"{self.best.label} (R²={self.best.r_squared:.3f}, "
+            f"confidence {self.confidence:.0%})"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "model": self.best.model,
+            "constant": self.best.constant,
+            "intercept": self.best.intercept,
+            "r_squared": self.best.r_squared,
+            "confidence": self.confidence,
+            "samples": self.samples,
+            "candidates": {fit.model: fit.r_squared for fit in self.fits if math.isfinite(fit.bic)},
+        }
+
+
+def _fit_model(
+    name: str,
+    description: str,
+    growth: Callable[[float], float],
+    sizes: np.ndarray,
+    times: np.ndarray,
+) -> ModelFit:
+    values = np.array([growth(float(n)) for n in sizes])
+    unusable = ModelFit(name, description, 0.0, 0.0, -math.inf, math.inf, math.inf, growth)
+    if not np.all(np.isfinite(values)):
+        return unusable
+
+    if name == "O(1)":
+        intercept, constant = 0.0, float(times.mean())
+    else:
+        # t = a + c*f(n); a negative fixed cost is meaningless, so refit through 0
+        design = np.column_stack([np.ones_like(values), values])
+        (intercept, constant), *_ = np.linalg.lstsq(design, times, rcond=None)
+        if intercept < 0:
+            intercept = 0.0
+            constant = float(values @ times / (values @ values)) if values.any() else 0.0
+    if constant < 0:
+        return unusable  # Shrinking run times do not follow a growth model
+
+    residuals = times - (intercept + constant * values)
+    rss = float(residuals @ residuals)
+    tss = float(((times - times.mean()) ** 2).sum())
+    r_squared = 1.0 - rss / tss if tss > 0 else 1.0
+
+    samples = len(times)
+    parameters = 1 if name == "O(1)" else 2
+    # Floor the error so exact fits do not take the logarithm of zero
+    floor = max(tss, float(times @ times)) * 1e-12 + 1e-300
+    bic = samples * math.log(max(rss, floor) / samples) + parameters * math.log(samples)
+    return ModelFit(
+        name, description, float(constant), float(intercept), r_squared, rss, bic, growth
+    )
+
+
+def fit_complexity(sizes: Sequence[int], times: Sequence[float]) -> ComplexityFit:
+    """
+    Fit timings against every candidate model
+
+    Args:
+        sizes: Input size of each sample (repeats share a size)
+        times: Run time of each sample in seconds
+
+    Raises:
+        ValueError: With fewer than MIN_SIZES distinct sizes, or mismatched lengths
+    """
+    if len(sizes) != len(times):
+        raise ValueError("sizes and times must have the same length")
+    if len(set(sizes)) < MIN_SIZES:
+        raise ValueError(f"Need timings for at least {MIN_SIZES} different input sizes")
+
+    size_array = np.asarray(sizes, dtype=float)
+    time_array = np.asarray(times, dtype=float)
+    fits = [
+        _fit_model(name, description, growth, np.maximum(size_array, 1.0), time_array)
+        for name, description, growth in MODELS
+    ]
+    # Stable sort: on equal scores the slower-growing (listed earlier) model wins
+    fits.sort(key=lambda fit: fit.bic)
+
+    best = fits[0]
+    weights = [math.exp(-(fit.bic - best.bic) / 2) for fit in fits if math.isfinite(fit.bic)]
+    confidence = 1.0 / sum(weights)
+    return ComplexityFit(best=best, fits=fits, confidence=confidence, samples=len(times))
@@ -0,0 +1,292 @@
+"""
+Input Scaler Module
+===================
+
+Builds solve() inputs of a requested size from a problem's base test case,
+for test files without a [generators] section (a generator spec always
+takes precedence). All arguments of the base case are scaled together, so
+the size ladder of the complexity analysis exercises the algorithm:
+
+    numeric lists   grown with values from the base's range; bases that
+                    are sorted or all-distinct stay sorted or distinct
+                    (unless a fixed-width type, e.g. int8[], has fewer
+                    values than the size)
+    strings         grown from the base's alphabet
+    word lists      words of the base's lengths and alphabet - substrings
+                    of a string argument when the base's words are
+    categorical     lists of repeated strings or bools (e.g. "0"/"1")
+                    sample the base's values
+    nested lists    square matrices stay square (about size cells); lists
+                    of equal-length rows (intervals, edges) grow in rows
+    ints            follow the scaled lists: a pair sum of a list (a
+                    two-sum target) stays a pair sum, an element (a search
+                    target) stays an element, and an argument named n,
+                    size or length - or equal to a list's length - becomes
+                    the new length; other ints (and k) are kept
+
+The longest list or string argument gets the requested size and shorter
+ones keep their size ratio to it. With a [problem.signature], the
+declared names and types are used and the result is decoded into the
+declared buffers. Without one, solve()'s parameters tell whether a bare
+list is one argument or the argument list. Inputs are seeded by size, so
+every run scales to the same inputs.
+"""
+
+import inspect
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.testing.external_data import resolve_input
+from utils.testing.input_guard import as_arguments
+from utils.testing.signature import int_bounds, is_fixed_int
+
+# Argument names that hold the length of the input
+LENGTH_NAMES = frozenset({"n", "size", "length"})
+# Argument names of counts that are kept as they are (e.g. top k)
+KEPT_NAMES = frozenset({"k"})
+
+DEFAULT_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _plain(value: Any) -> Any:
+    """Lists in place of NumPy arrays and array.array buffers"""
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_pair_sum(value: int, values: Sequence[Any]) -> bool:
+    """Whether value is the sum of two elements at different positions"""
+    seen = set()
+    for item in values:
+        if value - item in seen:
+            return True
+        seen.add(item)
+    return False
+
+
+class InputScaler:
+    """Scales a base test case's arguments to a given input size"""
+
+    def __init__(
+        self, signature: Any = None, parameters: Optional[List[str]] = None, seed: int = 0
+    ):
+        """
+        Args:
+            signature: Optional utils.testing.signature.Signature of solve()
+            parameters: Names of solve()'s positional parameters, if known
+            seed: Seed of the random values (combined with the size)
+        """
+        self.signature = signature
+        self.parameters = parameters
+        self.seed = seed
+
+    @classmethod
+    def for_solution(cls, solution: Any) -> "InputScaler":
+        """Scaler using a solution's [problem.signature] and solve() parameters"""
+        parameters = None
+        try:
+            values = inspect.signature(solution.solve).parameters.values()
+            positional = (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+            if all(p.kind in positional for p in values):
+                parameters = [p.name for p in values]
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return cls(getattr(solution, "signature", None), parameters)
+
+    def arguments(self, base_input: Any) -> Tuple[Any, ...]:
+        """The base input as a tuple of solve() arguments, with buffers as lists"""
+        base_input = resolve_input(base_input)
+        if self.signature is None and self.parameters is not None:
+            if len(self.parameters) == 1 and isinstance(base_input, list):
+                return (_plain(base_input),)  # A bare list is solve()'s one argument
+        return tuple(_plain(arg) for arg in as_arguments(base_input))
+
+    def scale(self, base_input: Any, size: int) -> Tuple[Any, ...]:
+        """
+        solve() arguments shaped like the base input, at the given size
+
+        Args:
+            base_input: Input of the base test case
+            size: Length of the longest list or string argument
+        """
+        args = self.arguments(base_input)
+        names: List[Optional[str]] = [None] * len(args)
+        types: List[Optional[str]] = [None] * len(args)
+        typed = self.signature is not None and len(self.signature.args) == len(args)
+        if typed:
+            names = list(self.signature.names)
+            types = [arg.type for arg in self.signature.args]
+        elif self.parameters is not None and len(self.parameters) == len(args):
+            names = list(self.parameters)
+
+        rng = np.random.default_rng([self.seed, size])
+        longest = max((len(arg) for arg in args if isinstance(arg, (list, str))), default=0)
+
+        def length_of(arg: Any) -> int:
+            return size if not longest else round(size * len(arg) / longest)
+
+        # Strings and lists first - word lists may be cut from a scaled string,
+        # and ints are derived from the scaled lists
+        scaled = list(args)
+        texts = [(base, i) for i, base in enumerate(args) if isinstance(base, str)]
+        for i, arg in enumerate(args):
+            if isinstance(arg, str):
+                scaled[i] = self._string(arg, length_of(arg), rng)
+            elif isinstance(arg, list) and self._substring_source(arg, texts) is None:
+                scaled[i] = self._list(arg, length_of(arg), rng, types[i])
+        for i, arg in enumerate(args):
+            source = self._substring_source(arg, texts) if isinstance(arg, list) else None
+            if source is not None:
+                scaled[i] = self._substrings(arg, scaled[source], length_of(arg), rng)
+        for i, arg in enumerate(args):
+            if isinstance(arg, int) and not isinstance(arg, bool):
+                scaled[i] = self._derive_int(arg, names[i], args, scaled, rng)
+
+        if typed:
+            return self.signature.decode_args(scaled)
+        return tuple(scaled)
+
+    # Argument kinds
+
+    def _string(self, base: str, length: int, rng: Any) -> str:
+        alphabet = sorted(set(base)) or list(DEFAULT_ALPHABET)
+        return "".join(rng.choice(alphabet, size=length).tolist())
+
+    def _substring_source(self, base: List[Any], texts: List[Tuple[str, int]]) -> Optional[int]:
+        """Position of a string argument containing every word of a word list"""
+        if not base or not all(isinstance(word, str) and word for word in base):
+            return None
+        for text, position in texts:
+            if all(word in text for word in base):
+                return position
+        return None
+
+    def _substrings(self, base: List[str], text: str, count: int, rng: Any) -> List[str]:
+        lengths = [len(word) for word in base if len(word) <= len(text)]
+        if not lengths:
+            return [self._string("".join(base), len(word), rng) for word in base]
+        words = []
+        for length in rng.choice(lengths, size=count).tolist():
+            start = int(rng.integers(0, len(text) - length, endpoint=True))
+            words.append(text[start : start + length])
+        return words
+
+    def _list(self, base: List[Any], length: int, rng: Any, type_name: Optional[str]) -> List[Any]:
+        element_type = type_name[:-2] if type_name and type_name.endswith("[]") else None
+        if base and all(isinstance(item, list) for item in base):
+            return self._rows(base, length, rng, element_type)
+        if all(_is_number(item) for item in base):
+            return self._numbers(base, length, rng, element_type)
+        if all(isinstance(item, str) for item in base) and len(set(base)) == len(base):
+            alphabet = "".join(base) or DEFAULT_ALPHABET
+            lengths = [len(word) for word in base] or [1]
+            return [
+                self._string(alphabet, int(n), rng)
+                for n in rng.choice(lengths, size=length).tolist()
+            ]
+        if all(type(item) in (str, bool) for item in base):
+            # Categorical values, e.g. "0"/"1" cells
+            return [base[i] for i in rng.integers(0, len(base), size=length).tolist()]
+        return base  # Mixed or unsupported elements: keep the base value
+
+    def _numbers(
+        self, base: List[Any], length: int, rng: Any, element_type: Optional[str]
+    ) -> List[Any]:
+        floats = any(isinstance(item, float) for item in base) or (
+            element_type is not None and element_type.startswith("float")
+        )
+        low, high = (min(base), max(base)) if base else (0, max(length, 1))
+        distinct = len(base) >= 3 and len(set(base)) == len(base)
+        if floats:
+            values = rng.uniform(low, high, size=length)
+        else:
+            low, high = int(low), int(high)
+            if distinct:
+                high = max(high, low + 2 * length)  # Room for distinct values
+            if element_type is not None and is_fixed_int(element_type):
+                type_low, type_high = int_bounds(element_type)
+                high = min(high, type_high - 1)
+                low = max(min(low, high - 2 * length), type_low)
+                if high - low + 1 < length:
+                    # Too narrow a type (e.g. int8) for length distinct values:
+                    # fall back to values that may repeat
+                    distinct = False
+            if distinct:
+                values = low + rng.choice(high - low + 1, size=length, replace=False)
+            else:
+                values = rng.integers(low, high, size=length, endpoint=True)
+        values = values.tolist()
+        if len(base) >= 3 and base == sorted(base):
+            values.sort()
+        elif len(base) >= 3 and base == sorted(base, reverse=True):
+            values.sort(reverse=True)
+        return values
+
+    def _rows(
+        self, base: List[List[Any]], length: int, rng: Any, element_type: Optional[str]
+    ) -> List[List[Any]]:
+        cells = [item for row in base for item in row]
+        row_lengths = {len(row) for row in base}
+        if not cells or any(isinstance(item, list) for item in cells):
+            # Deeper nesting: repeat the base's rows
+            return [base[i] for i in rng.integers(0, len(base), size=length).tolist()]
+
+        if len(row_lengths) == 1 and row_lengths == {len(base)}:
+            # Square matrix: keep it square with about as many cells as the size
+            side = max(1, round(math.sqrt(length)))
+            shape = [side] * side
+        elif len(row_lengths) == 1:
+            shape = [len(base[0])] * length  # e.g. intervals or edges
+        else:
+            lengths = [len(row) for row in base]
+            shape = rng.choice(lengths, size=length).tolist()
+
+        values = self._list(cells, sum(shape), rng, element_type and element_type + "[]")
+        if cells == sorted(cells) and len(cells) >= 3:
+            values.sort()
+        rows, start = [], 0
+        for row_length in shape:
+            rows.append(values[start : start + row_length])
+            start += row_length
+        if all(row == sorted(row) for row in base) and any(len(row) > 1 for row in base):
+            rows = [sorted(row) for row in rows]  # e.g. [start, end] intervals
+        return rows
+
+    def _derive_int(
+        self,
+        value: int,
+        name: Optional[str],
+        args: Tuple[Any, ...],
+        scaled: List[Any],
+        rng: Any,
+    ) -> int:
+        numeric = [
+            (base, new)
+            for base, new in zip(args, scaled)
+            if isinstance(base, list) and base and all(_is_number(item) for item in base)
+        ]
+        sequences = [
+            (base, new) for base, new in zip(args, scaled) if isinstance(base, (list, str))
+        ]
+        if name in KEPT_NAMES:
+            return value
+        if name in LENGTH_NAMES and sequences:
+            return len(sequences[0][1])
+        for base, new in numeric:
+            if len(new) >= 2 and _is_pair_sum(value, base):
+                first, second = rng.choice(len(new), size=2, replace=False).tolist()
+                return int(new[first] + new[second])
+            if new and value in base:
+                return int(new[int(rng.integers(0, len(new)))])
+        for base, new in sequences:
+            if base and len(base) == value:
+                return len(new)
+        return value
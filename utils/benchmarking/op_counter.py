@@ -0,0 +1,254 @@
+"""
+Operation Counter Module
+========================
+
+Measures an algorithm's cost in operations instead of seconds. The input
+is wrapped in counting proxies before solve() runs:
+
+    list -> CountingList   element reads (indexing, iteration, slices)
+                           and writes (assignment, append, pop, ...)
+    dict -> CountingDict   key lookups (reads) and stores (writes)
+    str  -> CountingStr    character reads; characters are proxies too
+    int, float             scalar proxies
+
+Every proxy counts the comparisons it takes part in (==, <, sorting,
+min/max, `in`) and every time it is hashed - as a dict key or set member,
+including dicts and sets the solution builds itself. Counts depend only
+on the input, so the cost curve they give is the same on a busy shared
+machine as on an idle one.
+
+Values the solution derives from the input (e.g. nums[i] + nums[j]) are
+plain Python objects and are not counted, nor are NumPy arrays, bools and
+other unwrapped types. Counting makes a call far slower, so a run stops
+with OperationLimitExceeded once it exceeds an operation budget.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+# Default operation budget of one counted call
+DEFAULT_MAX_OPERATIONS = 5 * 10**6
+
+
+class OperationLimitExceeded(Exception):
+    """A counted call used more operations than its budget"""
+
+    pass
+
+
+@dataclass
+class OpCounts:
+    """Operations counted during one call"""
+
+    reads: int = 0
+    writes: int = 0
+    comparisons: int = 0
+    hash_lookups: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.reads + self.writes + self.comparisons + self.hash_lookups
+
+    def to_dict(self) -> dict:
+        return {
+            "reads": self.reads,
+            "writes": self.writes,
+            "comparisons": self.comparisons,
+            "hash_lookups": self.hash_lookups,
+            "total": self.total,
+        }
+
+
+# Counts of the call in progress and the operations it has left
+_active = OpCounts()
+_remaining = DEFAULT_MAX_OPERATIONS
+
+
+def _record(kind: str, amount: int = 1) -> None:
+    global _remaining
+    setattr(_active, kind, getattr(_active, kind) + amount)
+    _remaining -= amount
+    if _remaining < 0:
+        raise OperationLimitExceeded(f"More than {_active.total - amount} operations")
+
+
+def _counting_scalar(base: type) -> type:
+    """Subclass of a scalar type that counts its comparisons and hashes"""
+
+    def comparison(name: str) -> Callable:
+        method = getattr(base, name)
+
+        def compare(self, other):
+            _record("comparisons")
+            return method(self, other)
+
+        compare.__name__ = name
+        return compare
+
+    def hash_value(self):
+        _record("hash_lookups")
+        return base.__hash__(self)
+
+    namespace = {
+        name: comparison(name)
+        for name in ("__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__")
+    }
+    namespace["__hash__"] = hash_value
+    namespace["__slots__"] = ()
+    return type(f"Counting{base.__name__.capitalize()}", (base,), namespace)
+
+
+CountingInt = _counting_scalar(int)
+CountingFloat = _counting_scalar(float)
+_CountingStrBase = _counting_scalar(str)
+
+
+class CountingStr(_CountingStrBase):
+    """str that counts character reads, comparisons and hashes"""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        item = str.__getitem__(self, index)
+        _record("reads", len(item))
+        return CountingStr(item)
+
+    def __iter__(self):
+        for char in str.__iter__(self):
+            _record("reads")
+            yield CountingStr(char)
+
+
+class CountingList(list):
+    """list that counts element reads and writes"""
+
+    def __getitem__(self, index):
+        item = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            _record("reads", len(item))
+            return CountingList(item)
+        _record("reads")
+        return item
+
+    def __setitem__(self, index, value):
+        _record("writes", len(value) if isinstance(index, slice) else 1)
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        _record("writes")
+        list.__delitem__(self, index)
+
+    def __iter__(self):
+        for item in list.__iter__(self):
+            _record("reads")
+            yield item
+
+    def __reversed__(self):
+        for item in list.__reversed__(self):
+            _record("reads")
+            yield item
+
+    def copy(self):
+        _record("reads", len(self))
+        return CountingList(self)
+
+    def append(self, value):
+        _record("writes")
+        list.append(self, value)
+
+    def extend(self, values):
+        values = list(values)
+        _record("writes", len(values))
+        list.extend(self, values)
+
+    def insert(self, index, value):
+        _record("writes")
+        list.insert(self, index, value)
+
+    def pop(self, index=-1):
+        _record("writes")
+        return list.pop(self, index)
+
+    def remove(self, value):
+        _record("writes")
+        list.remove(self, value)
+
+
+class CountingDict(dict):
+    """dict that counts key lookups (reads) and stores (writes)"""
+
+    def __getitem__(self, key):
+        _record("reads")
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        _record("reads")
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        _record("reads")
+        return dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        _record("writes")
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        _record("writes")
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        _record("writes")
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        _record("writes")
+        return dict.pop(self, key, *default)
+
+    def __iter__(self):
+        for key in dict.__iter__(self):
+            _record("reads")
+            yield key
+
+
+def instrument(value: Any) -> Any:
+    """Copy of a value with its lists, dicts, strings and numbers replaced by proxies"""
+    kind = type(value)
+    if kind is int:
+        return CountingInt(value)
+    if kind is float:
+        return CountingFloat(value)
+    if kind is str:
+        return CountingStr(value)
+    if kind is list:
+        return CountingList([instrument(item) for item in value])
+    if kind is tuple:
+        return tuple(instrument(item) for item in value)
+    if kind is dict:
+        return CountingDict({instrument(k): instrument(v) for k, v in value.items()})
+    return value
+
+
+def count_operations(
+    func: Callable, args: Tuple[Any, ...], max_operations: int = DEFAULT_MAX_OPERATIONS
+) -> OpCounts:
+    """
+    Count the operations of one call on instrumented arguments
+
+    Args:
+        func: Function to run, e.g. solution.solve
+        args: Its arguments (instrumented copies are passed)
+        max_operations: Operation budget of the call
+
+    Raises:
+        OperationLimitExceeded: If the call needs more than max_operations
+    """
+    global _active, _remaining
+    counted_args = tuple(instrument(arg) for arg in args)
+    outer = (_active, _remaining)
+    _active, _remaining = OpCounts(), max_operations
+    try:
+        func(*counted_args)
+        return _active
+    finally:
+        _active, _remaining = outer
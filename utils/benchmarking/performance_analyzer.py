@@ -7,15 +7,25 @@ including time complexity analysis, memory profiling, and optimization suggestio
 """
 
 import sys
-import time
 import tracemalloc
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import psutil
-from memory_profiler import profile
+
+from utils.benchmarking.bytecode_counter import (
+    DEFAULT_MAX_INSTRUCTIONS,
+    InstructionLimitExceeded,
+    count_instructions,
+    source_files,
+)
+from utils.benchmarking.complexity_fit import ComplexityFit, fit_complexity
+from utils.benchmarking.input_scaler import InputScaler
+from utils.benchmarking.op_counter import OperationLimitExceeded, count_operations
+from utils.benchmarking.timing import Timer, time_call
+from utils.testing.external_data import resolve_input
+from utils.testing.input_guard import fresh_arguments
 
 
 @dataclass
@@ -36,56 +46,96 @@ class PerformanceAnalyzer:
     def __init__(self):
         self.metrics_history: List[PerformanceMetrics] = []
         self.test_sizes = [10, 50, 100, 500, 1000, 5000, 10000]
+        # InputGenerator from the test file's [generators] section, if any
+        self.input_generator = None
+        # Scales the first test case when there is no generator
+        self.input_scaler: Optional[InputScaler] = None
+        # Samples per input size; time_budget is the seconds spent per size
+        self.timer = Timer(warmup=1, repeats=5, time_budget=1.0)
+        # "time" fits run times; "operations" fits counted element operations
+        # (deterministic, independent of machine load - see op_counter)
+        self.cost_metric = "time"
+        self.judge_size = 10**5  # Input size that run time is extrapolated to
+        # Count bytecode instructions (opt-in - tracing is slow); each method
+        # may execute max_instructions over all test cases
+        self.count_bytecode = False
+        self.max_instructions = DEFAULT_MAX_INSTRUCTIONS
+        self.complexity_fit: Optional[ComplexityFit] = None  # From the last analysis
 
     def analyze_time_complexity(self, solution: Any, test_cases: List[Any]) -> str:
         """Analyze time complexity by running tests with different input sizes"""
         if not test_cases:
             return "Unknown - No test cases provided"
 
-        # Generate test cases with different sizes
+        # Time repeated runs at every size of the ladder
         execution_times = []
         input_sizes = []
+        self.complexity_fit = None
+
+        self.input_scaler = InputScaler.for_solution(solution)
+        sizes = self.test_sizes
+        if self.input_generator is not None and self.input_generator.sizes:
+            sizes = self.input_generator.sizes
 
-        for size in self.test_sizes:
+        for size in sizes:
             # Create test case with given size
             test_input = self._generate_test_input(test_cases[0], size)
-
-            # Measure execution time
-            start_time = time.time()
             try:
-                if isinstance(test_input, (list, tuple)):
-                    solution.solve(*test_input)
+                if self.cost_metric == "operations":
+                    times, elapsed = self._count_operations(solution, test_input)
                 else:
-                    solution.solve(test_input)
-                execution_time = time.time() - start_time
-                execution_times.append(execution_time)
-                input_sizes.append(size)
+                    times = self._time_repeats(solution, test_input)
+                    elapsed = min(times)
+            except OperationLimitExceeded:
+                break  # Larger sizes would only need more operations
             except Exception as e:
                 print(f"Error testing size {size}: {e}")
                 break
+            execution_times.extend(times)
+            input_sizes.extend([size] * len(times))
+            if elapsed > self.timer.time_budget:
+                break  # Larger sizes would only take longer
 
-        if len(execution_times) < 2:
+        if len(set(input_sizes)) < 2:
             return "Unknown - Insufficient data"
 
-        # Analyze growth pattern
-        complexity = self._analyze_growth_pattern(input_sizes, execution_times)
-        return complexity
+        try:
+            self.complexity_fit = fit_complexity(input_sizes, execution_times)
+        except ValueError:
+            # Too few sizes to fit - compare the growth of median times instead
+            ladder = sorted(set(input_sizes))
+            medians = [
+                float(np.median([t for n, t in zip(input_sizes, execution_times) if n == size]))
+                for size in ladder
+            ]
+            return self._analyze_growth_pattern(ladder, medians)
+        return self.complexity_fit.describe()
+
+    def _time_repeats(self, solution: Any, test_input: Any) -> List[float]:
+        """Per-call run times of repeated solve() calls on fresh copies of an input"""
+        return self.timer.measure(solution.solve, lambda: fresh_arguments(test_input)).samples
+
+    def _count_operations(self, solution: Any, test_input: Any) -> Tuple[List[float], float]:
+        """Operations of one solve() call (deterministic, so one sample) and its run time"""
+        counts, elapsed = time_call(count_operations, solution.solve, fresh_arguments(test_input))
+        return [float(counts.total)], elapsed
 
     def analyze_space_complexity(self, solution: Any, test_cases: List[Any]) -> str:
         """Analyze space complexity using memory profiling"""
         if not test_cases:
             return "Unknown - No test cases provided"
 
-        # Use tracemalloc for precise memory tracking
-        tracemalloc.start()
-
         try:
-            # Run solution
+            # Copy the input first, so the copy is not counted as the solution's memory
             test_input = test_cases[0].input if hasattr(test_cases[0], "input") else test_cases[0]
-            if isinstance(test_input, (list, tuple)):
-                solution.solve(*test_input)
-            else:
-                solution.solve(test_input)
+            test_input = resolve_input(test_input)
+            args = fresh_arguments(test_input)
+
+            # Use tracemalloc for precise memory tracking
+            tracemalloc.start()
+
+            # Run solution
+            solution.solve(*args)
 
             # Get memory usage
             current, peak = tracemalloc.get_traced_memory()
@@ -118,6 +168,13 @@ class PerformanceAnalyzer:
         time_complexity = self.analyze_time_complexity(solution, test_cases)
         print(f"Time Complexity: {time_complexity}")
 
+        # Instruction counts - a cost metric that does not vary between runs
+        instructions = None
+        if self.count_bytecode:
+            print("\nCounting bytecode instructions...")
+            instructions = self.analyze_instructions(solution, test_cases)
+            print(self._format_instructions(instructions))
+
         # Space complexity analysis
         print("\nAnalyzing space complexity...")
         space_complexity = self.analyze_space_complexity(solution, test_cases)
@@ -134,6 +191,8 @@ class PerformanceAnalyzer:
         # Generate performance report
         analysis_results = {
             "time_complexity": time_complexity,
+            "complexity_fit": None,
+            "instructions": instructions,
             "space_complexity": space_complexity,
             "memory_metrics": memory_metrics,
             "cpu_metrics": cpu_metrics,
@@ -142,25 +201,31 @@ class PerformanceAnalyzer:
             ),
         }
 
+        if self.complexity_fit is not None:
+            judge_cost = self.complexity_fit.predict(self.judge_size)
+            judge_key = "judge_operations" if self.cost_metric == "operations" else "judge_time"
+            analysis_results["complexity_fit"] = dict(
+                self.complexity_fit.to_dict(),
+                metric=self.cost_metric,
+                judge_size=self.judge_size,
+                **{judge_key: judge_cost},
+            )
+
         # Print summary
         self._print_analysis_summary(analysis_results)
 
         return analysis_results
 
-    def _generate_test_input(self, base_test_case: Any, size: int) -> Any:
-        """Generate test input of specified size"""
+    def _generate_test_input(self, base_test_case: Any, size: int) -> Tuple[Any, ...]:
+        """solve() arguments of the given size, from the generator or the scaled base case"""
+        if self.input_generator is not None:
+            return self.input_generator.generate(size)
+
         if hasattr(base_test_case, "input"):
             base_input = base_test_case.input
         else:
             base_input = base_test_case
-
-        # Simple size scaling - override for specific problem types
-        if isinstance(base_input, list):
-            return list(range(size))
-        elif isinstance(base_input, str):
-            return str(size)
-        else:
-            return base_input
+        return (self.input_scaler or InputScaler()).scale(base_input, size)
 
     def _get_input_size(self, test_input: Any) -> int:
         """Get the size of the input for complexity analysis"""
@@ -201,19 +266,50 @@ class PerformanceAnalyzer:
         else:
             return f"O(n^k) where k > 2 - Higher order polynomial"
 
+    def analyze_instructions(
+        self, solution: Any, test_cases: List[Any]
+    ) -> Dict[str, Optional[int]]:
+        """
+        Bytecode instructions solve() and solve_optimized() execute over the test cases
+
+        Only the solution's own code is counted (see bytecode_counter), so the
+        totals are exactly repeatable. A method that exceeds max_instructions
+        or raises has no total (None).
+        """
+        files = source_files(solution)
+        totals: Dict[str, Optional[int]] = {}
+        for name in ("solve", "solve_optimized"):
+            method = getattr(solution, name, None)
+            if method is None:
+                continue
+            total: Optional[int] = 0
+            for test_case in test_cases:
+                test_input = test_case.input if hasattr(test_case, "input") else test_case
+                args = fresh_arguments(resolve_input(test_input))
+                try:
+                    total += count_instructions(method, args, files, self.max_instructions - total)
+                except InstructionLimitExceeded:
+                    print(f"{name}() exceeded {self.max_instructions:,} instructions")
+                    total = None
+                    break
+                except Exception as e:
+                    print(f"Error counting instructions of {name}(): {e}")
+                    total = None
+                    break
+            totals[name] = total
+        return totals
+
     def _profile_memory(self, solution: Any, test_cases: List[Any]) -> Dict[str, float]:
         """Profile memory usage"""
         if not test_cases:
             return {}
 
-        tracemalloc.start()
-
         try:
             test_input = test_cases[0].input if hasattr(test_cases[0], "input") else test_cases[0]
-            if isinstance(test_input, (list, tuple)):
-                solution.solve(*test_input)
-            else:
-                solution.solve(test_input)
+            args = fresh_arguments(resolve_input(test_input))
+
+            tracemalloc.start()
+            solution.solve(*args)
 
             current, peak = tracemalloc.get_traced_memory()
             tracemalloc.stop()
@@ -237,10 +333,7 @@ class PerformanceAnalyzer:
 
         try:
             test_input = test_cases[0].input if hasattr(test_cases[0], "input") else test_cases[0]
-            if isinstance(test_input, (list, tuple)):
-                solution.solve(*test_input)
-            else:
-                solution.solve(test_input)
+            solution.solve(*fresh_arguments(resolve_input(test_input)))
 
             end_cpu = process.cpu_percent()
             return {
@@ -262,7 +355,7 @@ class PerformanceAnalyzer:
         suggestions = []
 
         # Time complexity suggestions
-        if "O(n²)" in time_comp or "O(n^k)" in time_comp:
+        if "O(n²)" in time_comp or "O(n³)" in time_comp or "O(n^k)" in time_comp:
             suggestions.append("Consider using more efficient algorithms (e.g., sorting, hashing)")
             suggestions.append("Look for opportunities to reduce nested loops")
 
@@ -285,6 +378,13 @@ class PerformanceAnalyzer:
 
         return suggestions
 
+    def _format_instructions(self, instructions: Dict[str, Optional[int]]) -> str:
+        counts = [
+            f"{name}() {count:,}" if count is not None else f"{name}() unavailable"
+            for name, count in instructions.items()
+        ]
+        return "Bytecode Instructions: " + ", ".join(counts)
+
     def _print_analysis_summary(self, results: Dict[str, Any]):
         """Print a summary of the analysis results"""
         print("\n" + "=" * 50)
@@ -292,6 +392,19 @@ class PerformanceAnalyzer:
         print("=" * 50)
 
         print(f"Time Complexity: {results['time_complexity']}")
+        fit = results.get("complexity_fit")
+        if fit and fit.get("metric") == "operations":
+            print(
+                f"Estimated operations at n={fit['judge_size']:,}: "
+                f"{fit['judge_operations']:,.0f} ({fit['model']}, c={fit['constant']:.3g})"
+            )
+        elif fit:
+            print(
+                f"Estimated time at n={fit['judge_size']:,}: {fit['judge_time']:.4f}s "
+                f"({fit['model']}, c={fit['constant']:.3g}s)"
+            )
+        if results.get("instructions"):
+            print(self._format_instructions(results["instructions"]))
         print(f"Space Complexity: {results['space_complexity']}")
 
         if "memory_metrics" in results and results["memory_metrics"]:
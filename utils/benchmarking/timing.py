@@ -0,0 +1,212 @@
+"""
+Timing Module
+=============
+
+The measurement core behind every timing in the project (benchmarks,
+solution comparisons, complexity analysis and the timeout simulator).
+
+A measurement times a function on perf_counter_ns in several repeats:
+
+    warmup  - unreported calls that fill caches and size the batch
+    loops   - calls per repeat, scaled up until a repeat lasts at least
+              min_sample_time, so microsecond-level calls are not lost in
+              clock resolution
+    repeats - batches whose per-call times are the reported samples
+
+Arguments for every call are built before the batch starts (solutions
+may modify their input), the garbage collector is paused while a batch
+runs, and the cost of the loop itself - calling a no-op with the same
+arguments - is subtracted from every sample. Samples are summarized as
+min / median / p95 / IQR; the minimum is the least disturbed run and the
+median the most representative one.
+"""
+
+import gc
+import math
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# Arguments of a batch are built up front; cap the memory they may take
+MAX_BATCH_BYTES = 64 * 2**20
+
+
+def _quantile(ordered: Sequence[float], q: float) -> float:
+    """Linearly interpolated quantile of sorted values"""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _noop(*args: Any) -> None:
+    pass
+
+
+def _arguments_size(args: Tuple[Any, ...]) -> int:
+    """Approximate bytes of one set of arguments (containers, not shared items)"""
+    return sum(getattr(arg, "nbytes", 0) or sys.getsizeof(arg) for arg in args)
+
+
+_clock_overhead: Optional[float] = None
+
+
+def clock_overhead() -> float:
+    """Seconds between two back-to-back perf_counter_ns() reads (cached)"""
+    global _clock_overhead
+    if _clock_overhead is None:
+        clock = time.perf_counter_ns
+        deltas = []
+        for _ in range(1000):
+            start = clock()
+            deltas.append(clock() - start)
+        _clock_overhead = min(deltas) / 1e9
+    return _clock_overhead
+
+
+def time_call(func: Callable, *args: Any) -> Tuple[Any, float]:
+    """
+    Time one call, for verdicts that depend on a single run (e.g. a time limit)
+
+    Returns:
+        The call's result and its run time in seconds, less the clock overhead
+    """
+    start = time.perf_counter_ns()
+    result = func(*args)
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+    return result, max(elapsed - clock_overhead(), 0.0)
+
+
+@dataclass
+class TimingStats:
+    """Per-call run times of one measurement"""
+
+    samples: List[float]  # Seconds per call, one per repeat
+    loops: int = 1  # Calls averaged into each sample
+    overhead: float = 0.0  # Seconds per call subtracted as loop overhead
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return _quantile(sorted(self.samples), 0.5)
+
+    @property
+    def p95(self) -> float:
+        return _quantile(sorted(self.samples), 0.95)
+
+    @property
+    def iqr(self) -> float:
+        ordered = sorted(self.samples)
+        return _quantile(ordered, 0.75) - _quantile(ordered, 0.25)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples)
+
+    def describe(self) -> str:
+        return (
+            f"median {self.median:.6f}s (min {self.min:.6f}s, p95 {self.p95:.6f}s, "
+            f"IQR {self.iqr:.6f}s, {len(self.samples)}x{self.loops})"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "iqr": self.iqr,
+            "mean": self.mean,
+            "repeats": len(self.samples),
+            "loops": self.loops,
+        }
+
+
+class Timer:
+    """Repeated, overhead-corrected timing of a function"""
+
+    def __init__(
+        self,
+        warmup: int = 1,
+        repeats: int = 5,
+        min_sample_time: float = 1e-3,
+        max_loops: int = 10000,
+        time_budget: float = 1.0,
+    ):
+        """
+        Args:
+            warmup: Calls before the timed repeats (0 = none; each repeat
+                is then a single call)
+            repeats: Timed batches - one sample each
+            min_sample_time: Seconds a batch should last at least
+            max_loops: Most calls per batch
+            time_budget: Seconds a measurement may take; repeats stop once
+                it is spent (at least one sample is always taken)
+        """
+        self.warmup = warmup
+        self.repeats = max(1, repeats)
+        self.min_sample_time = min_sample_time
+        self.max_loops = max(1, max_loops)
+        self.time_budget = time_budget
+
+    def _run_batch(self, func: Callable, batch: List[Tuple[Any, ...]]) -> float:
+        """Seconds taken by calling func once per argument tuple"""
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            for args in batch:
+                func(*args)
+            return (time.perf_counter_ns() - start) / 1e9
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _loop_overhead(self, make_args: Callable[[], Tuple[Any, ...]], loops: int) -> float:
+        """Seconds per call of the batch loop itself, from no-op batches"""
+        args = make_args()
+        batch = [args] * loops
+        return min(self._run_batch(_noop, batch) for _ in range(3)) / loops
+
+    def measure(
+        self, func: Callable, make_args: Callable[[], Tuple[Any, ...]] = tuple
+    ) -> TimingStats:
+        """
+        Time a function
+
+        Args:
+            func: Function to time, e.g. solution.solve
+            make_args: Builds a fresh argument tuple for one call (called
+                outside the timed region, once per call)
+
+        Returns:
+            TimingStats with one sample per completed repeat
+        """
+        deadline = time.perf_counter() + self.time_budget
+        loops = 1
+        if self.warmup > 0:
+            first = self._run_batch(func, [make_args()])
+            for _ in range(self.warmup - 1):
+                first = min(first, self._run_batch(func, [make_args()]))
+            if first >= self.time_budget:
+                # Too slow to repeat - the warmup run is the only sample
+                return TimingStats([first])
+            if first < self.min_sample_time:
+                loops = math.ceil(self.min_sample_time / max(first, 1e-9))
+                args_bytes = max(_arguments_size(make_args()), 1)
+                loops = max(1, min(loops, self.max_loops, MAX_BATCH_BYTES // args_bytes))
+
+        overhead = self._loop_overhead(make_args, loops)
+        samples = []
+        for _ in range(self.repeats):
+            batch = [make_args() for _ in range(loops)]
+            elapsed = self._run_batch(func, batch)
+            samples.append(max(elapsed / loops - overhead, 0.0))
+            if time.perf_counter() > deadline:
+                break
+        return TimingStats(samples, loops, overhead)
@@ -0,0 +1,182 @@
+"""
+Async Test Runner Module
+========================
+
+asyncio counterpart of TestRunner for embedding the test engine in
+services. Tests are dispatched to worker processes (or to sandboxed
+children when the runner isolates tests) and results are yielded as an
+async iterator, so the event loop is never blocked for the whole run.
+
+Verdicts come from the same TestRunner.run_single_test used by the
+synchronous API. As there, a test whose worker process dies is a runtime
+error and one that hangs its worker past the time limit is a timeout.
+
+Example:
+    runner = AsyncTestRunner(TestRunner(timeout=2.0), concurrency=4)
+    async with contextlib.aclosing(runner.run(solution, cases)) as results:
+        async for index, result in results:
+            ...
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.testing.test_runner import (
+    WORKER_POLL_INTERVAL,
+    PoolWatch,
+    TestResult,
+    TestRunner,
+    init_worker,
+    run_in_worker,
+)
+
+
+class AsyncTestRunner:
+    """Runs test cases concurrently without blocking the event loop"""
+
+    def __init__(self, runner: Optional[TestRunner] = None, concurrency: int = 0):
+        """
+        Args:
+            runner: TestRunner providing limits and verdict logic (its
+                isolate setting picks sandboxed children over a process pool)
+            concurrency: Maximum number of tests in flight (<= 0 means one
+                per CPU core)
+        """
+        self.runner = runner or TestRunner()
+        self.concurrency = concurrency if concurrency > 0 else (multiprocessing.cpu_count() or 1)
+        self._cancel_events: List[threading.Event] = []
+
+    async def run(
+        self, solution: Any, test_cases: Iterable[Any]
+    ) -> AsyncIterator[Tuple[int, TestResult]]:
+        """
+        Run test cases, yielding (index, result) in completion order
+
+        Test cases are taken from the iterable as tests are dispatched, so
+        at most `concurrency` of them are held at a time. Closing the
+        iterator (or cancelling the task consuming it) kills any tests
+        still in flight.
+        """
+        cases = enumerate(test_cases)
+        first = next(cases, None)
+        if first is None:
+            return
+        cases = itertools.chain([first], cases)
+
+        loop = asyncio.get_running_loop()
+        concurrency = self.concurrency
+        if hasattr(test_cases, "__len__"):
+            concurrency = min(concurrency, len(test_cases))
+        cancel = threading.Event()
+        self._cancel_events.append(cancel)
+
+        pool = None
+        executor = None
+        watch = None
+        if self.runner.isolate:
+            # Each thread only waits on its own sandboxed child process
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+        else:
+            watch = PoolWatch(self.runner)
+            pool = multiprocessing.Pool(
+                processes=concurrency,
+                initializer=init_worker,
+                initargs=(self.runner, solution, watch.started),
+            )
+            watch.watch()
+        # Pool tests in flight: index -> (future settled with its result, test case)
+        pending: Dict[int, Tuple[asyncio.Future, Any]] = {}
+
+        def settle(future: asyncio.Future, value: Any, error: bool) -> None:
+            if future.done():
+                return
+            if error:
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+        async def run_one(index: int, test_case: Any) -> Tuple[int, TestResult]:
+            if executor is not None:
+                result = await loop.run_in_executor(
+                    executor,
+                    self.runner.run_single_test_isolated,
+                    solution,
+                    test_case,
+                    None,
+                    cancel,
+                )
+                return index, result
+
+            future = loop.create_future()
+            pending[index] = (future, test_case)
+            pool.apply_async(
+                run_in_worker,
+                ((index, test_case),),
+                callback=lambda value: loop.call_soon_threadsafe(settle, future, value, False),
+                error_callback=lambda exc: loop.call_soon_threadsafe(settle, future, exc, True),
+            )
+            try:
+                _, result = await future
+            finally:
+                del pending[index]
+            watch.finished(index)
+            result.test_case = test_case
+            return index, result
+
+        def settle_lost() -> None:
+            """Settle the futures of tests whose worker died or hung"""
+            test_cases = {index: test_case for index, (_, test_case) in pending.items()}
+            for index, result in watch.lost(test_cases):
+                settle(pending[index][0], (index, result), False)
+
+        def stop_pool() -> None:
+            pool.terminate()
+            pool.join()
+
+        in_flight: Set[asyncio.Future] = set()
+        try:
+            while True:
+                for index, test_case in itertools.islice(cases, concurrency - len(in_flight)):
+                    in_flight.add(asyncio.ensure_future(run_one(index, test_case)))
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(
+                    in_flight,
+                    timeout=WORKER_POLL_INTERVAL if pool is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Workers that died or hung never send a result
+                    settle_lost()
+                for task in done:
+                    yield task.result()
+        finally:
+            cancel.set()
+            for task in in_flight:
+                task.cancel()
+            if pool is not None:
+                # Joining waits for the workers to exit - off the event loop
+                await loop.run_in_executor(None, stop_pool)
+            if executor is not None:
+                executor.shutdown(wait=False)
+            self._cancel_events.remove(cancel)
+
+    async def run_all(self, solution: Any, test_cases: Iterable[Any]) -> List[TestResult]:
+        """Run test cases and return their results in the original order"""
+        results: Dict[int, TestResult] = {}
+        generator = self.run(solution, test_cases)
+        try:
+            async for index, result in generator:
+                results[index] = result
+        finally:
+            await generator.aclose()
+        return [results[index] for index in sorted(results)]
+
+    def cancel(self) -> None:
+        """Kill the sandboxed children of every run in progress"""
+        for event in self._cancel_events:
+            event.set()
@@ -0,0 +1,274 @@
+"""
+Test Case Cache Module
+======================
+
+Compiled cache of decoded test cases. Parsing a large TOML file with the
+pure-Python toml package can dominate start-up, so the decoded TestCase
+objects are stored in a binary file under .dsa_cache/cases and reused by
+later runs until the source file changes.
+
+Cache file layout:
+    magic (8 bytes) | header length (8 bytes, little endian) | header | records
+
+The header is a pickled dict describing the source file (path, mtime,
+size, sha256), the file's other sections ([problem], [generators], ...)
+and the byte offset of every record. Each record is one pickled test case,
+so a single case can be read without decoding the rest (see
+TestCaseStream).
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils.testing.result_cache import PROJECT_ROOT, framework_digest
+
+# A parser returns the file's non-test-case sections and its test cases
+Parser = Callable[[str], Tuple[Dict[str, Any], List[Any]]]
+
+DEFAULT_CASE_CACHE_DIR = PROJECT_ROOT / ".dsa_cache" / "cases"
+
+MAGIC = b"DSACASE\x01"
+_LENGTH = struct.Struct("<Q")
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CaseCache:
+    """On-disk cache of test cases decoded from TOML files"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CASE_CACHE_DIR
+
+    def _path(self, source: Path) -> Path:
+        name = hashlib.sha256(str(source).encode()).hexdigest()
+        return self.cache_dir / f"{name}.bin"
+
+    def _read_header(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    return None
+                (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                header = pickle.loads(f.read(length))
+                header["data_start"] = len(MAGIC) + _LENGTH.size + length
+                return header
+        except (OSError, EOFError, struct.error, pickle.UnpicklingError, AttributeError):
+            return None
+
+    def _write(
+        self,
+        cache_path: Path,
+        header: Dict[str, Any],
+        sections: Dict[str, Any],
+        test_cases: List[Any],
+    ) -> None:
+        records = [pickle.dumps(tc, protocol=pickle.HIGHEST_PROTOCOL) for tc in test_cases]
+        offsets = []
+        position = 0
+        for record in records:
+            offsets.append(position)
+            position += len(record)
+        header = dict(header, sections=sections, offsets=offsets)
+        header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for record in records:
+                f.write(record)
+        os.replace(tmp_path, cache_path)
+
+    def _rewrite_header(
+        self, cache_path: Path, header: Dict[str, Any], source_info: Dict[str, Any]
+    ) -> None:
+        """Record new source metadata, copying the records unchanged"""
+        header_bytes = pickle.dumps(
+            dict(source_info, sections=header["sections"], offsets=header["offsets"]),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f, open(cache_path, "rb") as old:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            old.seek(header["data_start"])
+            shutil.copyfileobj(old, f)
+        os.replace(tmp_path, cache_path)
+
+    def open(self, test_file: str, parse: Parser) -> Tuple[Dict[str, Any], Sequence[Any]]:
+        """
+        Lazily decoded test cases for a file, parsing it only when it changed
+
+        Args:
+            test_file: Path to the source (TOML) file
+            parse: Function decoding the source into its other sections and
+                a list of test cases
+
+        Returns:
+            (sections, test_cases) - test_cases is a TestCaseStream over the
+            compiled file, or the freshly parsed list if the compiled file
+            could not be written
+        """
+        source = Path(test_file).resolve()
+        stat = source.stat()
+        cache_path = self._path(source)
+        header = self._read_header(cache_path)
+
+        source_info = {
+            "source": str(source),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "framework": framework_digest(),
+        }
+        if header is not None and header["framework"] == source_info["framework"]:
+            if header["mtime_ns"] == stat.st_mtime_ns and header["size"] == stat.st_size:
+                return header["sections"], self._stream(cache_path, header)
+
+        # Touched but possibly unchanged - the content hash decides
+        source_info["sha256"] = _file_digest(source)
+        unchanged = (
+            header is not None
+            and header["framework"] == source_info["framework"]
+            and header["sha256"] == source_info["sha256"]
+        )
+        if unchanged:
+            try:
+                self._rewrite_header(cache_path, header, source_info)
+            except OSError:
+                unchanged = False
+
+        if not unchanged:
+            sections, test_cases = parse(test_file)
+            try:
+                self._write(cache_path, source_info, sections, test_cases)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                # Caching is best effort (e.g. a read-only checkout)
+                return sections, test_cases
+
+        header = self._read_header(cache_path)
+        return header["sections"], self._stream(cache_path, header)
+
+    def load(self, test_file: str, parse: Parser) -> Tuple[Dict[str, Any], List[Any]]:
+        """Fully decoded sections and test cases for a file (see open())"""
+        sections, test_cases = self.open(test_file, parse)
+        return sections, list(test_cases)
+
+    @staticmethod
+    def _stream(cache_path: Path, header: Dict[str, Any]) -> "TestCaseStream":
+        return TestCaseStream(
+            cache_path,
+            header["data_start"],
+            header["offsets"],
+            (header["sha256"], header["framework"]),
+        )
+
+    def clear(self) -> int:
+        """Remove every compiled file; returns the number of files removed"""
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.bin"):
+                path.unlink()
+                removed += 1
+        return removed
+
+
+class TestCaseStream:
+    """
+    Read-only sequence of test cases decoded on demand from a compiled file
+
+    Only the most recently accessed case is kept in memory, so suites of
+    any size can be run case by case. The file is memory-mapped on first
+    access and kept mapped: compiled files are replaced, never modified in
+    place, so the mapping stays consistent with the offsets even if the
+    cache is rebuilt meanwhile. Each process (e.g. a pool worker receiving
+    the stream) maps the file itself. A file rebuilt from a changed source
+    before the stream first maps it is refused rather than misread.
+    """
+
+    def __init__(
+        self, cache_path: Path, data_start: int, offsets: List[int], source_digest: Tuple[str, str]
+    ):
+        """
+        Args:
+            source_digest: (sha256, framework digest) from the header the
+                offsets were read from; identifies the records
+        """
+        self.cache_path = Path(cache_path)
+        self.data_start = data_start
+        self.offsets = offsets
+        self.source_digest = source_digest
+        self._last: Optional[Tuple[int, Any]] = None
+        self._map: Optional[mmap.mmap] = None
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            with open(self.cache_path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            header_start = len(MAGIC) + _LENGTH.size
+            try:
+                if mapped[: len(MAGIC)] != MAGIC:
+                    raise ValueError("not a compiled test case file")
+                header_end = header_start + _LENGTH.unpack_from(mapped, len(MAGIC))[0]
+                header = pickle.loads(mapped[header_start:header_end])
+                if (header["sha256"], header["framework"]) != self.source_digest:
+                    raise ValueError("rebuilt")
+            except (ValueError, struct.error, EOFError, pickle.UnpicklingError, KeyError):
+                mapped.close()
+                raise ValueError(f"{self.cache_path} was rebuilt; reopen the test cases")
+            # Same records, though a rewritten header may have moved them
+            self.data_start = header_end
+            self._map = mapped
+        return self._map
+
+    def _record(self, index: int) -> Any:
+        mapped = self._mapped()
+        start = self.data_start + self.offsets[index]
+        end = self.data_start + self.offsets[index + 1] if index + 1 < len(self.offsets) else None
+        return pickle.loads(mapped[start:end])
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError("test case index out of range")
+        if self._last is not None and self._last[0] == index:
+            return self._last[1]
+
+        test_case = self._record(index)
+        self._last = (index, test_case)
+        return test_case
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self.offsets)):
+            yield self._record(index)
+
+    def close(self) -> None:
+        """Unmap the compiled file (it is mapped again on the next access)"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_last"] = None
+        state["_map"] = None
+        return state
@@ -0,0 +1,127 @@
+"""
+Test Case Writer Module
+=======================
+
+Adds test cases (or fields of existing ones) to a problem's TOML file by
+editing its text, so comments, ordering and formatting of the rest of the
+file are left untouched. Values are written in the same style as the
+hand-written files (e.g. [2, 7, 11, 15]).
+"""
+
+import json
+import math
+import re
+from typing import Any, Dict, Optional
+
+_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+_TEST_CASE_HEADER = re.compile(r"^\s*\[\[\s*test_cases\s*\]\]\s*(#.*)?$")
+# Any table header, but not a line of a multi-line array such as "  [1, 2],"
+_TABLE_HEADER = re.compile(r"^\s*\[\[?\s*[A-Za-z_][\w.\-\"' ]*\]\]?\s*(#.*)?$")
+
+
+def _format_key(key: str) -> str:
+    return key if _BARE_KEY.match(key) else json.dumps(key)
+
+
+def format_toml_value(value: Any) -> str:
+    """TOML representation of a test-case value"""
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        value = value.tolist()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "nan"
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    if isinstance(value, str):
+        # JSON string escapes are valid TOML basic-string escapes
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(format_toml_value(item) for item in value) + "]"
+    if isinstance(value, dict):
+        items = ", ".join(f"{_format_key(k)} = {format_toml_value(v)}" for k, v in value.items())
+        return "{ " + items + " }" if items else "{}"
+    raise TypeError(f"Cannot write {type(value).__name__} values to a test file")
+
+
+def format_test_case(fields: Dict[str, Any], comment: Optional[str] = None) -> str:
+    """One [[test_cases]] entry, with an optional comment line above it"""
+    lines = []
+    if comment:
+        lines.extend(f"# {line}" for line in comment.splitlines())
+    lines.append("[[test_cases]]")
+    for key, value in fields.items():
+        if value is not None:
+            lines.append(f"{_format_key(key)} = {format_toml_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def append_test_case(test_file: str, fields: Dict[str, Any], comment: Optional[str] = None) -> None:
+    """
+    Append a [[test_cases]] entry to a TOML file
+
+    Args:
+        test_file: Problem TOML file
+        fields: Keys and values of the entry, in the order to write them
+            (None values are skipped)
+        comment: Optional comment written above the entry
+    """
+    entry = format_test_case(fields, comment)
+    with open(test_file, "r+") as f:
+        content = f.read()
+        separator = "\n" if content.endswith("\n") else "\n\n"
+        if not content:
+            separator = ""
+        f.write(separator + entry)
+
+
+def add_test_case_fields(test_file: str, updates: Dict[int, Dict[str, Any]]) -> None:
+    """
+    Add fields to existing [[test_cases]] entries
+
+    Args:
+        test_file: Problem TOML file
+        updates: Fields to add, keyed by the entry's position among the
+            file's [[test_cases]] entries
+
+    Raises:
+        ValueError: If the file has fewer entries than a position requires
+    """
+    with open(test_file, "r") as f:
+        lines = f.read().splitlines(keepends=True)
+
+    # Last key line of every entry, before trailing blank lines and comments
+    insert_after = []
+    current = None
+    for number, line in enumerate(lines):
+        if _TEST_CASE_HEADER.match(line):
+            current = number
+            insert_after.append(number)
+        elif _TABLE_HEADER.match(line):
+            current = None
+        elif current is not None and line.strip() and not line.lstrip().startswith("#"):
+            insert_after[-1] = number
+
+    missing = [index for index in updates if index >= len(insert_after)]
+    if missing:
+        raise ValueError(f"{test_file} has no test case #{missing[0] + 1}")
+
+    # Insert bottom-up so earlier line numbers stay valid
+    for index in sorted(updates, reverse=True):
+        fields = updates[index]
+        position = insert_after[index] + 1
+        if not lines[position - 1].endswith("\n"):
+            lines[position - 1] += "\n"
+        new_lines = [
+            f"{_format_key(key)} = {format_toml_value(value)}\n"
+            for key, value in fields.items()
+            if value is not None
+        ]
+        lines[position:position] = new_lines
+
+    with open(test_file, "w") as f:
+        f.writelines(lines)
@@ -0,0 +1,311 @@
+"""
+Comparators Module
+==================
+
+Decides whether a solution's output matches the expected output. Problems
+whose answers are valid in any order declare a comparator in their TOML
+file, either for the whole problem or per test case:
+
+    [problem]
+    comparator = "unordered_nested"
+
+    [[test_cases]]
+    comparator = { mode = "float", tolerance = 1e-6 }
+
+Modes:
+    exact             - plain equality (the default)
+    unordered         - same elements in any order, e.g. [[0, 1], [1, 0]]
+    unordered_nested  - unordered list of unordered groups, e.g. 3Sum triplets
+    float             - numbers equal within a tolerance, element-wise
+
+Unordered modes canonicalize both sides into hashable values and compare
+them as multisets, which takes linear time instead of sorting or pairwise
+matching.
+
+Huge answers need not be stored in the test file: a test case can carry
+an expected_digest (from output_digest) and optionally expected_length
+instead of the literal expected value.
+"""
+
+import hashlib
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+COMPARATOR_MODES = ("exact", "unordered", "unordered_nested", "float")
+DEFAULT_TOLERANCE = 1e-9
+
+# Elements encoded per hashing step, so outputs are never serialized whole
+DIGEST_CHUNK = 4096
+# Longest value representation shown in a mismatch message
+PREVIEW_LENGTH = 200
+
+ComparatorSpec = Union[None, str, Dict[str, Any]]
+
+
+def canonical(value: Any) -> Any:
+    """Hashable form of a value with its order preserved"""
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(canonical(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(canonical(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, canonical(item)) for key, item in value.items())
+    return value
+
+
+def canonical_group(value: Any) -> Any:
+    """Hashable form of a group whose own order does not matter"""
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        try:
+            group = tuple(sorted(value))
+            hash(group)
+            return group
+        except TypeError:
+            return frozenset(Counter(canonical(item) for item in value).items())
+    return canonical(value)
+
+
+def _as_list(value: Any) -> Any:
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def exact_match(actual: Any, expected: Any) -> bool:
+    if hasattr(actual, "tolist") and not hasattr(expected, "tolist"):
+        actual = actual.tolist()
+    result = actual == expected
+    if isinstance(result, bool):
+        return result
+    try:
+        return bool(result)  # e.g. numpy scalars
+    except ValueError:
+        return False  # Element-wise array comparison - shapes differ
+
+
+def _multiset(items: Any) -> Counter:
+    try:
+        return Counter(items)  # Hashable elements need no canonical form
+    except TypeError:
+        return Counter(map(canonical, items))
+
+
+def unordered_match(actual: Any, expected: Any) -> bool:
+    actual, expected = _as_list(actual), _as_list(expected)
+    if not isinstance(actual, (list, tuple)) or not isinstance(expected, (list, tuple)):
+        return exact_match(actual, expected)
+    if len(actual) != len(expected):
+        return False
+    return _multiset(actual) == _multiset(expected)
+
+
+def unordered_nested_match(actual: Any, expected: Any) -> bool:
+    actual, expected = _as_list(actual), _as_list(expected)
+    if not isinstance(actual, (list, tuple)) or not isinstance(expected, (list, tuple)):
+        return exact_match(actual, expected)
+    if len(actual) != len(expected):
+        return False
+    return Counter(map(canonical_group, actual)) == Counter(map(canonical_group, expected))
+
+
+def float_match(actual: Any, expected: Any, tolerance: float = DEFAULT_TOLERANCE) -> bool:
+    actual, expected = _as_list(actual), _as_list(expected)
+    if isinstance(expected, (list, tuple)):
+        if not isinstance(actual, (list, tuple)) or len(actual) != len(expected):
+            return False
+        return all(float_match(a, e, tolerance) for a, e in zip(actual, expected))
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return math.isclose(actual, expected, rel_tol=tolerance, abs_tol=tolerance)
+    return actual == expected
+
+
+def _mode(spec: ComparatorSpec) -> str:
+    if spec is None:
+        return "exact"
+    return spec.get("mode", "exact") if isinstance(spec, dict) else spec
+
+
+def _plain(value: Any) -> Any:
+    """Python value of a NumPy scalar, for encoding"""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def _encode(value: Any) -> bytes:
+    # json renders tuples like lists, matching how equal outputs compare
+    return json.dumps(value, separators=(",", ":"), default=_plain).encode()
+
+
+def _chunks(value: Any):
+    """Successive lists of elements of a sequence"""
+    for start in range(0, len(value), DIGEST_CHUNK):
+        chunk = value[start : start + DIGEST_CHUNK]
+        yield chunk.tolist() if hasattr(chunk, "tolist") else list(chunk)
+
+
+def _item_hash(value: Any) -> int:
+    return int.from_bytes(hashlib.sha256(_encode(value)).digest(), "big")
+
+
+def _multiset_hash(items: Any, nested: bool = False) -> int:
+    """
+    Order-independent hash of a sequence's elements: the sum of their
+    hashes, so no ordering (or sorting) of the elements is needed. With
+    nested, list elements are groups hashed the same way.
+    """
+    total = 0
+    for chunk in _chunks(items):
+        for item in chunk:
+            if nested and isinstance(item, (list, tuple)):
+                group = _multiset_hash(item).to_bytes(32, "big")
+                total += int.from_bytes(hashlib.sha256(b"group:" + group).digest(), "big")
+            else:
+                total += _item_hash(item)
+    return total % (1 << 256)
+
+
+def validate_comparator(spec: ComparatorSpec, digest: bool = False) -> None:
+    """
+    Check a comparator declaration up front
+
+    Args:
+        spec: Comparator declaration (see get_comparator)
+        digest: Whether it is used with an expected_digest
+
+    Raises:
+        ValueError: For an unknown mode, or the float comparator with a digest
+    """
+    get_comparator(spec)
+    if digest and _mode(spec) == "float":
+        raise ValueError("The float comparator cannot be used with expected_digest")
+
+
+def output_digest(value: Any, spec: ComparatorSpec = None) -> str:
+    """
+    Digest of an output under a comparator, computed incrementally
+
+    Unordered modes combine per-element hashes by addition, so the digest
+    does not depend on element order (nor, for unordered_nested, on the
+    order within groups). NumPy arrays and scalars digest like the
+    equivalent Python values.
+
+    Raises:
+        ValueError: For the float comparator, which has no exact digest
+    """
+    validate_comparator(spec, digest=True)
+    mode = _mode(spec)
+
+    if hasattr(value, "item") and getattr(value, "ndim", 1) == 0:
+        value = value.item()  # numpy scalar
+    hasher = hashlib.sha256(mode.encode() + b":")
+    if not isinstance(value, (list, tuple)) and not hasattr(value, "tolist"):
+        hasher.update(_encode(value))
+    elif mode == "exact":
+        for chunk in _chunks(value):
+            hasher.update(_encode(chunk))
+    else:
+        total = _multiset_hash(value, nested=mode == "unordered_nested")
+        hasher.update(len(value).to_bytes(8, "big") + total.to_bytes(32, "big"))
+    return f"sha256:{hasher.hexdigest()}"
+
+
+@dataclass(frozen=True)
+class ExpectedDigest:
+    """Expected output stored as a digest (and length) instead of a value"""
+
+    digest: str
+    length: Optional[int] = None
+
+    def matches(self, actual: Any, spec: ComparatorSpec = None) -> bool:
+        if self.length is not None and _length(actual) != self.length:
+            return False
+        return output_digest(actual, spec) == self.digest
+
+    def describe(self, actual: Any, spec: ComparatorSpec = None) -> str:
+        """Mismatch summary - the expected value itself is not available"""
+        length = _length(actual)
+        if self.length is not None and length != self.length:
+            return (
+                f"Output length {length} != expected length {self.length}, "
+                f"Got: {_preview(actual)}"
+            )
+        return (
+            f"Output digest {output_digest(actual, spec)} != expected {self.digest}, "
+            f"Got: {_preview(actual)}"
+        )
+
+
+def _length(value: Any) -> Optional[int]:
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def _preview(value: Any) -> str:
+    text = repr(_as_list(value))
+    if len(text) > PREVIEW_LENGTH:
+        text = f"{text[:PREVIEW_LENGTH]}... ({_length(value)} items)"
+    return text
+
+
+def describe_mismatch(actual: Any, expected: Any, spec: ComparatorSpec = None) -> str:
+    """
+    Short explanation of a wrong answer
+
+    Large values are truncated; for ordered sequences the first differing
+    index is located.
+    """
+    if isinstance(expected, ExpectedDigest):
+        return expected.describe(actual, spec)
+
+    message = f"Expected: {_preview(expected)}, Got: {_preview(actual)}"
+    actual, expected = _as_list(actual), _as_list(expected)
+    if isinstance(actual, (list, tuple)) and isinstance(expected, (list, tuple)):
+        if len(actual) != len(expected):
+            message += f" (length {len(actual)} != {len(expected)})"
+        elif _mode(spec) == "exact":
+            for index, (got, want) in enumerate(zip(actual, expected)):
+                if got != want:
+                    message += f" (first difference at index {index}: {got!r} != {want!r})"
+                    break
+    return message
+
+
+def get_comparator(spec: ComparatorSpec = None) -> Callable[[Any, Any], bool]:
+    """
+    Comparison function for a comparator declaration
+
+    Args:
+        spec: None or "exact", a mode name, or a table with a "mode" key
+            and, for "float", an optional "tolerance"
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    if spec is None:
+        return exact_match
+    options = spec if isinstance(spec, dict) else {"mode": spec}
+    mode = options.get("mode", "exact")
+
+    if mode == "exact":
+        return exact_match
+    if mode == "unordered":
+        return unordered_match
+    if mode == "unordered_nested":
+        return unordered_nested_match
+    if mode == "float":
+        tolerance = float(options.get("tolerance", DEFAULT_TOLERANCE))
+        return lambda actual, expected: float_match(actual, expected, tolerance)
+    raise ValueError(f"Unknown comparator: {mode!r} (expected one of {COMPARATOR_MODES})")
+
+
+def outputs_match(spec: ComparatorSpec, actual: Any, expected: Any) -> bool:
+    """Whether actual matches expected under a comparator declaration"""
+    if isinstance(expected, ExpectedDigest):
+        return expected.matches(actual, spec)
+    return get_comparator(spec)(actual, expected)
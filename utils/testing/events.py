@@ -0,0 +1,90 @@
+"""
+Test Events Module
+==================
+
+Builds the JSON-serializable events emitted by TestRunner while a run is
+in progress, and writes them as NDJSON (one JSON object per line) so CI
+wrappers and dashboards can consume results incrementally.
+
+Event types:
+    run_start    - total test count and worker count
+    test_start   - a test was started (in parallel runs, picked up by a worker)
+    test_finish  - verdict, timing and memory of one test
+    run_finish   - pass/fail totals and wall time of the whole run, plus
+                   why and how many tests were skipped if it stopped early
+    analysis     - performance analysis results (BaseSolution.run_all)
+    benchmark    - benchmark results (BaseSolution.run_all)
+"""
+
+import json
+import time
+from typing import IO, Any, Dict, List, Optional
+
+
+def _description(test_case: Any) -> str:
+    return getattr(test_case, "description", "") or ""
+
+
+def run_start_event(total: int, workers: int) -> Dict[str, Any]:
+    """Event emitted before the first test runs"""
+    return {"event": "run_start", "time": time.time(), "total": total, "workers": workers}
+
+
+def test_start_event(index: int, test_case: Any) -> Dict[str, Any]:
+    """Event emitted when a test starts"""
+    return {
+        "event": "test_start",
+        "time": time.time(),
+        "index": index,
+        "description": _description(test_case),
+    }
+
+
+def test_finish_event(index: int, result: Any) -> Dict[str, Any]:
+    """Event emitted when a test finishes"""
+    return {
+        "event": "test_finish",
+        "time": time.time(),
+        "index": index,
+        "description": _description(result.test_case),
+        "verdict": result.verdict,
+        "passed": result.passed,
+        "execution_time": result.execution_time,
+        "memory_usage": result.memory_usage,
+        "baseline_rss": result.baseline_rss,
+        "peak_rss": result.peak_rss,
+        "timeout_occurred": result.timeout_occurred,
+        "error_message": result.error_message,
+        "cached": result.cached,
+        "input_mutated": result.input_mutated,
+    }
+
+
+def run_finish_event(
+    results: List[Any],
+    duration: float,
+    not_run: int = 0,
+    stop_reason: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Event emitted after the last test (or when the run stops early)"""
+    verdicts: Dict[str, int] = {}
+    for result in results:
+        verdicts[result.verdict] = verdicts.get(result.verdict, 0) + 1
+    return {
+        "event": "run_finish",
+        "time": time.time(),
+        "total": len(results),
+        "passed": sum(1 for r in results if r.passed),
+        "cached": sum(1 for r in results if r.cached),
+        "verdicts": verdicts,
+        "duration": duration,
+        "not_run": not_run,
+        "stop_reason": stop_reason,
+    }
+
+
+def write_event(event: Dict[str, Any], stream: IO[str]) -> None:
+    """Write one event as a JSON line and flush it straight away"""
+    # default=str keeps non-JSON values (e.g. numpy scalars) from aborting a run
+    stream.write(json.dumps(event, default=str) + "\n")
+    stream.flush()
@@ -0,0 +1,141 @@
+"""
+Golden Output Module
+====================
+
+Fills in missing expected outputs by running a trusted implementation
+(e.g. solve, while solve_optimized is under development) over every test
+case without an expected value. Cases are computed in parallel worker
+processes, and outputs longer than a threshold are stored as an
+expected_digest and expected_length instead of the literal value (see
+utils.testing.comparators).
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.testing.case_writer import format_toml_value
+from utils.testing.comparators import output_digest
+from utils.testing.external_data import resolve_input
+
+# Outputs with more elements than this are written as digests
+DIGEST_THRESHOLD = 10000
+
+# Per-process state for golden workers (see _init_worker)
+_worker_solution: Any = None
+_worker_reference: Optional[str] = None
+
+
+def _init_worker(solution: Any, reference: str) -> None:
+    global _worker_solution, _worker_reference
+    _worker_solution = solution
+    _worker_reference = reference
+
+
+def _golden_fields(task: Tuple[int, Any, int]) -> Tuple[int, Dict[str, Any], str]:
+    """Expected-output fields for one test case, or an error message"""
+    index, test_case, digest_threshold = task
+    try:
+        value = resolve_input(test_case.input)
+        method = getattr(_worker_solution, _worker_reference)
+        if isinstance(value, (list, tuple)):
+            output = method(*value)
+        else:
+            output = method(value)
+    except Exception as e:
+        return index, {}, f"{type(e).__name__}: {e}"
+
+    if hasattr(output, "tolist"):
+        output = output.tolist()
+    comparator = getattr(test_case, "comparator", None)
+    if isinstance(output, (list, tuple)) and len(output) > digest_threshold:
+        try:
+            fields = {
+                "expected_digest": output_digest(output, comparator),
+                "expected_length": len(output),
+            }
+            return index, fields, ""
+        except ValueError:
+            pass  # The float comparator has no digest - keep the value
+
+    if output is None:
+        return index, {}, "returned None, which a TOML file cannot store"
+    try:
+        format_toml_value(output)
+    except TypeError as e:
+        return index, {}, str(e)
+    return index, {"expected": output}, ""
+
+
+@dataclass
+class GoldenOutput:
+    """Expected-output fields computed for one test case"""
+
+    index: int  # Position of the case in the test file
+    fields: Dict[str, Any]  # expected, or expected_digest and expected_length
+    error: str = ""  # Why no output could be recorded
+
+
+class GoldenGenerator:
+    """Computes expected outputs of test cases with a reference implementation"""
+
+    def __init__(
+        self,
+        reference: str = "solve",
+        workers: int = 0,
+        digest_threshold: int = DIGEST_THRESHOLD,
+    ):
+        """
+        Args:
+            reference: Name of the trusted solution method
+            workers: Worker processes (0 = one per CPU)
+            digest_threshold: Outputs with more elements are stored as digests
+        """
+        self.reference = reference
+        self.workers = workers or os.cpu_count() or 1
+        self.digest_threshold = digest_threshold
+
+    def missing(self, test_cases: Sequence[Any]) -> List[int]:
+        """Indices of the test cases without an expected output"""
+        return [
+            index
+            for index, test_case in enumerate(test_cases)
+            if getattr(test_case, "expected", None) is None
+        ]
+
+    def generate(
+        self, solution: Any, test_cases: Sequence[Any], indices: Optional[List[int]] = None
+    ) -> List[GoldenOutput]:
+        """
+        Run the reference over test cases, in parallel
+
+        Args:
+            solution: Solution instance providing the reference method
+            test_cases: All test cases of the file
+            indices: Cases to compute (default: those lacking an expected output)
+
+        Returns:
+            One GoldenOutput per computed case, in file order
+        """
+        if not hasattr(solution, self.reference):
+            raise ValueError(f"{type(solution).__name__} has no method {self.reference!r}")
+        if indices is None:
+            indices = self.missing(test_cases)
+        tasks = [(index, test_cases[index], self.digest_threshold) for index in indices]
+        if not tasks:
+            return []
+
+        workers = min(self.workers, len(tasks))
+        if workers <= 1:
+            _init_worker(solution, self.reference)
+            outputs = [_golden_fields(task) for task in tasks]
+        else:
+            from utils.testing.sandbox import get_context
+
+            with get_context().Pool(
+                workers, initializer=_init_worker, initargs=(solution, self.reference)
+            ) as pool:
+                outputs = list(pool.imap_unordered(_golden_fields, tasks))
+
+        outputs.sort(key=lambda output: output[0])
+        return [GoldenOutput(index, fields, error) for index, fields, error in outputs]
@@ -0,0 +1,86 @@
+"""
+Input Guard Module
+==================
+
+Hands every solve() call its own copy of the test input. Solutions such as
+ThreeSum.solve sort their input in place; without a copy, every later run
+over the same test case (the benchmark, the complexity analysis) would
+time a different, already sorted workload.
+
+Copies are made before the timed region starts. Comparing a copy with the
+original after the call tells which solutions modify their input.
+
+Memory-mapped external inputs are not copied: resolve_input() opens a
+fresh copy-on-write map for every run, so writes never reach the file or
+the next run, and copying would read the whole file into RAM. They are
+not checked for mutation either, which would read the whole file too.
+"""
+
+import copy
+from typing import Any, List, Tuple
+
+# Values that can be shared between calls as they are
+IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None), range})
+
+
+def as_arguments(test_input: Any) -> Tuple[Any, ...]:
+    """solve() arguments of a test input (lists and tuples are unpacked)"""
+    if isinstance(test_input, (list, tuple)):
+        return tuple(test_input)
+    return (test_input,)
+
+
+def _is_memory_map(value: Any) -> bool:
+    if not hasattr(value, "dtype"):
+        return False
+    import numpy as np
+
+    return isinstance(value, np.memmap)
+
+
+def copy_value(value: Any) -> Any:
+    """Copy of a value that shares nothing mutable with the original"""
+    kind = type(value)
+    if kind in IMMUTABLE_TYPES:
+        return value
+    if kind is list:
+        # Flat lists of numbers or strings (the common case) copy in C
+        if set(map(type, value)) <= IMMUTABLE_TYPES:
+            return value.copy()
+        return [copy_value(item) for item in value]
+    if kind is tuple:
+        items = tuple(copy_value(item) for item in value)
+        return value if all(a is b for a, b in zip(items, value)) else items
+    if _is_memory_map(value):
+        return value  # Already a private copy-on-write map for this run
+    if hasattr(value, "dtype") and hasattr(value, "copy"):
+        return value.copy()  # NumPy arrays
+    return copy.deepcopy(value)  # array.array, dict, set, bytearray, ...
+
+
+def fresh_arguments(test_input: Any) -> Tuple[Any, ...]:
+    """solve() arguments with every mutable argument copied"""
+    return tuple(copy_value(value) for value in as_arguments(test_input))
+
+
+def _equal(original: Any, used: Any) -> bool:
+    if hasattr(original, "dtype") and hasattr(original, "shape"):
+        import numpy as np
+
+        try:
+            return bool(np.array_equal(original, used, equal_nan=True))
+        except TypeError:  # equal_nan needs a numeric dtype
+            return bool(np.array_equal(original, used))
+    try:
+        return bool(original == used)
+    except (ValueError, TypeError):
+        return False
+
+
+def mutated_arguments(original: Tuple[Any, ...], used: Tuple[Any, ...]) -> List[int]:
+    """Positions of the copied arguments a solve() call has modified"""
+    return [
+        position
+        for position, (before, after) in enumerate(zip(original, used))
+        if before is not after and not _is_memory_map(before) and not _equal(before, after)
+    ]
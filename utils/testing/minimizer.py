@@ -0,0 +1,283 @@
+"""
+Failing Input Minimizer Module
+==============================
+
+Shrinks a failing test case by delta debugging (ddmin). Chunks of the
+list, string and word-list arguments are removed for as long as the
+solution still fails with the same verdict, halving the chunk size
+whenever no removal reproduces the failure. Each round's candidate
+reductions are checked in parallel worker processes.
+
+A reduced input needs an expected output of its own, so wrong answers can
+only be minimized against a reference implementation (e.g. a trusted
+solve_optimized). Timeouts, crashes and memory failures reproduce without
+one.
+"""
+
+import copy
+import math
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from utils.testing.comparators import canonical
+from utils.testing.external_data import resolve_input
+from utils.testing.input_guard import as_arguments
+from utils.testing.test_runner import TestRunner, Verdict
+
+# Extra wall-clock seconds per candidate before a hung worker is abandoned
+# and the candidate counted as a timeout
+HANG_GRACE = 1.0
+
+# Upper bound on candidate runs per minimization
+DEFAULT_MAX_CHECKS = 2000
+
+# Verdict of a candidate the reference implementation rejects, e.g. an
+# empty input outside the problem's constraints
+INVALID = "INVALID"
+
+# Start of the description of every minimized case, so they can be told apart
+MINIMIZED_PREFIX = "Minimized from "
+
+# Per-process state for minimizer workers (see _init_worker)
+_worker_runner: Optional[TestRunner] = None
+_worker_solution: Any = None
+_worker_reference: Optional[str] = None
+
+
+def _init_worker(runner: TestRunner, solution: Any, reference: Optional[str]) -> None:
+    global _worker_runner, _worker_solution, _worker_reference
+    _worker_runner = runner
+    _worker_solution = solution
+    _worker_reference = reference
+    # Tracebacks of crashing candidates are expected and only noise here
+    devnull = open(os.devnull, "w")
+    sys.stdout = devnull
+    sys.stderr = devnull
+
+
+def _check_candidate(test_case: Any, use_reference: bool) -> str:
+    """Verdict of the solution on one candidate"""
+    if use_reference:
+        try:
+            args = copy.deepcopy(test_case.input)
+            test_case.expected = getattr(_worker_solution, _worker_reference)(*args)
+        except Exception:
+            return INVALID
+    return _worker_runner.run_single_test(_worker_solution, test_case).verdict
+
+
+def _reducible(value: Any) -> bool:
+    return isinstance(value, (list, str))
+
+
+def input_key(test_input: Any) -> Any:
+    """Hashable form of a test input's arguments, to recognize repeated inputs"""
+    return canonical(as_arguments(resolve_input(test_input)))
+
+
+def input_size(args: Sequence[Any]) -> int:
+    """Total length of the reducible arguments"""
+    return sum(len(value) for value in args if _reducible(value))
+
+
+@dataclass
+class Minimization:
+    """Outcome of minimizing one failing test case"""
+
+    test_case: Any  # Minimal failing case (expected from the reference, if any)
+    verdict: str  # The failure that was preserved
+    original_size: int  # Total length of the reducible arguments before...
+    size: int  # ...and after shrinking
+    checks: int  # Candidate runs performed
+
+
+class FailureMinimizer:
+    """Delta-debugging shrinker for failing test cases"""
+
+    def __init__(
+        self,
+        runner: Optional[TestRunner] = None,
+        reference: Optional[str] = None,
+        workers: int = 0,
+        max_checks: int = DEFAULT_MAX_CHECKS,
+    ):
+        """
+        Args:
+            runner: Runner whose limits decide verdicts (default: TestRunner())
+            reference: Name of the trusted method computing expected outputs
+                of reduced inputs, e.g. "solve_optimized"
+            workers: Worker processes checking candidates (0 = one per CPU)
+            max_checks: Stop shrinking after this many candidate runs
+        """
+        self.runner = runner or TestRunner()
+        self.reference = reference
+        self.workers = workers or os.cpu_count() or 1
+        self.max_checks = max_checks
+        self.checks = 0
+        self._pool: Any = None
+        self._pool_args: Tuple[Any, ...] = ()
+
+    # Worker pool
+
+    def _get_pool(self) -> Any:
+        if self._pool is None:
+            from utils.testing.sandbox import get_context
+
+            self._pool = get_context().Pool(
+                self.workers, initializer=_init_worker, initargs=self._pool_args
+            )
+        return self._pool
+
+    def _close_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _verdicts(self, test_cases: List[Any], use_reference: bool) -> List[str]:
+        """Check candidates in parallel, abandoning any that hang"""
+        pool = self._get_pool()
+        pending = [
+            pool.apply_async(_check_candidate, (test_case, use_reference))
+            for test_case in test_cases
+        ]
+        self.checks += len(test_cases)
+
+        limit = max(self.runner.get_timeout(tc) for tc in test_cases)
+        if use_reference:
+            limit *= 2
+        rounds = math.ceil(len(test_cases) / self.workers)
+        deadline = time.monotonic() + rounds * (limit + HANG_GRACE)
+
+        verdicts = []
+        hung = False
+        for result in pending:
+            try:
+                verdicts.append(result.get(timeout=max(0.0, deadline - time.monotonic())))
+            except multiprocessing.TimeoutError:
+                verdicts.append(Verdict.TIME_LIMIT_EXCEEDED)
+                hung = True
+            except Exception:
+                verdicts.append(Verdict.RUNTIME_ERROR)  # e.g. an unpicklable output
+        if hung:
+            self._close_pool()  # Kills the stuck workers
+        return verdicts
+
+    # Shrinking
+
+    def _candidate(self, test_case: Any, args: Tuple[Any, ...]) -> Any:
+        candidate = copy.copy(test_case)
+        candidate.input = args
+        candidate.expected = None
+        return candidate
+
+    def _first_failure(
+        self, test_case: Any, candidates: List[Tuple[Any, ...]], verdict: str
+    ) -> Optional[int]:
+        """Index of the first candidate failing with the given verdict"""
+        budget = self.max_checks - self.checks
+        if budget <= 0:
+            return None
+        candidates = candidates[:budget]
+        use_reference = verdict == Verdict.WRONG_ANSWER
+        verdicts = self._verdicts(
+            [self._candidate(test_case, args) for args in candidates], use_reference
+        )
+        for index, candidate_verdict in enumerate(verdicts):
+            if candidate_verdict == verdict:
+                return index
+        return None
+
+    def _ddmin(
+        self, test_case: Any, args: Tuple[Any, ...], position: int, verdict: str
+    ) -> Tuple[Any, ...]:
+        """Shrink the argument at one position, keeping the others fixed"""
+        items = args[position]
+        chunks = 2
+        while items and self.checks < self.max_checks:
+            chunks = min(chunks, len(items))
+            bounds = [
+                (len(items) * i // chunks, len(items) * (i + 1) // chunks) for i in range(chunks)
+            ]
+            # With two chunks each subset is the other chunk's complement
+            subsets = [items[start:end] for start, end in bounds] if chunks > 2 else []
+            complements = [items[:start] + items[end:] for start, end in bounds]
+            reductions = subsets + complements
+
+            candidates = [
+                args[:position] + (reduced,) + args[position + 1 :] for reduced in reductions
+            ]
+            index = self._first_failure(test_case, candidates, verdict)
+            if index is None:
+                if chunks >= len(items):
+                    break
+                chunks = min(chunks * 2, len(items))
+                continue
+
+            items = reductions[index]
+            args = candidates[index]
+            chunks = 2 if index < len(subsets) else max(chunks - 1, 2)
+        return args
+
+    def minimize(self, solution: Any, test_case: Any) -> Optional[Minimization]:
+        """
+        Shrink a failing test case
+
+        Args:
+            solution: Solution instance whose solve() fails the case
+            test_case: The failing test case
+
+        Returns:
+            The minimization, or None if the case does not fail
+
+        Raises:
+            ValueError: If the case is a wrong answer and no reference
+                implementation was given
+        """
+        value = resolve_input(test_case.input)
+        values = value if isinstance(value, (list, tuple)) else (value,)
+        # Memory-mapped arrays become plain lists so they can be shrunk and saved
+        args = tuple(v.tolist() if hasattr(v, "tolist") else v for v in values)
+        original = copy.copy(test_case)
+        original.input = args
+
+        self.checks = 0
+        self._pool_args = (self.runner, solution, self.reference)
+        try:
+            verdict = self._verdicts([original], use_reference=False)[0]
+            if verdict == Verdict.ACCEPTED:
+                return None
+            if verdict == Verdict.WRONG_ANSWER and self.reference is None:
+                raise ValueError(
+                    "Wrong answers can only be minimized against a reference implementation"
+                )
+
+            shrunk = args
+            while self.checks < self.max_checks:
+                before = input_size(shrunk)
+                for position, value in enumerate(shrunk):
+                    if _reducible(value):
+                        shrunk = self._ddmin(original, shrunk, position, verdict)
+                # Shrinking one argument can unlock further shrinking of another
+                if input_size(shrunk) == before:
+                    break
+        finally:
+            self._close_pool()
+
+        minimal = self._candidate(original, shrunk)
+        if self.reference is not None:
+            try:
+                minimal.expected = getattr(solution, self.reference)(*copy.deepcopy(shrunk))
+            except Exception:
+                minimal.expected = None
+        return Minimization(
+            test_case=minimal,
+            verdict=verdict,
+            original_size=input_size(args),
+            size=input_size(shrunk),
+            checks=self.checks,
+        )
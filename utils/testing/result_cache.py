@@ -0,0 +1,186 @@
+"""
+Result Cache Module
+===================
+
+Content-addressed cache of test results. Results are keyed by a hash of
+the solution's source file, the framework sources under utils/ and the
+runner limits, plus a hash of each test case, so only solution/test pairs
+that actually changed are executed again. Only deterministic verdicts are
+cached; time, memory and runtime failures depend on the machine's load and
+are always executed again.
+"""
+
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.testing.external_data import ExternalRef
+from utils.testing.test_runner import TestResult, Verdict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".dsa_cache" / "results"
+
+# Bump when the cached payload format changes
+CACHE_FORMAT_VERSION = 2
+
+# Verdicts that do not depend on load or timing, so they can be reused
+CACHEABLE_VERDICTS = (Verdict.ACCEPTED, Verdict.WRONG_ANSWER)
+
+_framework_digest: Optional[str] = None
+
+
+def framework_digest() -> str:
+    """Hash of every framework source file under utils/ (computed once)"""
+    global _framework_digest
+    if _framework_digest is None:
+        digest = hashlib.sha256()
+        utils_dir = PROJECT_ROOT / "utils"
+        for path in sorted(utils_dir.rglob("*.py")):
+            digest.update(str(path.relative_to(utils_dir)).encode())
+            digest.update(path.read_bytes())
+        _framework_digest = digest.hexdigest()
+    return _framework_digest
+
+
+# What pickling an object that cannot be pickled raises
+UNPICKLABLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    except UNPICKLABLE_ERRORS:
+        return False
+
+
+class _DigestPickler(pickle.Pickler):
+    """Pickles external inputs by their file's identity, not their path"""
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, ExternalRef):
+            return obj.fingerprint()
+        return None
+
+
+def test_case_digest(test_case: Any) -> str:
+    """Hash of everything about a test case that can affect its result"""
+    payload = (
+        getattr(test_case, "input", None),
+        getattr(test_case, "expected", None),
+        getattr(test_case, "timeout", None),
+        getattr(test_case, "comparator", None),
+    )
+    buffer = io.BytesIO()
+    _DigestPickler(buffer, protocol=4).dump(payload)
+    return hashlib.sha256(buffer.getvalue()).hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of TestResults for unchanged solution/test pairs"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: set = set()
+
+    def solution_key(self, solution: Any, runner: Any) -> Optional[str]:
+        """
+        Key for a solution under a runner configuration
+
+        Returns None when the solution's source cannot be located, in which
+        case nothing is cached.
+        """
+        try:
+            source = Path(inspect.getfile(type(solution))).read_bytes()
+        except (TypeError, OSError):
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(str(CACHE_FORMAT_VERSION).encode())
+        digest.update(type(solution).__qualname__.encode())
+        digest.update(source)
+        digest.update(framework_digest().encode())
+        config = (
+            runner.timeout,
+            runner.memory_limit,
+            runner.isolate,
+            runner.guard_inputs,
+            runner.track_memory,
+        )
+        digest.update(repr(config).encode())
+        return digest.hexdigest()
+
+    def _path(self, solution_key: str) -> Path:
+        return self.cache_dir / f"{solution_key}.pickle"
+
+    def _load(self, solution_key: str) -> Dict[str, Dict[str, Any]]:
+        if solution_key not in self._entries:
+            try:
+                with open(self._path(solution_key), "rb") as f:
+                    self._entries[solution_key] = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+                self._entries[solution_key] = {}
+        return self._entries[solution_key]
+
+    def get(
+        self, solution_key: str, test_case: Any, digest: Optional[str] = None
+    ) -> Optional[TestResult]:
+        """Cached result for a test case (digest: its precomputed test_case_digest)"""
+        entry = self._load(solution_key).get(digest or test_case_digest(test_case))
+        if entry is None:
+            return None
+        return TestResult(test_case=test_case, cached=True, **entry)
+
+    def put(
+        self,
+        solution_key: str,
+        test_case: Any,
+        result: TestResult,
+        digest: Optional[str] = None,
+    ) -> None:
+        """Remember a freshly computed result (written out by save()) if cacheable"""
+        if result.verdict not in CACHEABLE_VERDICTS:
+            return
+        entry = {
+            f.name: getattr(result, f.name)
+            for f in fields(result)
+            if f.name not in ("test_case", "cached")
+        }
+        self._load(solution_key)[digest or test_case_digest(test_case)] = entry
+        self._dirty.add(solution_key)
+
+    def save(self) -> None:
+        """Write updated entries to disk atomically"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for solution_key in self._dirty:
+            entries = self._entries[solution_key]
+            try:
+                payload = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+            except UNPICKLABLE_ERRORS:
+                # Outputs that cannot be pickled are simply not cached
+                for digest in [d for d, entry in entries.items() if not _picklable(entry)]:
+                    del entries[digest]
+                payload = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(solution_key))
+        self._dirty.clear()
+
+    def clear(self) -> int:
+        """Invalidate every cached result; returns the number of files removed"""
+        self._entries.clear()
+        self._dirty.clear()
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pickle"):
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,217 @@
+"""
+Sandbox Module
+==============
+
+Runs a single test case in a child process with hard resource limits,
+the way an online judge does. The child gets RLIMIT_CPU and RLIMIT_AS
+limits and the parent kills it once the wall-clock limit passes, so an
+infinite loop or runaway allocation only costs that one test.
+"""
+
+import math
+import multiprocessing
+import signal
+import sys
+import threading
+import time
+from typing import Any, Optional
+
+import psutil
+
+from utils.testing.test_runner import TestResult, TestRunner, Verdict
+
+try:
+    import resource
+except ImportError:  # Not available on Windows - limits fall back to the wall clock
+    resource = None
+
+# Extra wall-clock time allowed on top of the test's timeout before the child
+# is killed. Covers process start-up so that the in-child timing decides
+# borderline cases.
+WALL_CLOCK_GRACE = 0.5
+
+# How often a cancellable sandbox checks its cancel event
+CANCEL_POLL_INTERVAL = 0.02
+
+
+def get_context() -> multiprocessing.context.BaseContext:
+    """
+    Multiprocessing context for running solutions in child processes
+
+    Prefers fork, so children inherit the already-imported solution (also
+    used by the minimizer's and golden generator's worker pools).
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _apply_limits(cpu_seconds: float, memory_bytes: int) -> None:
+    """Apply CPU-time and address-space limits to the current process"""
+    if resource is None:
+        return
+
+    def set_limit(kind: int, soft: int, hard: int) -> None:
+        _, current_hard = resource.getrlimit(kind)
+        if current_hard != resource.RLIM_INFINITY:
+            soft = min(soft, current_hard)
+            hard = min(hard, current_hard)
+        resource.setrlimit(kind, (soft, hard))
+
+    cpu_soft = max(1, math.ceil(cpu_seconds))
+    set_limit(resource.RLIMIT_CPU, cpu_soft, cpu_soft + 1)
+
+    # RLIMIT_AS covers the whole address space, so allow the interpreter's
+    # current footprint plus the memory limit for the solution itself.
+    address_space = psutil.Process().memory_info().vms + memory_bytes
+    set_limit(resource.RLIMIT_AS, address_space, address_space)
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of the current process in bytes"""
+    current = psutil.Process().memory_info().rss
+    if resource is None:
+        return current
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    # A forked child's high-water mark can start below its inherited RSS
+    return max(peak, current)
+
+
+def _child_main(
+    conn: Any,
+    runner: TestRunner,
+    solution: Any,
+    test_case: Any,
+    cpu_seconds: float,
+) -> None:
+    """Entry point of the sandboxed child process"""
+    _apply_limits(cpu_seconds, runner.memory_limit)
+
+    result = runner.run_single_test(solution, test_case)
+    result.peak_rss = _peak_rss()
+    result.test_case = None  # The parent already has it
+    try:
+        conn.send(result)
+    except Exception:
+        # Output that cannot be pickled is still worth reporting
+        result.actual_output = repr(result.actual_output)
+        conn.send(result)
+    conn.close()
+
+
+def _describe_exit(exitcode: int) -> str:
+    """Human-readable description of a child's exit code"""
+    if exitcode < 0:
+        try:
+            return f"killed by {signal.Signals(-exitcode).name}"
+        except ValueError:
+            return f"killed by signal {-exitcode}"
+    return f"exited with code {exitcode}"
+
+
+def _wait_for_child(conn: Any, until: float, cancel: Optional[threading.Event]) -> bool:
+    """Wait for the child's result until a deadline or cancellation"""
+    if cancel is None:
+        return conn.poll(max(0.0, until - time.time()))
+    while not cancel.is_set():
+        remaining = until - time.time()
+        if remaining <= 0:
+            return False
+        if conn.poll(min(remaining, CANCEL_POLL_INTERVAL)):
+            return True
+    return False
+
+
+def run_isolated(
+    runner: TestRunner,
+    solution: Any,
+    test_case: Any,
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+) -> TestResult:
+    """
+    Run one test case in a resource-limited child process
+
+    Args:
+        runner: TestRunner providing the limits and the verdict logic
+        solution: Object exposing solve()
+        test_case: Test case to run
+        deadline: Absolute time.time() at which the child is killed even if
+            its own limit has not been reached (a run's time budget)
+        cancel: Event that kills the child as soon as it is set
+
+    Returns:
+        TestResult with a judge-style verdict. Tests that had to be killed
+        are reported as TLE (wall-clock or CPU limit) or RE (crash).
+    """
+    timeout = runner.get_timeout(test_case)
+    wall_limit = timeout + WALL_CLOCK_GRACE
+    wait_limit = wall_limit
+    if deadline is not None:
+        wait_limit = max(0.0, min(wall_limit, deadline - time.time()))
+
+    ctx = get_context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_child_main,
+        args=(child_conn, runner, solution, test_case, wall_limit),
+    )
+
+    start_time = time.time()
+    process.start()
+    child_conn.close()  # So recv() sees EOF if the child dies
+
+    result = None
+    try:
+        # poll() also returns when the child exits without sending anything
+        if _wait_for_child(parent_conn, start_time + wait_limit, cancel):
+            try:
+                result = parent_conn.recv()
+            except EOFError:
+                result = None
+    finally:
+        execution_time = time.time() - start_time
+        if process.is_alive():
+            process.kill()
+        process.join()
+        parent_conn.close()
+
+    if result is not None:
+        result.test_case = test_case
+        return result
+
+    expected = getattr(test_case, "expected", None)
+    exitcode = process.exitcode
+    cpu_signals = {-signal.SIGKILL}
+    if hasattr(signal, "SIGXCPU"):
+        cpu_signals.add(-signal.SIGXCPU)
+
+    if cancel is not None and cancel.is_set():
+        verdict = Verdict.TIME_LIMIT_EXCEEDED
+        error_message = f"Cancelled after {execution_time:.3f}s"
+    elif execution_time >= wait_limit and wait_limit < wall_limit:
+        verdict = Verdict.TIME_LIMIT_EXCEEDED
+        error_message = f"Cancelled: run time budget ran out after {execution_time:.3f}s"
+    elif execution_time >= wall_limit:
+        verdict = Verdict.TIME_LIMIT_EXCEEDED
+        error_message = f"Wall-clock limit exceeded: killed after {execution_time:.3f}s"
+    elif exitcode in cpu_signals:
+        verdict = Verdict.TIME_LIMIT_EXCEEDED
+        error_message = f"CPU time limit exceeded: {_describe_exit(exitcode)}"
+    else:
+        verdict = Verdict.RUNTIME_ERROR
+        error_message = f"Sandboxed process {_describe_exit(exitcode)}"
+
+    return TestResult(
+        test_case=test_case,
+        passed=False,
+        actual_output=None,
+        expected_output=expected,
+        execution_time=execution_time,
+        memory_usage=0,
+        error_message=error_message,
+        timeout_occurred=verdict == Verdict.TIME_LIMIT_EXCEEDED,
+        verdict=verdict,
+    )
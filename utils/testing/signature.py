@@ -0,0 +1,212 @@
+"""
+Argument Signature Module
+=========================
+
+Declares solve()'s arguments in a problem's TOML file: the order they are
+passed in and their types. Without a signature, a test case's input
+fields are passed in sorted key order as plain Python values.
+
+    [problem.signature]                 # Arguments in call order
+    nums = "int64[]"
+    target = "int"
+
+Numeric arrays can be decoded into compact buffers instead of lists of
+Python ints (about 36 bytes per element):
+
+    [problem.signature]
+    nums = { type = "int64[]", buffer = "array" }   # array('q'), 8 bytes each
+    heights = { type = "int32[]", buffer = "numpy" }  # numpy.ndarray
+
+Types:
+    int, float, str, bool   - scalars, validated (ints are accepted as floats)
+    any                     - passed unchanged
+    int8 ... int64, uint8 ... uint64, float32, float64
+                            - range-checked numbers
+    <type>[]                - arrays of a type, e.g. str[], int[][] (nested);
+                              only one-dimensional numeric arrays take a buffer
+                              ("list" by default, "array" or "numpy")
+"""
+
+import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from utils.testing.external_data import ExternalRef
+
+SCALAR_TYPES = {"int": int, "float": float, "str": str, "bool": bool}
+
+# array module typecodes of the numeric element types
+NUMERIC_TYPECODES = {
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "float32": "f",
+    "float64": "d",
+}
+
+BUFFERS = ("list", "array", "numpy")
+
+
+def _base_type(type_name: str) -> str:
+    while type_name.endswith("[]"):
+        type_name = type_name[:-2]
+    return type_name
+
+
+def int_bounds(type_name: str) -> Tuple[int, int]:
+    """Half-open value range of a fixed-width integer type"""
+    bits = int(type_name.lstrip("uint"))
+    if type_name.startswith("u"):
+        return 0, 2**bits
+    return -(2 ** (bits - 1)), 2 ** (bits - 1)
+
+
+def is_fixed_int(type_name: str) -> bool:
+    """Whether a type name is a fixed-width integer type, e.g. int32 or uint8"""
+    return type_name in NUMERIC_TYPECODES and not type_name.startswith("float")
+
+
+def _check_scalar(type_name: str, value: Any, name: str) -> Any:
+    if type_name == "any":
+        return value
+    if type_name == "float" or type_name.startswith("float"):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Argument {name!r} expects {type_name}, got {value!r}")
+        return float(value)
+    if type_name == "int" or type_name in NUMERIC_TYPECODES:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"Argument {name!r} expects {type_name}, got {value!r}")
+        if type_name != "int":
+            low, high = int_bounds(type_name)
+            if not low <= value < high:
+                raise ValueError(f"Argument {name!r} value {value} does not fit {type_name}")
+        return value
+    if not isinstance(value, SCALAR_TYPES[type_name]):
+        raise ValueError(f"Argument {name!r} expects {type_name}, got {value!r}")
+    return value
+
+
+def _decode_list(type_name: str, value: Any, name: str) -> Any:
+    if not type_name.endswith("[]"):
+        return _check_scalar(type_name, value, name)
+    if not isinstance(value, list):
+        raise ValueError(f"Argument {name!r} expects {type_name}, got {type(value).__name__}")
+    element = type_name[:-2]
+    if element == "any":
+        return value
+    # Already-valid values are passed on without an element-wise copy
+    if element in ("int", "str") or is_fixed_int(element):
+        kind = str if element == "str" else int
+        if all(type(item) is kind for item in value):
+            if not is_fixed_int(element) or not value:
+                return value
+            low, high = int_bounds(element)
+            if low <= min(value) and max(value) < high:
+                return value
+    return [_decode_list(element, item, name) for item in value]
+
+
+@dataclass(frozen=True)
+class ArgSpec:
+    """Declared name, type and buffer of one solve() argument"""
+
+    name: str
+    type: str
+    buffer: str = "list"
+
+    @classmethod
+    def from_spec(cls, name: str, spec: Any) -> "ArgSpec":
+        """
+        Build an ArgSpec from a signature entry
+
+        Args:
+            name: Argument name
+            spec: A type string, or a table with "type" and optional "buffer"
+
+        Raises:
+            ValueError: For unknown types or buffers, or a buffer on a
+                non-numeric or nested array
+        """
+        if isinstance(spec, dict):
+            arg = cls(name, spec.get("type", "any"), spec.get("buffer", "list"))
+        else:
+            arg = cls(name, spec)
+
+        base = _base_type(arg.type)
+        if base != "any" and base not in SCALAR_TYPES and base not in NUMERIC_TYPECODES:
+            raise ValueError(f"Unknown type {arg.type!r} for argument {name!r}")
+        if arg.buffer not in BUFFERS:
+            raise ValueError(f"Unknown buffer {arg.buffer!r} (expected one of {BUFFERS})")
+        if arg.buffer != "list" and not (
+            arg.type.endswith("[]") and arg.type[:-2] in NUMERIC_TYPECODES
+        ):
+            raise ValueError(
+                f"Argument {name!r}: buffers need a one-dimensional numeric array "
+                f"type such as int64[], not {arg.type!r}"
+            )
+        return arg
+
+    def decode(self, value: Any) -> Any:
+        """Validate a TOML value and convert it to the declared representation"""
+        if isinstance(value, ExternalRef) or self.type == "any":
+            return value  # External arrays are memory-mapped when the test runs
+        if hasattr(value, "tolist"):
+            value = value.tolist()  # e.g. generated NumPy values
+
+        if self.buffer == "list":
+            return _decode_list(self.type, value, self.name)
+        if not isinstance(value, list):
+            raise ValueError(f"Argument {self.name!r} expects {self.type}, got {value!r}")
+        element = self.type[:-2]
+        try:
+            if self.buffer == "array":
+                return array.array(NUMERIC_TYPECODES[element], value)
+            import numpy as np
+
+            return np.array(value, dtype=element)
+        except (OverflowError, TypeError) as e:
+            raise ValueError(f"Argument {self.name!r} does not fit {self.type}: {e}")
+
+
+class Signature:
+    """Ordered, typed arguments of solve() from [problem.signature]"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Args:
+            spec: The [problem.signature] table - argument names, in call
+                order, mapped to a type string or a {type, buffer} table
+        """
+        if not spec:
+            raise ValueError("[problem.signature] needs at least one argument")
+        self.args: List[ArgSpec] = [ArgSpec.from_spec(name, value) for name, value in spec.items()]
+
+    @property
+    def names(self) -> List[str]:
+        return [arg.name for arg in self.args]
+
+    def decode(self, fields: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Arguments for solve() from a test case's input fields
+
+        Raises:
+            ValueError: For fields missing from, or not declared in, the signature
+        """
+        unknown = [name for name in fields if name not in self.names]
+        if unknown:
+            raise ValueError(f"Field(s) {unknown} are not declared in [problem.signature]")
+        missing = [name for name in self.names if name not in fields]
+        if missing:
+            raise ValueError(f"Missing argument(s) {missing} declared in [problem.signature]")
+        return tuple(arg.decode(fields[arg.name]) for arg in self.args)
+
+    def decode_args(self, values: Sequence[Any]) -> Tuple[Any, ...]:
+        """Convert positional arguments (e.g. generated inputs)"""
+        if len(values) != len(self.args):
+            raise ValueError(f"Expected {len(self.args)} arguments, got {len(values)}")
+        return tuple(arg.decode(value) for arg, value in zip(self.args, values))
@@ -6,17 +6,41 @@ Provides comprehensive testing capabilities for DSA solutions
 including timeout detection, memory profiling, and performance analysis.
 """
 
+import copy
+import multiprocessing
 import os
 import subprocess
 import sys
 import time
 import traceback
+import tracemalloc
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import psutil
 
+from utils.testing import events
+from utils.testing.comparators import describe_mismatch, outputs_match
+from utils.testing.external_data import resolve_input
+from utils.testing.input_guard import as_arguments, fresh_arguments, mutated_arguments
+
+
+class RunCancelled(Exception):
+    """Raised inside a run when its time budget is exhausted"""
+
+    pass
+
+
+class Verdict:
+    """Judge-style verdicts reported on every TestResult"""
+
+    ACCEPTED = "AC"
+    WRONG_ANSWER = "WA"
+    TIME_LIMIT_EXCEEDED = "TLE"
+    MEMORY_LIMIT_EXCEEDED = "MLE"
+    RUNTIME_ERROR = "RE"
+
 
 @dataclass
 class TestResult:
@@ -27,82 +51,341 @@ class TestResult:
     actual_output: Any
     expected_output: Any
     execution_time: float
-    memory_usage: float
+    memory_usage: float  # Peak bytes allocated by Python code during solve()
     error_message: str = ""
     timeout_occurred: bool = False
+    verdict: str = Verdict.ACCEPTED
+    cached: bool = False  # Reused from the result cache instead of executed
+    baseline_rss: float = 0  # Interpreter RSS before solve(), in bytes
+    peak_rss: float = 0  # Peak RSS of the sandboxed child (isolated runs only)
+    input_mutated: bool = False  # solve() modified (its copy of) the input
+
+
+# How often a parallel run checks for pool workers that died or hung mid-test
+WORKER_POLL_INTERVAL = 0.1
+
+# Extra wall-clock seconds past a test's limit before its pool worker is
+# considered hung, killed and the test counted as a timeout
+WORKER_HANG_GRACE = 1.0
+
+# Per-process state for pool workers, set once by init_worker so that the
+# solution is pickled per worker rather than per test case.
+_worker_runner: Optional["TestRunner"] = None
+_worker_solution: Any = None
+_worker_started: Any = None
+
+
+def init_worker(runner: "TestRunner", solution: Any, started: Any = None) -> None:
+    """
+    Pool initializer - keep the runner and solution for this worker
+
+    Args:
+        started: Optional queue told (index, worker pid) as each test starts
+    """
+    global _worker_runner, _worker_solution, _worker_started
+    _worker_runner = runner
+    _worker_solution = solution
+    _worker_started = started
+
+
+def run_in_worker(task: Tuple[int, Any]) -> Tuple[int, TestResult]:
+    """Run one (index, test case) task inside a pool worker"""
+    index, test_case = task
+    if _worker_started is not None:
+        _worker_started.put((index, os.getpid()))
+    return index, _worker_runner.run_single_test(_worker_solution, test_case)
+
+
+def worker_died_result(test_case: Any, exitcode: Optional[int]) -> TestResult:
+    """Runtime error result of a test whose worker process died running it"""
+    return TestResult(
+        test_case=test_case,
+        passed=False,
+        actual_output=None,
+        expected_output=getattr(test_case, "expected", None),
+        execution_time=0,
+        memory_usage=0,
+        error_message=f"Worker process died (exit code {exitcode})",
+        verdict=Verdict.RUNTIME_ERROR,
+    )
+
+
+class PoolWatch:
+    """
+    Finds tests lost by the workers of a multiprocessing.Pool running
+    run_in_worker: a worker that dies never returns its result, and an
+    in-process test cannot be interrupted. Pass `started` to init_worker
+    and call watch() as soon as the pool is created.
+    """
+
+    def __init__(self, runner: "TestRunner", report_starts: bool = False):
+        """
+        Args:
+            runner: Runner whose limits decide when a busy worker is hung
+            report_starts: Keep the indices of started tests for started_tests()
+        """
+        self.runner = runner
+        self.started = multiprocessing.SimpleQueue()
+        self.report_starts = report_starts
+        self._running: Dict[int, Tuple[int, float]] = {}  # Worker pid -> (index, start)
+        self._processes: Dict[int, Any] = {}  # Worker pid -> its process
+        self._new_starts: List[int] = []
+
+    def watch(self) -> None:
+        """Remember the pool's workers while they are alive (for exit codes)"""
+        for process in multiprocessing.active_children():
+            self._processes.setdefault(process.pid, process)
+
+    def _update(self) -> None:
+        while not self.started.empty():
+            index, pid = self.started.get()
+            self._running[pid] = (index, time.monotonic())
+            if self.report_starts:
+                self._new_starts.append(index)
+        self.watch()
+
+    def started_tests(self) -> List[int]:
+        """Indices of the tests workers started since the last call"""
+        self._update()
+        started, self._new_starts = self._new_starts, []
+        return started
+
+    def finished(self, index: int) -> None:
+        """Forget a test whose result arrived"""
+        self._update()
+        self._running = {pid: run for pid, run in self._running.items() if run[0] != index}
+
+    def lost(self, test_cases: Any) -> List[Tuple[int, TestResult]]:
+        """
+        (index, result) of every running test whose worker died (a runtime
+        error) or is still busy well past the test's limit (a timeout; the
+        worker is killed and the pool replaces it)
+
+        Args:
+            test_cases: Test cases by index (a sequence or a dict)
+        """
+        self._update()
+        lost = []
+        for pid, (index, start) in list(self._running.items()):
+            test_case = test_cases[index]
+            # Workers that exited before watch() saw them have no process
+            process = self._processes.get(pid)
+            if process is None or not process.is_alive():
+                exitcode = process.exitcode if process is not None else None
+                result = worker_died_result(test_case, exitcode)
+            else:
+                timeout = self.runner.get_timeout(test_case)
+                # A tracked test runs solve() a second time to trace memory
+                limit = timeout * (2 if self.runner.track_memory else 1) + WORKER_HANG_GRACE
+                elapsed = time.monotonic() - start
+                if elapsed <= limit:
+                    continue
+                process.kill()
+                result = TestResult(
+                    test_case=test_case,
+                    passed=False,
+                    actual_output=None,
+                    expected_output=getattr(test_case, "expected", None),
+                    execution_time=elapsed,
+                    memory_usage=0,
+                    error_message=f"Timeout exceeded: worker killed after {elapsed:.3f}s",
+                    timeout_occurred=True,
+                    verdict=Verdict.TIME_LIMIT_EXCEEDED,
+                )
+            del self._running[pid]
+            self._processes.pop(pid, None)
+            lost.append((index, result))
+        return lost
+
+
+class _Subset:
+    """Lazy view of selected items of a sequence (keeps streamed cases lazy)"""
+
+    def __init__(self, items: Any, indices: List[int]):
+        self.items = items
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, position: int) -> Any:
+        return self.items[self.indices[position]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.items[index] for index in self.indices)
 
 
 class TestRunner:
     """Comprehensive test runner with performance analysis"""
 
-    def __init__(self, timeout: float = 5.0, memory_limit: int = 512):  # MB
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        memory_limit: int = 512,  # MB
+        workers: int = 1,
+        isolate: bool = False,
+        output: str = "text",
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        event_stream: Optional[IO[str]] = None,
+        cache: Any = None,
+        history: Any = None,
+        max_failures: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        track_memory: bool = False,
+        retain_inputs: bool = True,
+        guard_inputs: bool = True,
+    ):
         self.timeout = timeout
         self.memory_limit = memory_limit * 1024 * 1024  # Convert to bytes
+        self.workers = workers  # <= 0 means one worker per CPU
+        self.isolate = isolate  # Run each test in a resource-limited child process
+        self.output = output  # "text" for humans, "ndjson" for one JSON event per line
+        self.on_event = on_event  # Called with every event as it happens
+        self.event_stream = event_stream  # NDJSON destination (defaults to sys.stdout)
+        self.cache = cache  # Optional ResultCache for unchanged solution/test pairs
+        self.history = history  # Optional TimingHistory used to schedule parallel runs
+        self.max_failures = max_failures  # Stop the run after this many failures
+        self.time_budget = time_budget  # Stop the run after this many seconds
+        self.stop_reason: Optional[str] = None  # Why the last run stopped early
+        # Measure each test's peak memory in an extra tracemalloc run; in-process
+        # runs only enforce memory_limit when this is on (isolated runs always do)
+        self.track_memory = track_memory
+        self.retain_inputs = retain_inputs  # False drops inputs from finished results
+        self.guard_inputs = guard_inputs  # Pass solve() copies and flag mutation
         self.results: List[TestResult] = []
+        self._pool = None  # Warm worker pool, kept across runs in isolated mode
 
     @contextmanager
-    def resource_monitor(self):
-        """Context manager to monitor resource usage"""
-        process = psutil.Process()
-        start_memory = process.memory_info().rss
-        start_time = time.time()
+    def resource_monitor(self, trace_memory: bool = False):
+        """
+        Context manager to monitor resource usage
+
+        Sets last_execution_time, last_memory_usage and last_baseline_rss
+        (interpreter RSS before the block), also when the block raises.
+
+        Args:
+            trace_memory: Record the peak bytes allocated by Python code
+                inside the block with tracemalloc. Tracing slows the block
+                down many times over, so its last_execution_time must not
+                be used as a timing (last_memory_usage is 0 without it).
+        """
+        self.last_baseline_rss = psutil.Process().memory_info().rss
+        tracing = trace_memory
+        started_tracing = tracing and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif tracing and hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            # Someone else is tracing - measure our peak on top of theirs
+            tracemalloc.reset_peak()
+        start_traced = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start_time = time.perf_counter()
 
         try:
             yield
         finally:
-            end_time = time.time()
-            end_memory = process.memory_info().rss
-            self.last_execution_time = end_time - start_time
-            self.last_memory_usage = end_memory - start_memory
+            self.last_execution_time = time.perf_counter() - start_time
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+                self.last_memory_usage = max(0, peak - start_traced)
+            else:
+                self.last_memory_usage = 0
+
+    def get_timeout(self, test_case: Any) -> float:
+        """Time limit for a test case, falling back to the runner default"""
+        return getattr(test_case, "timeout", self.timeout)
 
     def run_single_test(self, solution: Any, test_case: Any) -> TestResult:
         """Run a single test case with monitoring"""
-        start_time = time.time()
         actual_output = None
         error_message = ""
         timeout_occurred = False
-        memory_usage = 0
+        memory_exceeded = False
+        runtime_error = False
+        test_input = args = None
+        # Stay 0 if preparing the input fails before the monitor is entered
+        self.last_execution_time = 0.0
+        self.last_baseline_rss = 0
+
+        # Set up timeout
+        timeout = self.get_timeout(test_case)
 
         try:
+            # Memory-map externally stored inputs outside the timed region
+            test_input = resolve_input(getattr(test_case, "input", None))
+            # Copy mutable arguments before timing starts, so every run of
+            # a test case sees the same input
+            if self.guard_inputs:
+                args = fresh_arguments(test_input)
+            else:
+                args = as_arguments(test_input)
             with self.resource_monitor():
-                # Set up timeout
-                if hasattr(test_case, "timeout"):
-                    timeout = test_case.timeout
-                else:
-                    timeout = self.timeout
-
                 # Run the solution
                 if hasattr(test_case, "input"):
-                    if isinstance(test_case.input, (list, tuple)):
-                        actual_output = solution.solve(*test_case.input)
-                    else:
-                        actual_output = solution.solve(test_case.input)
+                    actual_output = solution.solve(*args)
                 else:
                     actual_output = solution.solve()
 
-                execution_time = time.time() - start_time
-                memory_usage = getattr(self, "last_memory_usage", 0)
-
-                # Check timeout
-                if execution_time > timeout:
-                    timeout_occurred = True
-                    error_message = f"Timeout exceeded: {execution_time:.3f}s > {timeout}s"
-
-                # Check memory limit
-                if memory_usage > self.memory_limit:
-                    error_message += f" Memory limit exceeded: {memory_usage / 1024 / 1024:.2f}MB"
-
+        except MemoryError:
+            memory_exceeded = True
+            error_message = "Memory limit exceeded: MemoryError raised"
+        except SystemExit as e:
+            # sys.exit() in a solution must not end the run or its pool worker
+            runtime_error = True
+            error_message = f"SystemExit: {e.code}"
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_message = str(e)
+            runtime_error = True
+            error_message = str(e) or type(e).__name__
             traceback.print_exc()
 
-        # Determine if test passed
+        execution_time = self.last_execution_time
+        baseline_rss = self.last_baseline_rss
+
+        input_mutated = False
+        if self.guard_inputs and args is not None and hasattr(test_case, "input"):
+            input_mutated = bool(mutated_arguments(as_arguments(test_input), args))
+
+        # Peak memory comes from a second, traced run: the timed run above is
+        # never traced, so tracing cannot inflate a timing or cause a TLE
+        memory_usage = 0
+        if self.track_memory and not error_message and execution_time <= timeout:
+            memory_usage = self._traced_peak_memory(solution, test_case, test_input)
+
+        if not error_message:
+            # Check timeout
+            if execution_time > timeout:
+                timeout_occurred = True
+                error_message = f"Timeout exceeded: {execution_time:.3f}s > {timeout}s"
+
+            # Check memory limit
+            if memory_usage > self.memory_limit:
+                memory_exceeded = True
+                error_message += f" Memory limit exceeded: {memory_usage / 1024 / 1024:.2f}MB"
+
+        # Determine if test passed (without an expected output only
+        # crashes and limits can fail it)
         expected = getattr(test_case, "expected", None)
-        passed = not timeout_occurred and not error_message and actual_output == expected
+        comparator = getattr(test_case, "comparator", None)
+        passed = (
+            not timeout_occurred
+            and not error_message
+            and (expected is None or outputs_match(comparator, actual_output, expected))
+        )
 
         if not passed and not error_message and expected is not None:
-            error_message = f"Expected: {expected}, Got: {actual_output}"
+            error_message = describe_mismatch(actual_output, expected, comparator)
+
+        if passed:
+            verdict = Verdict.ACCEPTED
+        elif timeout_occurred:
+            verdict = Verdict.TIME_LIMIT_EXCEEDED
+        elif memory_exceeded:
+            verdict = Verdict.MEMORY_LIMIT_EXCEEDED
+        elif runtime_error:
+            verdict = Verdict.RUNTIME_ERROR
+        else:
+            verdict = Verdict.WRONG_ANSWER
 
         return TestResult(
             test_case=test_case,
@@ -113,59 +396,396 @@ class TestRunner:
             memory_usage=memory_usage,
             error_message=error_message,
             timeout_occurred=timeout_occurred,
+            verdict=verdict,
+            baseline_rss=baseline_rss,
+            input_mutated=input_mutated,
         )
 
-    def run_tests(self, solution: Any, test_cases: List[Any]) -> List[TestResult]:
-        """Run all test cases and return results"""
-        print(f"Running {len(test_cases)} test cases...")
-        print("-" * 50)
-
+    def _traced_peak_memory(self, solution: Any, test_case: Any, test_input: Any) -> float:
+        """Peak bytes allocated by a tracemalloc-traced solve() call on a fresh copy"""
+        args = fresh_arguments(test_input)
+        try:
+            with self.resource_monitor(trace_memory=True):
+                if hasattr(test_case, "input"):
+                    solution.solve(*args)
+                else:
+                    solution.solve()
+        except Exception:
+            pass  # A MemoryError still leaves the peak it reached
+        return self.last_memory_usage
+
+    def run_single_test_isolated(
+        self,
+        solution: Any,
+        test_case: Any,
+        deadline: Optional[float] = None,
+        cancel: Any = None,
+    ) -> TestResult:
+        """Run a single test case in a sandboxed child process"""
+        from utils.testing.sandbox import run_isolated
+
+        return run_isolated(self, solution, test_case, deadline, cancel)
+
+    def get_warm_pool(self, solution: Any, workers: int) -> Any:
+        """Return the persistent warm worker pool, (re)starting it if needed"""
+        from utils.testing.worker_pool import WarmWorkerPool
+
+        if self._pool is None or not self._pool.matches(self, solution, workers):
+            self.close()
+            self._pool = WarmWorkerPool(self, solution, workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the warm worker pool, if any"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _resolve_workers(self, workers: Optional[int], test_count: int) -> int:
+        """Number of worker processes to use for a run"""
+        if workers is None:
+            workers = self.workers
+        if workers is None or workers <= 0:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, test_count))
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Seconds left until the run's deadline (None without a budget)"""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.time())
+
+    def _iter_results(
+        self,
+        solution: Any,
+        test_cases: Sequence[Any],
+        workers: int,
+        order: Optional[List[int]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Optional[TestResult]]]:
+        """
+        Run tests, yielding (index, None) when a test starts and
+        (index, result) when it finishes. Finishes arrive in completion
+        order, which only differs from test case order in parallel runs.
+        In parallel runs a test starts when a worker picks it up, in the
+        given dispatch order. A test whose worker process dies while
+        running it finishes as a runtime error.
+
+        Stops (raising RunCancelled) once the deadline passes. Closing the
+        generator early terminates in-flight work: pool workers are killed
+        and sandboxed children with them. In-process serial tests cannot be
+        interrupted, so there the deadline is only checked between tests.
+        """
+        if workers == 1:
+            for index, test_case in enumerate(test_cases):
+                if deadline is not None and time.time() >= deadline:
+                    raise RunCancelled("time budget exhausted")
+                yield index, None
+                if self.isolate:
+                    result = self.run_single_test_isolated(solution, test_case, deadline)
+                else:
+                    result = self.run_single_test(solution, test_case)
+                if deadline is not None and time.time() >= deadline and not result.passed:
+                    # Most likely killed by the budget rather than its own limit
+                    raise RunCancelled("time budget exhausted")
+                yield index, result
+            return
+
+        if order is None:
+            order = list(range(len(test_cases)))
+
+        if self.isolate:
+            pool = self.get_warm_pool(solution, workers)
+            yield from pool.run_unordered(test_cases, order=order, deadline=deadline)
+            if deadline is not None and time.time() >= deadline:
+                raise RunCancelled("time budget exhausted")
+            return
+
+        # Workers report each test they start, so a test whose worker dies
+        # (os._exit, a segfault, the OOM killer) or hangs is reported, not waited on
+        watch = PoolWatch(self, report_starts=True)
+        with multiprocessing.Pool(
+            processes=workers, initializer=init_worker, initargs=(self, solution, watch.started)
+        ) as pool:
+            watch.watch()
+            # Leaving this block terminates the pool, killing in-flight tests
+            # Workers take tasks in submission order; chunksize=1 keeps the
+            # dispatch order intact and balances uneven tests
+            # Tasks are decoded as the pool consumes them, so streamed test
+            # cases are not all held in memory at once
+            tasks = ((index, test_cases[index]) for index in order)
+            results = pool.imap_unordered(run_in_worker, tasks, chunksize=1)
+            lost: set = set()
+            remaining = len(order)
+            while remaining:
+                timeout = WORKER_POLL_INTERVAL
+                if deadline is not None:
+                    timeout = min(timeout, self._remaining(deadline))
+                try:
+                    index, result = results.next(timeout=timeout)
+                except multiprocessing.TimeoutError:
+                    if deadline is not None and time.time() >= deadline:
+                        raise RunCancelled("time budget exhausted")
+                    lost_results = watch.lost(test_cases)
+                    for started in watch.started_tests():
+                        yield started, None
+                    for index, result in lost_results:
+                        lost.add(index)
+                        remaining -= 1
+                        yield index, result
+                    continue
+                if index in lost:
+                    # Sent just before its hung worker was killed
+                    continue
+                # A test's start is reported before its result is sent
+                for started in watch.started_tests():
+                    yield started, None
+                watch.finished(index)
+                remaining -= 1
+                yield index, result
+
+    def _stop_reason(self, failures: int, deadline: Optional[float]) -> Optional[str]:
+        """Why the run should stop now, if it should"""
+        if self.max_failures and failures >= self.max_failures:
+            return f"{failures} failure(s) reached the limit of {self.max_failures}"
+        if deadline is not None and time.time() >= deadline:
+            return "time budget exhausted"
+        return None
+
+    def _run_events(
+        self, solution: Any, test_cases: Sequence[Any], workers: Optional[int]
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[TestResult]]]:
+        """Drive a run, yielding (event, result) pairs and filling self.results"""
+        start_time = time.time()
+        deadline = start_time + self.time_budget if self.time_budget else None
         self.results = []
-
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"Test {i}: {getattr(test_case, 'description', 'No description')}")
-
-            result = self.run_single_test(solution, test_case)
-            self.results.append(result)
-
-            # Print result
-            if result.passed:
-                print(
-                    f"  ✓ PASSED ({result.execution_time:.3f}s, "
-                    f"{result.memory_usage / 1024 / 1024:.2f}MB)"
-                )
+        self.stop_reason = None
+        finished: Dict[int, TestResult] = {}
+
+        # Cached results are reported straight away; only misses are executed
+        cache_key = self.cache.solution_key(solution, self) if self.cache else None
+        history_key = self.history.problem_key(solution) if self.history else None
+        from utils.testing.result_cache import test_case_digest
+
+        # Each test case is hashed once, for both the cache and the history
+        digests: List[Optional[str]] = []
+        pending: List[int] = []
+        for index, test_case in enumerate(test_cases):
+            digests.append(test_case_digest(test_case) if cache_key or history_key else None)
+            cached = self.cache.get(cache_key, test_case, digests[index]) if cache_key else None
+            if cached is None:
+                pending.append(index)
             else:
+                finished[index] = self._release_input(cached)
+
+        workers = self._resolve_workers(workers, len(pending))
+        yield events.run_start_event(len(test_cases), workers), None
+
+        failures = 0
+        for index in sorted(finished):
+            failures += not finished[index].passed
+            yield events.test_start_event(index, test_cases[index]), None
+            yield events.test_finish_event(index, finished[index]), finished[index]
+        self.stop_reason = self._stop_reason(failures, deadline)
+
+        # Longest expected tests first, so slow ones do not finish last
+        # (only parallel runs dispatch in a chosen order)
+        to_run = _Subset(test_cases, pending)
+        order = None
+        if history_key and workers > 1:
+            order = self.history.schedule(history_key, to_run, [digests[i] for i in pending])
+
+        results = self._iter_results(solution, to_run, workers, order, deadline)
+        try:
+            while self.stop_reason is None:
+                try:
+                    sub_index, result = next(results)
+                except StopIteration:
+                    break
+                except RunCancelled as e:
+                    self.stop_reason = str(e)
+                    break
+
+                index = pending[sub_index]
+                if result is None:
+                    yield events.test_start_event(index, test_cases[index]), None
+                    continue
+
+                test_case = result.test_case
+                finished[index] = self._release_input(result)
+                failures += not result.passed
+                if cache_key:
+                    self.cache.put(cache_key, test_case, result, digests[index])
+                if history_key:
+                    self.history.record(
+                        history_key, test_case, result.execution_time, digests[index]
+                    )
+                yield events.test_finish_event(index, result), result
+                self.stop_reason = self._stop_reason(failures, deadline)
+        finally:
+            # Cancels queued and in-flight tests if the run stopped early
+            results.close()
+
+        if cache_key:
+            self.cache.save()
+        if history_key:
+            self.history.save()
+
+        self.results = [finished[index] for index in sorted(finished)]
+        yield events.run_finish_event(
+            self.results,
+            time.time() - start_time,
+            not_run=len(test_cases) - len(self.results),
+            stop_reason=self.stop_reason,
+        ), None
+
+    def _release_input(self, result: TestResult) -> TestResult:
+        """Drop the input from a finished result unless inputs are retained"""
+        if not self.retain_inputs and hasattr(result.test_case, "input"):
+            result.test_case = copy.copy(result.test_case)
+            result.test_case.input = None
+        return result
+
+    def iter_events(
+        self, solution: Any, test_cases: Sequence[Any], workers: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run all test cases, yielding events as they happen
+
+        Events are JSON-serializable dicts (see utils.testing.events).
+        self.results holds the results in test case order once the
+        iterator is exhausted.
+        """
+        for event, _ in self._run_events(solution, test_cases, workers):
+            yield event
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """Send an event to the on_event callback and/or the NDJSON stream"""
+        if self.on_event is not None:
+            self.on_event(event)
+        if self.output == "ndjson":
+            events.write_event(event, self.event_stream or sys.stdout)
+
+    def _print_result(self, number: int, result: TestResult) -> None:
+        """Print the human-readable outcome of one test"""
+        test_case = result.test_case
+        print(f"Test {number}: {getattr(test_case, 'description', 'No description')}")
+
+        usage = f"{result.execution_time:.3f}s"
+        if result.memory_usage:
+            usage += f", {result.memory_usage / 1024 / 1024:.2f}MB peak"
+        if result.peak_rss:
+            usage += (
+                f", RSS {result.peak_rss / 1024 / 1024:.1f}MB peak"
+                f" / {result.baseline_rss / 1024 / 1024:.1f}MB baseline"
+            )
+        if result.cached:
+            usage += ", cached"
+
+        if result.passed:
+            print(f"  ✓ PASSED ({usage})")
+        else:
+            print(f"  ✗ FAILED [{result.verdict}] ({usage})")
+            if result.error_message:
+                print(f"    Error: {result.error_message}")
+            if result.timeout_occurred:
                 print(
-                    f"  ✗ FAILED ({result.execution_time:.3f}s, "
-                    f"{result.memory_usage / 1024 / 1024:.2f}MB)"
+                    f"    Timeout: {result.execution_time:.3f}s > "
+                    f"{getattr(test_case, 'timeout', self.timeout)}s"
                 )
-                if result.error_message:
-                    print(f"    Error: {result.error_message}")
-                if result.timeout_occurred:
-                    print(
-                        f"    Timeout: {result.execution_time:.3f}s > "
-                        f"{getattr(test_case, 'timeout', self.timeout)}s"
-                    )
+        if result.input_mutated:
+            print("    ⚠️ solve() modified its input (each run gets a fresh copy)")
 
-            print()
+        print()
 
-        # Summary
+    def _print_summary(self, test_count: int) -> None:
+        """Print pass/fail totals and the list of failed tests"""
         passed_count = sum(1 for r in self.results if r.passed)
         total_count = len(self.results)
         print(f"Results: {passed_count}/{total_count} tests passed")
 
+        if self.stop_reason:
+            print(
+                f"⏹ Stopped early ({self.stop_reason}): "
+                f"{test_count - total_count} test(s) not run"
+            )
+
+        mutated_count = sum(1 for r in self.results if r.input_mutated)
+        if mutated_count:
+            print(f"⚠️ solve() modified its input in {mutated_count} test(s)")
+
         if passed_count < total_count:
             print("\nFailed tests:")
             for i, result in enumerate(self.results, 1):
                 if not result.passed:
                     print(
-                        f"  {i}. " f"{getattr(result.test_case, 'description', 'No description')}"
+                        f"  {i}. [{result.verdict}] "
+                        f"{getattr(result.test_case, 'description', 'No description')}"
                     )
                     if result.error_message:
                         print(f"     {result.error_message}")
 
+    def run_tests(
+        self, solution: Any, test_cases: Sequence[Any], workers: Optional[int] = None
+    ) -> List[TestResult]:
+        """
+        Run all test cases and return results
+
+        Args:
+            solution: Object exposing solve()
+            test_cases: Test cases to run - any sequence, including a lazily
+                decoded TestCaseStream
+            workers: Worker processes to fan out over (defaults to self.workers,
+                <= 0 means one per CPU). Each test is still timed individually
+                inside its worker, so timings match the serial path.
+
+        Every event is passed to emit() as it happens; human-readable text
+        is printed in test case order unless output is "ndjson".
+        """
+        text = self.output == "text"
+        if text:
+            print(f"Running {len(test_cases)} test cases...")
+
+        finished: Dict[int, TestResult] = {}
+        next_index = 0
+        for event, result in self._run_events(solution, test_cases, workers):
+            self.emit(event)
+            if not text:
+                continue
+            if event["event"] == "run_start":
+                if event["workers"] > 1:
+                    print(f"Using {event['workers']} worker processes")
+                print("-" * 50)
+            if result is None:
+                continue
+
+            # Print in test case order even when tests finish out of order
+            finished[event["index"]] = result
+            while next_index in finished:
+                self._print_result(next_index + 1, finished.pop(next_index))
+                next_index += 1
+
+        if text:
+            # Runs that stopped early can leave gaps in the order
+            for index in sorted(finished):
+                self._print_result(index + 1, finished[index])
+            self._print_summary(len(test_cases))
+
         return self.results
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the configuration - results stay in the parent process"""
+        state = self.__dict__.copy()
+        state["results"] = []
+        state["_pool"] = None
+        # Events are only emitted by the parent process
+        state["on_event"] = None
+        state["event_stream"] = None
+        state["cache"] = None
+        state["history"] = None
+        return state
+
     def get_performance_summary(self) -> Dict[str, float]:
         """Get performance summary statistics"""
         if not self.results:
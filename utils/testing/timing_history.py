@@ -0,0 +1,96 @@
+"""
+Timing History Module
+=====================
+
+Records how long each test case took in previous runs and uses that to
+schedule parallel runs longest-expected-first (LPT scheduling), so a few
+slow cases dispatched last no longer dominate the total wall time.
+"""
+
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.testing.result_cache import PROJECT_ROOT, test_case_digest
+
+DEFAULT_HISTORY_PATH = PROJECT_ROOT / ".dsa_cache" / "timings.json"
+
+# Weight of the newest measurement in the moving average
+SMOOTHING = 0.5
+
+
+class TimingHistory:
+    """Per-test durations from previous runs, stored as JSON"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else DEFAULT_HISTORY_PATH
+        self._timings: Optional[Dict[str, Dict[str, float]]] = None
+        self._dirty = False
+
+    @property
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        if self._timings is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._timings = json.load(f)
+            except (OSError, ValueError):
+                self._timings = {}
+        return self._timings
+
+    def problem_key(self, solution: Any) -> str:
+        """Stable key for a solution - survives edits to its source"""
+        solution_class = type(solution)
+        # Scripts all run as __main__, so prefer the file they live in
+        try:
+            location = os.path.relpath(inspect.getfile(solution_class), PROJECT_ROOT)
+        except TypeError:
+            location = solution_class.__module__
+        return f"{location}:{solution_class.__qualname__}"
+
+    def expected(self, key: str, test_case: Any, digest: Optional[str] = None) -> Optional[float]:
+        """Expected duration of a test case, or None if it never ran"""
+        return self.timings.get(key, {}).get(digest or test_case_digest(test_case))
+
+    def record(
+        self, key: str, test_case: Any, duration: float, digest: Optional[str] = None
+    ) -> None:
+        """Fold a new measurement into the moving average"""
+        problem_timings = self.timings.setdefault(key, {})
+        digest = digest or test_case_digest(test_case)
+        previous = problem_timings.get(digest)
+        if previous is not None:
+            duration = SMOOTHING * duration + (1 - SMOOTHING) * previous
+        problem_timings[digest] = duration
+        self._dirty = True
+
+    def schedule(
+        self, key: str, test_cases: Sequence[Any], digests: Optional[List[str]] = None
+    ) -> List[int]:
+        """
+        Indices of test cases in longest-expected-first order
+
+        Tests without history are assumed to be the slowest and go first;
+        ties keep their original order. digests are the test cases'
+        precomputed test_case_digest values, if the caller has them.
+        """
+        if digests is None:
+            digests = [test_case_digest(test_case) for test_case in test_cases]
+        expected = [self.expected(key, None, digest) for digest in digests]
+        return sorted(
+            range(len(test_cases)),
+            key=lambda i: float("-inf") if expected[i] is None else -expected[i],
+        )
+
+    def save(self) -> None:
+        """Write the history to disk atomically"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.timings, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
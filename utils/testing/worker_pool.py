@@ -0,0 +1,206 @@
+"""
+Warm Worker Pool Module
+=======================
+
+Keeps a set of long-lived worker processes that have already imported the
+framework and the solution module. For every test a worker forks a fresh
+sandboxed child (see sandbox.run_isolated), so each test is still fully
+isolated while the per-test cost drops to a fork.
+"""
+
+import atexit
+import multiprocessing
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from utils.testing.sandbox import run_isolated
+from utils.testing.test_runner import TestResult, TestRunner, worker_died_result
+
+# Imported once in the fork server so every worker starts warm. The solution
+# script itself is loaded by each worker as its __main__.
+PRELOAD_MODULES = [
+    "utils.base_solution",
+    "utils.testing.test_runner",
+    "utils.testing.sandbox",
+]
+
+
+def _get_context() -> multiprocessing.context.BaseContext:
+    """Prefer a fork server preloaded with the framework"""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(PRELOAD_MODULES)
+        return ctx
+    return multiprocessing.get_context()
+
+
+def _exit_on_terminate(signum, frame):
+    # Raising unwinds run_isolated, whose cleanup kills the sandboxed child
+    sys.exit(1)
+
+
+def _worker_main(conn: Any, runner: TestRunner, solution: Any) -> None:
+    """Worker loop - run each received test case in a forked sandbox"""
+    signal.signal(signal.SIGTERM, _exit_on_terminate)
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+
+        index, test_case = message
+        result = run_isolated(runner, solution, test_case)
+        result.test_case = None  # The parent already has it
+        conn.send((index, result))
+    conn.close()
+
+
+class WarmWorkerPool:
+    """Persistent pool of pre-warmed worker processes"""
+
+    def __init__(self, runner: TestRunner, solution: Any, workers: int):
+        self.runner = runner
+        self.solution = solution
+        self.workers = workers
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._connections: List[Any] = []
+
+        self._ctx = _get_context()
+        for _ in range(workers):
+            process, conn = self._start_worker()
+            self._processes.append(process)
+            self._connections.append(conn)
+
+        atexit.register(self.close)
+
+    def _start_worker(self) -> Tuple[multiprocessing.process.BaseProcess, Any]:
+        """Start one worker process and return it with its connection"""
+        parent_conn, child_conn = self._ctx.Pipe()
+        # Not a daemon: workers fork their own sandboxed children
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, self.runner, self.solution)
+        )
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def matches(self, runner: TestRunner, solution: Any, workers: int) -> bool:
+        """Whether this pool can serve a run with the given configuration"""
+        return (
+            self.runner is runner
+            and self.solution is solution
+            and self.workers == workers
+            and len(self._processes) == workers
+            and all(process.is_alive() for process in self._processes)
+        )
+
+    def run_unordered(
+        self,
+        test_cases: Sequence[Any],
+        order: Optional[Iterable[int]] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Optional[TestResult]]]:
+        """
+        Run test cases, yielding (index, None) when a test is handed to a
+        worker and (index, result) when it completes
+
+        Args:
+            test_cases: Test cases to run
+            order: Indices in dispatch order (defaults to the natural order)
+            deadline: Absolute time.time() after which nothing more is
+                dispatched and in-flight tests are cancelled
+
+        A worker that dies mid-test (e.g. killed from outside) is replaced
+        and its test reported as a runtime error.
+
+        Closing the generator early also cancels in-flight tests. Workers
+        running them are terminated (killing their sandboxes), so the pool
+        is restarted on its next use.
+        """
+        pending = list(order) if order is not None else list(range(len(test_cases)))
+        pending.reverse()  # Pop from the end in dispatch order
+        idle = list(self._connections)
+        busy: Dict[Any, Tuple[int, Any]] = {}
+
+        try:
+            while pending or busy:
+                while pending and idle:
+                    conn = idle.pop()
+                    index = pending.pop()
+                    test_case = test_cases[index]
+                    conn.send((index, test_case))
+                    busy[conn] = (index, test_case)
+                    yield index, None
+
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                ready = wait(list(busy), timeout=timeout)
+                if not ready:
+                    return  # Deadline reached
+
+                for conn in ready:
+                    index, test_case = busy.pop(conn)
+                    try:
+                        _, result = conn.recv()
+                        result.test_case = test_case
+                    except (EOFError, ConnectionResetError):
+                        # The worker died mid-test: report it and replace the worker
+                        result = self._worker_died(conn, test_case)
+                        conn = self._respawn(conn)
+                    idle.append(conn)
+                    yield index, result
+        finally:
+            if busy:
+                self._cancel(list(busy))
+
+    def _stop_worker(self, position: int) -> None:
+        """Terminate the worker at a position and close its connection"""
+        process = self._processes[position]
+        process.terminate()
+        process.join(timeout=1.0)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        self._connections[position].close()
+
+    def _cancel(self, connections: List[Any]) -> None:
+        """Terminate the workers behind the given connections"""
+        for conn in connections:
+            position = self._connections.index(conn)
+            self._stop_worker(position)
+            del self._connections[position]
+            del self._processes[position]
+
+    def _respawn(self, conn: Any) -> Any:
+        """Replace the (dead) worker behind a connection, returning the new connection"""
+        position = self._connections.index(conn)
+        self._stop_worker(position)
+        self._processes[position], self._connections[position] = self._start_worker()
+        return self._connections[position]
+
+    def _worker_died(self, conn: Any, test_case: Any) -> TestResult:
+        """Runtime error result of a test whose worker died while running it"""
+        process = self._processes[self._connections.index(conn)]
+        process.join(timeout=1.0)
+        return worker_died_result(test_case, process.exitcode)
+
+    def close(self) -> None:
+        """Stop all workers"""
+        for conn in self._connections:
+            try:
+                conn.send(None)
+                conn.close()
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._connections = []
+        self._processes = []
+        atexit.unregister(self.close)